@@ -0,0 +1,292 @@
+import glob
+import os
+import struct
+import sys
+import time
+import zlib
+
+import numpy as np
+
+from question_db import LEVELS
+from question_index import key_hash
+
+# ------------------------------------------------
+# CEVAP ANALİTİĞİ (SÜTUNLU KAYIT)
+# ------------------------------------------------
+# Her cevap olayı (soru, seviye, mod, oyuncu, cevap süresi, doğru/yanlış, kullanılan
+# jokerler, penaltı sonucu) önceden ayrılmış NumPy sütunlarına yazılır; oyun
+# döngüsünde olay başına liste/sözlük oluşturulmaz. Sütunlar bloklar halinde
+# zlib ile sıkıştırılıp aylık dosyalara eklenir (dosya çok büyürse yeni parça açılır).
+#
+# Dosya biçimi: art arda çerçeveler
+#   başlık  "<4sII": b"MQA1", satır sayısı, sıkıştırılmış uzunluk
+#   gövde   zlib(sütun_1 baytları + sütun_2 baytları + ...)   (COLUMNS sırasıyla)
+#
+# Okuma: python analytics.py [data/analytics] [--since 2026-01-01] [--bench]
+
+MAGIC = b"MQA1"
+_HEADER = struct.Struct("<4sII")
+
+COLUMNS = (
+    ("time", np.float64),       # olay zamanı (epoch saniye)
+    ("session", np.uint32),     # oyun oturumu numarası
+    ("question", np.uint64),    # soru kimliği: normalize metnin 8 baytlık özeti (key_hash)
+    ("level", np.uint8),        # LEVELS içindeki sıra
+    ("mode", np.uint8),         # MODES içindeki sıra
+    ("player", np.uint8),       # PLAYERS içindeki sıra
+    ("response_ms", np.uint32), # soru gösterilmesinden cevaba kadar geçen süre
+    ("correct", np.uint8),
+    ("powerups", np.uint8),     # POWERUP_BITS bit maskesi
+    ("penalty", np.int8),       # PENALTY_NONE / PENALTY_SAVED / PENALTY_GOAL
+)
+
+MODES = ("MCQ", "Classic")
+PLAYERS = ("single", "p1", "p2")
+POWERUP_BITS = {"extra": 1, "skip": 2, "hint": 4}
+PENALTY_NONE, PENALTY_SAVED, PENALTY_GOAL = -1, 0, 1
+
+BLOCK_ROWS = 4096
+MAX_FILE_BYTES = 16 * 1024 * 1024
+DEFAULT_DIR = "data/analytics"
+
+
+def question_id(text):
+    """Soru metninin kayıtlarda kullanılan kimliği (yazım farklarından etkilenmez)."""
+    return key_hash(text)
+
+
+class AnswerLog:
+    """Cevap olaylarını sütun tamponlarında biriktirip bloklar halinde diske yazar."""
+
+    def __init__(self, directory=DEFAULT_DIR, block_rows=BLOCK_ROWS):
+        self.directory = directory
+        self.block_rows = block_rows
+        self.columns = {name: np.zeros(block_rows, dtype=dtype) for name, dtype in COLUMNS}
+        self.rows = 0           # tamponda bekleyen satır sayısı
+        self.flushed = 0        # dosyaya yazılmış toplam satır sayısı
+        self.session = 0
+
+    def new_session(self):
+        self.session = int.from_bytes(os.urandom(4), "little")
+        return self.session
+
+    def record(self, question, level, mode, player, response_s, correct, powerups=0, penalty=PENALTY_NONE):
+        """Bir cevap olayını tampona yazar ve satır numarasını döndürür (bkz. set_penalty).
+
+        Tampon dolu ise önce diske aktarılır; böylece son yazılan satırlar bir
+        sonraki olaya kadar tamponda kalır ve penaltı sonucu sonradan eklenebilir.
+        """
+        if self.rows == self.block_rows:
+            self.flush()
+        i = self.rows
+        c = self.columns
+        c["time"][i] = time.time()
+        c["session"][i] = self.session
+        c["question"][i] = question
+        c["level"][i] = LEVELS.index(level) if level in LEVELS else 255
+        c["mode"][i] = MODES.index(mode) if mode in MODES else 255
+        c["player"][i] = PLAYERS.index(player)
+        c["response_ms"][i] = max(0, int(response_s * 1000))
+        c["correct"][i] = correct
+        c["powerups"][i] = powerups
+        c["penalty"][i] = penalty
+        self.rows = i + 1
+        return self.flushed + i
+
+    def set_penalty(self, row, outcome):
+        """Daha önce kaydedilen satıra penaltı sonucunu yazar (satır henüz tampondaysa)."""
+        i = row - self.flushed
+        if 0 <= i < self.rows:
+            self.columns["penalty"][i] = outcome
+
+    def path_for(self, when=None):
+        """Bu ayın dosyası; MAX_FILE_BYTES aşılmışsa sıradaki parça."""
+        month = time.strftime("%Y-%m", time.localtime(when))
+        part = 0
+        while True:
+            suffix = f".{part}" if part else ""
+            path = os.path.join(self.directory, f"answers-{month}{suffix}.mqa")
+            if not os.path.exists(path) or os.path.getsize(path) < MAX_FILE_BYTES:
+                return path
+            part += 1
+
+    def flush(self):
+        """Tampondaki satırları sıkıştırılmış tek bir çerçeve olarak dosyaya ekler."""
+        n = self.rows
+        if not n:
+            return 0
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            append_block(self.path_for(), self.columns, n)
+        except OSError as e:
+            print(f"❌ Analitik kaydı yazılamadı: {e}")
+            return 0
+        self.rows = 0
+        self.flushed += n
+        return n
+
+
+def append_block(path, columns, rows):
+    """{sütun: dizi} sözlüğünün ilk `rows` satırını dosyaya tek bir çerçeve olarak ekler."""
+    body = zlib.compress(b"".join(np.ascontiguousarray(columns[name][:rows], dtype=dtype).tobytes() for name, dtype in COLUMNS), 6)
+    with open(path, "ab") as f:
+        f.write(_HEADER.pack(MAGIC, rows, len(body)) + body)
+
+
+# ------------------------------------------------
+# OKUMA VE TOPLULAŞTIRMA
+# ------------------------------------------------
+def read_blocks(path):
+    """Dosyadaki her çerçeveyi {sütun: dizi} olarak döndürür. Yarım kalmış son çerçeve atlanır."""
+    with open(path, "rb") as f:
+        data = f.read()
+    offset = 0
+    while offset + _HEADER.size <= len(data):
+        magic, rows, length = _HEADER.unpack_from(data, offset)
+        offset += _HEADER.size
+        if magic != MAGIC or offset + length > len(data):
+            break
+        raw = zlib.decompress(data[offset:offset + length])
+        offset += length
+        block, pos = {}, 0
+        for name, dtype in COLUMNS:
+            size = rows * np.dtype(dtype).itemsize
+            block[name] = np.frombuffer(raw, dtype=dtype, count=rows, offset=pos)
+            pos += size
+        yield block
+
+
+def log_paths(directory=DEFAULT_DIR):
+    return sorted(glob.glob(os.path.join(directory, "answers-*.mqa")))
+
+
+def iter_blocks(directory=DEFAULT_DIR):
+    """Dizindeki tüm çerçeveleri dosya sırasıyla, tek tek okur (bellekte tek blok tutulur)."""
+    for path in log_paths(directory):
+        yield from read_blocks(path)
+
+
+def load(directory=DEFAULT_DIR, since=None, until=None):
+    """Dizindeki tüm kayıtları tek bir {sütun: dizi} sözlüğünde birleştirir.
+
+    `since` / `until` epoch saniye olarak verilirse zaman aralığı dışındaki satırlar atılır.
+    """
+    blocks = list(iter_blocks(directory))
+    if not blocks:
+        return {name: np.zeros(0, dtype=dtype) for name, dtype in COLUMNS}
+    cols = {name: np.concatenate([b[name] for b in blocks]) for name, _ in COLUMNS}
+    keep = np.ones(len(cols["time"]), dtype=bool)
+    if since is not None:
+        keep &= cols["time"] >= since
+    if until is not None:
+        keep &= cols["time"] < until
+    if not keep.all():
+        cols = {name: col[keep] for name, col in cols.items()}
+    return cols
+
+
+def level_summary(cols):
+    """Seviye başına (cevap sayısı, doğruluk oranı, medyan cevap süresi sn)."""
+    result = {}
+    for code, level in enumerate(LEVELS):
+        mask = cols["level"] == code
+        n = int(mask.sum())
+        if n:
+            result[level] = (n, float(cols["correct"][mask].mean()), float(np.median(cols["response_ms"][mask])) / 1000)
+    return result
+
+
+def question_stats(cols, min_answers=1):
+    """Soru başına istatistikler: (soru kimlikleri, cevap sayısı, doğruluk, ortalama süre sn).
+
+    Doğruluğa göre artan sıralıdır; yani en zor sorular başta gelir.
+    """
+    ids, inverse = np.unique(cols["question"], return_inverse=True)
+    counts = np.bincount(inverse)
+    correct = np.bincount(inverse, weights=cols["correct"]) / counts
+    mean_s = np.bincount(inverse, weights=cols["response_ms"]) / counts / 1000
+    keep = counts >= min_answers
+    order = np.argsort(correct[keep], kind="stable")
+    return ids[keep][order], counts[keep][order], correct[keep][order], mean_s[keep][order]
+
+
+def powerup_usage(cols):
+    """Her jokerin kullanıldığı cevap oranı."""
+    n = max(1, len(cols["powerups"]))
+    return {name: float(np.count_nonzero(cols["powerups"] & bit)) / n for name, bit in POWERUP_BITS.items()}
+
+
+def penalty_summary(cols):
+    """Penaltıya giden cevaplarda kurtarış / gol sayıları."""
+    p = cols["penalty"]
+    return {"kurtarış": int(np.count_nonzero(p == PENALTY_SAVED)), "gol": int(np.count_nonzero(p == PENALTY_GOAL))}
+
+
+def question_texts(path="data/questions.json"):
+    """Soru kimliği -> metin eşlemesi (rapor için)."""
+    import json
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {question_id(q["q"]): q["q"] for questions in data.values() for q in questions}
+
+
+def report(cols, texts=None, top=10):
+    print(f"{len(cols['time'])} cevap, {len(np.unique(cols['session']))} oturum")
+    for level, (n, acc, median_s) in level_summary(cols).items():
+        print(f"  {level:>6}: {n} cevap, doğruluk %{acc * 100:.1f}, medyan süre {median_s:.1f} sn")
+    print("Joker kullanımı:", {k: f"%{v * 100:.1f}" for k, v in powerup_usage(cols).items()})
+    print("Penaltılar:", penalty_summary(cols))
+    ids, counts, correct, mean_s = question_stats(cols, min_answers=3)
+    if len(ids):
+        print(f"En zor {min(top, len(ids))} soru (en az 3 cevap):")
+        for qid, n, acc, s in zip(ids[:top], counts[:top], correct[:top], mean_s[:top]):
+            text = (texts or {}).get(int(qid), f"#{int(qid):016x}")
+            print(f"  %{acc * 100:5.1f}  {n:>5} cevap  {s:5.1f} sn  {text}")
+
+
+# ------------------------------------------------
+# BENCHMARK
+# ------------------------------------------------
+def benchmark(events=1_000_000):
+    """Olay başına kayıt maliyetini ve okuma/toplulaştırma hızını ölçer."""
+    import shutil
+    import tempfile
+
+    directory = tempfile.mkdtemp()
+    try:
+        log = AnswerLog(directory)
+        log.new_session()
+        qids = [question_id(f"{i} + {i} = ?") for i in range(500)]
+        t = time.perf_counter()
+        for i in range(events):
+            log.record(qids[i % 500], LEVELS[i % 3], "MCQ", "single", (i % 30) * 0.7, i % 3 != 0, i & 7)
+        log.flush()
+        elapsed = time.perf_counter() - t
+        size = sum(os.path.getsize(p) for p in glob.glob(os.path.join(directory, "*.mqa")))
+        print(f"{events} olay: {elapsed / events * 1e6:.2f} µs/olay, dosya {size / events:.1f} bayt/olay")
+
+        t = time.perf_counter()
+        cols = load(directory)
+        question_stats(cols)
+        level_summary(cols)
+        print(f"Okuma + toplulaştırma: {(time.perf_counter() - t) * 1000:.0f} ms")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if "--bench" in args:
+        benchmark()
+        sys.exit()
+    since = None
+    if "--since" in args:
+        i = args.index("--since")
+        since = time.mktime(time.strptime(args[i + 1], "%Y-%m-%d"))
+        del args[i:i + 2]
+    columns = load(args[0] if args else DEFAULT_DIR, since=since)
+    try:
+        texts = question_texts()
+    except (OSError, ValueError):
+        texts = None
+    report(columns, texts)
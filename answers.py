@@ -0,0 +1,120 @@
+import re
+import sys
+import time
+from fractions import Fraction
+from functools import lru_cache
+
+# ------------------------------------------------
+# CEVAP NORMALİZASYONU
+# ------------------------------------------------
+# Oyun (Utils.normalize_answer) ve çevrimdışı araçlar (soru paketi vb.) aynı
+# kuralları kullansın diye pygame'den bağımsız tutulur.
+
+# Ham metin başına ayrıştırılmış biçimler bu kadar girişe kadar önbellekte tutulur
+CANONICAL_CACHE_SIZE = 4096
+
+# Üssü büyük sayılar (ör. 9^999999) ayrıştırmayı kilitlemesin
+MAX_EXPONENT = 64
+
+_SUPERSCRIPTS = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹⁻", "0123456789-")
+_SUPERSCRIPT_RUN = re.compile(r"[⁰¹²³⁴⁵⁶⁷⁸⁹⁻]+")
+
+_NUMBER = r"[+-]?(?:\d+(?:[.,]\d*)?|[.,]\d+)"
+_MIXED = re.compile(r"^([+-]?)(\d+)\s+(\d+)\s*/\s*(\d+)$")
+_FRACTION = re.compile(rf"^({_NUMBER})/({_NUMBER})$")
+_POWER = re.compile(rf"^({_NUMBER})\^\(?([+-]?\d+)\)?$")
+_PERCENT = re.compile(rf"^%({_NUMBER})$|^({_NUMBER})%$")
+_PLAIN = re.compile(rf"^{_NUMBER}$")
+
+
+def turkish_lower(s: str) -> str:
+    """Türkçe büyük I/İ harflerini doğru küçülten lower()."""
+    return s.replace("I", "ı").replace("İ", "i").lower()
+
+
+def expand_superscripts(s: str) -> str:
+    """Üst simge rakamları üs gösterimine çevirir: "x²" -> "x^2"."""
+    return _SUPERSCRIPT_RUN.sub(lambda m: "^" + m.group().translate(_SUPERSCRIPTS), s)
+
+
+def normalize_answer(s: str) -> str:
+    if not s: return ""
+    return expand_superscripts(turkish_lower(s.strip()).replace(" ", ""))
+
+
+def _number(text):
+    """"3", "-0,5", ",5", "2." gibi ondalıkları kesin kesre çevirir."""
+    return Fraction(text.replace(",", "."))
+
+
+@lru_cache(maxsize=CANONICAL_CACHE_SIZE)
+def canonical_answer(raw: str):
+    """Cevabın karşılaştırılabilir kanonik biçimi.
+
+    Sayısal cevaplar (tam sayı, virgüllü/noktalı ondalık, kesir, tam sayılı kesir,
+    yüzde, tam sayı üslü kuvvet) kesin bir Fraction'a çevrilir; böylece "0.5",
+    "1/2", ",5" ve "%50" aynı cevaptır. Sayı olmayan cevaplar normalize edilmiş
+    metin olarak döner. Sonuçlar ham metin anahtarıyla LRU önbellekte tutulur.
+    """
+    if not raw:
+        return ""
+    text = raw.strip()
+
+    m = _MIXED.match(text)
+    if m:
+        sign, whole, num, den = m.groups()
+        if int(den):
+            value = int(whole) + Fraction(int(num), int(den))
+            return -value if sign == "-" else value
+
+    s = normalize_answer(text)
+    try:
+        if _PLAIN.match(s):
+            return _number(s)
+        m = _FRACTION.match(s)
+        if m:
+            return _number(m.group(1)) / _number(m.group(2))
+        m = _PERCENT.match(s)
+        if m:
+            return _number(m.group(1) or m.group(2)) / 100
+        m = _POWER.match(s)
+        if m and abs(int(m.group(2))) <= MAX_EXPONENT:
+            return _number(m.group(1)) ** int(m.group(2))
+    except (ValueError, ZeroDivisionError):
+        pass
+    return s
+
+
+def answers_equal(given: str, expected: str) -> bool:
+    """İki cevap kanonik biçimde aynıysa True."""
+    return canonical_answer(str(given)) == canonical_answer(str(expected))
+
+
+# ------------------------------------------------
+# BENCHMARK
+# ------------------------------------------------
+def benchmark(repeat=200_000):
+    """Önbellek isabetinin (aynı ham metin) maliyetini ölçer; hedef < 1 µs."""
+    samples = ["0.5", "1/2", ",5", "%50", "1 1/2", "2^10", "x²+C", "IŞIK"]
+    canonical_answer.cache_clear()
+
+    t = time.perf_counter()
+    for s in samples:
+        canonical_answer(s)
+    miss_us = (time.perf_counter() - t) / len(samples) * 1e6
+
+    t = time.perf_counter()
+    for _ in range(repeat // len(samples)):
+        for s in samples:
+            canonical_answer(s)
+    hit_us = (time.perf_counter() - t) / (repeat // len(samples) * len(samples)) * 1e6
+
+    for s in samples:
+        print(f"  {s!r:>10} -> {canonical_answer(s)!r}")
+    print(f"İlk ayrıştırma (miss): {miss_us:.2f} µs | önbellek isabeti (hit): {hit_us:.3f} µs")
+    print(canonical_answer.cache_info())
+
+
+if __name__ == "__main__":
+    # Kullanım: python answers.py [tekrar]
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
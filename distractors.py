@@ -0,0 +1,397 @@
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+
+import numpy as np
+
+from answers import canonical_answer
+
+# ------------------------------------------------
+# ÇELDİRİCİ (DISTRACTOR) MOTORU
+# ------------------------------------------------
+# MCQ yanlış seçenekleri, cevabın türüne göre (tam sayı, ondalık, kesir, üs,
+# ifade) tipik öğrenci hatalarından üretilir: işaret hatası, bir fazla/eksik,
+# işlem karıştırma, üs kayması, ondalık virgül kayması vb.
+#
+# Sayısal türler bir seviyenin tamamı için NumPy dizileriyle tek seferde işlenir.
+# Çevrimdışı modda (python distractors.py) seçenekler bankaya "mcq_opts" olarak
+# yazılır ve oyun bunları doğrudan kullanır.
+
+OPTION_COUNT = 4
+DISTRACTOR_COUNT = OPTION_COUNT - 1
+
+SUPERSCRIPTS = str.maketrans({"²": "^2", "³": "^3", "⁴": "^4"})
+
+_INTEGER = re.compile(r"^-?\d+$")
+_DECIMAL = re.compile(r"^-?\d+[.,]\d+$")
+_FRACTION = re.compile(r"^(-?\d+)/(\d+)$")
+_POWER = re.compile(r"^(-?\d+|[a-z])\^(\d+)$")
+
+# Soru metninden işlenenleri çıkarmak için ("6 x 7 = ?", "3² = ?", "√16 = ?")
+_Q_BINOP = re.compile(r"(\d+)\s*([+\-x×*/÷:])\s*(\d+)\s*=")
+_Q_POWER = re.compile(r"(\d+)\^(\d+)\s*=")
+_Q_SQRT = re.compile(r"√\s*(\d+)")
+
+
+def _clean(answer):
+    return str(answer).strip().translate(SUPERSCRIPTS).replace(" ", "")
+
+
+def classify_answer(answer):
+    """Cevabın türünü döndürür: integer, decimal, fraction, power veya expression."""
+    a = _clean(answer)
+    if _INTEGER.match(a):
+        return "integer"
+    if _DECIMAL.match(a):
+        return "decimal"
+    if _FRACTION.match(a):
+        return "fraction"
+    if _POWER.match(a):
+        return "power"
+    return "expression"
+
+
+# ------------------------------------------------
+# ORTAK SEÇİCİ
+# ------------------------------------------------
+def _pick(keys, valid, weights, rng, k=DISTRACTOR_COUNT):
+    """Her satırdan birbirinden farklı k geçerli aday seçer (ağırlıklı rastgele öncelik).
+
+    keys: (N, M) aday değerleri (eşit değer = aynı aday), valid: (N, M) maske,
+    weights: (M,) hata modeli ağırlıkları. (N, k) sütun indeksleri ve geçerlilik döner.
+    """
+    # Satır içi tekrarları ele: sıralayıp bir öncekine eşit olanları işaretle
+    order = np.argsort(keys, axis=1, kind="stable")
+    sorted_keys = np.take_along_axis(keys, order, axis=1)
+    dup_sorted = np.zeros(keys.shape, dtype=bool)
+    dup_sorted[:, 1:] = sorted_keys[:, 1:] == sorted_keys[:, :-1]
+    dup = np.empty_like(dup_sorted)
+    np.put_along_axis(dup, order, dup_sorted, axis=1)
+    valid = valid & ~dup
+
+    # Efraimidis–Spirakis: u^(1/w) en büyük olanlar ağırlıkla orantılı seçilir
+    priority = rng.random(keys.shape) ** (1.0 / np.asarray(weights, dtype=float))
+    priority = np.where(valid, priority, -1.0)
+    chosen = np.argsort(-priority, axis=1)[:, :k]
+    return chosen, np.take_along_axis(valid, chosen, axis=1)
+
+
+def _parse_question_operands(questions, idx):
+    """Soru metinlerinden (a, op, b) ile üs/karekök işlenenlerini diziler halinde çıkarır."""
+    n = len(idx)
+    a = np.zeros(n, dtype=np.int64)
+    b = np.zeros(n, dtype=np.int64)
+    op = np.full(n, "", dtype=object)
+    for row, i in enumerate(idx):
+        text = (questions[i] or "").translate(SUPERSCRIPTS)
+        m = _Q_BINOP.search(text)
+        if m:
+            a[row], op[row], b[row] = int(m.group(1)), m.group(2), int(m.group(3))
+            continue
+        m = _Q_POWER.search(text)
+        if m:
+            a[row], op[row], b[row] = int(m.group(1)), "^", int(m.group(2))
+            continue
+        m = _Q_SQRT.search(text)
+        if m:
+            a[row], op[row] = int(m.group(1)), "√"
+    return a, op, b
+
+
+def _reverse_digits(v):
+    x = np.abs(v)
+    r = np.zeros_like(x)
+    while np.any(x > 0):
+        r = np.where(x > 0, r * 10 + x % 10, r)
+        x = x // 10
+    return np.sign(v) * r
+
+
+# ------------------------------------------------
+# TÜRE GÖRE HATA MODELLERİ
+# ------------------------------------------------
+def _integer_distractors(answers, questions, idx, rng):
+    v = np.array([int(_clean(answers[i])) for i in idx], dtype=np.int64)
+    a, op, b = _parse_question_operands(questions, idx)
+    is_add = op == "+"
+    is_sub = op == "-"
+    is_mul = np.isin(op, ["x", "×", "*"])
+    is_div = np.isin(op, ["/", "÷", ":"])
+    is_pow = op == "^"
+    is_sqrt = op == "√"
+    binop = is_add | is_sub | is_mul | is_div
+    safe_b = np.where(b == 0, 1, b)
+
+    models = [
+        # (aday dizisi, ağırlık)
+        (v + 1, 2.0), (v - 1, 2.0),                             # bir fazla / eksik
+        (v + 2, 1.0), (v - 2, 1.0),
+        (v + 10, 1.0), (v - 10, 1.0),                           # onlar basamağı hatası
+        (-v, 0.7),                                              # işaret hatası
+        (_reverse_digits(v), 1.5),                              # basamak yer değiştirme
+        (v * 2, 0.8), (np.where(v % 2 == 0, v // 2, v + 3), 0.8),
+        # İşlem karıştırma: aynı işlenenlerle başka bir işlemin sonucu
+        (np.where(binop & ~is_add, a + b, v), 3.0),
+        (np.where(binop & ~is_sub, a - b, v), 2.0),
+        (np.where(binop & ~is_mul, a * b, v), 3.0),
+        (np.where(binop & ~is_div & (b != 0), a // safe_b, v), 2.0),
+        # Üs kayması: 3² -> 3*2, 3³, 2³
+        (np.where(is_pow, a * b, v), 3.0),
+        (np.where(is_pow, np.minimum(a, 100) ** np.minimum(b + 1, 8), v), 2.0),
+        (np.where(is_pow, np.minimum(b, 100) ** np.minimum(a, 8), v), 2.0),
+        # Karekök: √16 -> 8 (yarısı), 16
+        (np.where(is_sqrt, a // 2, v), 3.0),
+        (np.where(is_sqrt, a, v), 1.0),
+    ]
+    cand = np.stack([m for m, _ in models], axis=1)
+    weights = [w for _, w in models]
+
+    valid = cand != v[:, None]
+    # Pozitif cevaplarda negatif adaylar (işaret hatası hariç) elenir
+    sign_col = 6
+    negative = (cand < 0) & (v[:, None] >= 0)
+    negative[:, sign_col] = False
+    valid &= ~negative
+
+    chosen, ok = _pick(cand, valid, weights, rng)
+    picked = np.take_along_axis(cand, chosen, axis=1)
+    return {i: [str(x) for x, good in zip(picked[row], ok[row]) if good] for row, i in enumerate(idx)}
+
+
+def _decimal_distractors(answers, idx, rng):
+    cleaned = [_clean(answers[i]) for i in idx]
+    seps = ["," if "," in c else "." for c in cleaned]
+    places = np.array([len(re.split(r"[.,]", c)[1]) for c in cleaned], dtype=np.int64)
+    # Bir basamak fazla hassasiyetle tam sayı birimlerine çevir (ondalık kaymaları tam kalsın)
+    scale = 10 ** (places + 1)
+    u = np.array([round(float(c.replace(",", ".")) * s) for c, s in zip(cleaned, scale)], dtype=np.int64)
+    step = 10  # Son basamakta bir birim
+    models = [
+        (u + step, 2.0), (u - step, 2.0),                       # son basamak bir fazla / eksik
+        (u + scale, 1.5), (u - scale, 1.5),                     # tam kısım bir fazla / eksik
+        (u * 10, 2.0), (u // 10, 2.0),                          # ondalık virgül kayması
+        (-u, 0.7),                                              # işaret hatası
+    ]
+    cand = np.stack([m for m, _ in models], axis=1)
+    weights = [w for _, w in models]
+    valid = (cand != u[:, None]) & ((cand >= 0) | (u[:, None] < 0) | (np.arange(len(models)) == 6))
+    chosen, ok = _pick(cand, valid, weights, rng)
+    picked = np.take_along_axis(cand, chosen, axis=1)
+
+    result = {}
+    for row, i in enumerate(idx):
+        digits = int(places[row]) + 1
+        opts = []
+        for x, good in zip(picked[row], ok[row]):
+            if good:
+                text = f"{x / scale[row]:.{digits}f}".rstrip("0").rstrip(".")
+                opts.append(text.replace(".", seps[row]))
+        result[i] = opts
+    return result
+
+
+def _fraction_distractors(answers, idx, rng):
+    pq = np.array([[int(g) for g in _FRACTION.match(_clean(answers[i])).groups()] for i in idx], dtype=np.int64)
+    p, q = pq[:, 0], pq[:, 1]
+    models = [
+        ((q, p), 2.5),                                          # ters çevirme
+        ((p + 1, q), 1.5), ((p, q + 1), 1.5),                   # pay / payda bir fazla
+        ((np.maximum(p - 1, 1), q), 1.0), ((p, np.maximum(q - 1, 1)), 1.0),
+        ((p, q * 2), 1.0),                                      # yarıya bölme hatası
+        ((p + q, q), 1.0),                                      # tam kısmı ekleme
+        ((-p, q), 0.7),                                         # işaret hatası
+    ]
+    num = np.stack([m[0] for m, _ in models], axis=1)
+    den = np.stack([m[1] for m, _ in models], axis=1)
+    weights = [w for _, w in models]
+
+    den_safe = np.where(den == 0, 1, den)
+    g = np.gcd(num, den_safe)
+    g = np.where(g == 0, 1, g)
+    rn, rd = num // g, den_safe // g
+    keys = rn * (1 << 32) + rd
+    valid = (den != 0) & (num * q[:, None] != p[:, None] * den)
+    chosen, ok = _pick(keys, valid, weights, rng)
+    pn = np.take_along_axis(num, chosen, axis=1)
+    pd = np.take_along_axis(den, chosen, axis=1)
+    return {
+        i: [(f"{n}" if d == 1 else f"{n}/{d}") for n, d, good in zip(pn[row], pd[row], ok[row]) if good]
+        for row, i in enumerate(idx)
+    }
+
+
+def _power_candidates(answer):
+    base, exp = _POWER.match(_clean(answer)).groups()
+    e = int(exp)
+    cands = [f"{base}^{e + 1}", f"{base}^{max(e - 1, 1)}" if e > 2 else base]
+    if base.lstrip("-").isdigit():
+        b = int(base)
+        cands += [str(b * e), f"{e}^{b}", f"{base}^{e + 2}"]  # üs yerine çarpma, taban/üs karıştırma
+    else:
+        cands += [f"{e}{base}", f"{e}{base}^{e - 1}" if e > 2 else f"{e}{base}"]
+    return cands
+
+
+_TRIG_SWAPS = (("sin", "cos"), ("cos", "sin"), ("tan", "cot"), ("cot", "tan"), ("ln", "log"), ("e^x", "x"))
+
+# Baştaki katsayı ("20x^3", "-x", "πr^2", "2√5"); üsteki rakamlar katsayı değildir
+_COEFFICIENT = re.compile(r"^(-?)(\d+(?=√)|\d*(?=[a-zπ(]))")
+_LEADING_CONSTANT = re.compile(r"^(-?)(\d+)(?=[+\-])")
+_EXPONENT = re.compile(r"\^(\d+)")
+_ROOT = re.compile(r"√(\d+)")
+# Tek harfli değişken (fonksiyon adının parçası değil): "i", "a*b", "cos x", "1/x"
+_VARIABLE = re.compile(r"(?<![a-z])([a-zπ])(?![a-z])")
+# Tek bir kesir: pay ve paydada toplama / çıkarma yok
+_SINGLE_FRACTION = re.compile(r"^([^/+\-]+)/([^/+\-]+)$")
+
+
+def _simplify(expr):
+    """Yazım farklarını giderir: "x^1" -> "x", "1x" -> "x", boşluklar atılır."""
+    s = _clean(expr).lower()
+    s = re.sub(r"\^1(?!\d)", "", s)
+    return re.sub(r"(^|[+\-*/(])1(?=[a-zπ√(])", r"\1", s)
+
+
+def _expression_candidates(answer):
+    a = str(answer).strip()
+    c = a.translate(SUPERSCRIPTS)
+    cands = []
+    # İşaret hatası
+    cands.append(c[1:] if c.startswith("-") else "-" + c)
+    # Baştaki katsayı bir fazla / eksik; katsayı 1 ise yazılmaz
+    m = _COEFFICIENT.match(c) or _LEADING_CONSTANT.match(c)
+    if m:
+        sign, digits, rest = m.group(1), m.group(2), c[m.end():]
+        n = int(digits) if digits else 1
+        cands.append(f"{sign}{n + 1}{rest}")
+        if n > 1:
+            cands.append(f"{sign}{n - 1 if n > 2 else ''}{rest}")
+    # Kök içindeki sayı bir fazla / eksik
+    m = _ROOT.search(c)
+    if m:
+        n = int(m.group(1))
+        cands.append(c[:m.start()] + f"√{n + 1}" + c[m.end():])
+        if n > 2:
+            cands.append(c[:m.start()] + f"√{n - 1}" + c[m.end():])
+    # Üs kayması (ilk ^n); üssü olmayan ifadede değişkenin karesi
+    m = _EXPONENT.search(c)
+    if m:
+        n = int(m.group(1))
+        cands.append(c[:m.start()] + f"^{n + 1}" + c[m.end():])
+        if n > 1:
+            cands.append(c[:m.start()] + (f"^{n - 1}" if n > 2 else "") + c[m.end():])
+    elif "^" not in c:
+        m = _VARIABLE.search(c)
+        if m:
+            cands.append(c[:m.end()] + "^2" + c[m.end():])
+    # Çarpma yerine toplama
+    if "*" in c:
+        cands.append(c.replace("*", "+", 1))
+        cands.append(c.replace("*", "+"))
+    # İşlem karıştırma (baştaki işaret hariç ilk + / -)
+    m = re.search(r"(?<=.)[+\-]", c)
+    if m:
+        swapped = "-" if m.group() == "+" else "+"
+        cands.append(c[:m.start()] + swapped + c[m.end():])
+    # Kesri ters çevirme; pay 1 ise sadece payda kalır
+    m = _SINGLE_FRACTION.match(c)
+    if m:
+        num, den = m.groups()
+        cands.append(den if num == "1" else f"{den}/{num}")
+    # Trigonometrik / logaritmik karıştırma
+    for old, new in _TRIG_SWAPS:
+        if old in c:
+            cands.append(c.replace(old, new, 1))
+            break
+    return cands
+
+
+def _candidate_key(answer):
+    """Değerce / sadeleşmiş yazımca aynı cevaplar için ortak anahtar."""
+    value = canonical_answer(answer)
+    return _simplify(answer) if isinstance(value, str) else value
+
+
+def _string_distractors(answers, idx, rng, kind):
+    result = {}
+    for i in idx:
+        # "2^4" için "16" ya da "4^2", "πr^2" için "πr^2" yazımları da doğrudur; bunlar elenir
+        seen = {_candidate_key(answers[i])}
+        cands = _power_candidates(answers[i]) if kind == "power" else _expression_candidates(answers[i])
+        unique = []
+        for cand in cands:
+            key = _candidate_key(cand)
+            if key not in seen:
+                seen.add(key)
+                unique.append(cand)
+        order = rng.permutation(len(unique))
+        result[i] = [unique[j] for j in order[:DISTRACTOR_COUNT]]
+    return result
+
+
+# ------------------------------------------------
+# TOPLU (BATCH) ÜRETİM
+# ------------------------------------------------
+def generate_options(answers, questions=None, seed=None):
+    """Tüm cevaplar için karıştırılmış OPTION_COUNT'lık seçenek listeleri üretir.
+
+    Cevaplar türlerine göre gruplanır; sayısal gruplar tek NumPy geçişinde işlenir.
+    Doğru cevap her listede özgün yazımıyla yer alır.
+    """
+    rng = np.random.default_rng(seed)
+    answers = [str(a) for a in answers]
+    questions = questions if questions is not None else [""] * len(answers)
+
+    groups = defaultdict(list)
+    for i, a in enumerate(answers):
+        groups[classify_answer(a)].append(i)
+
+    distractors = {}
+    if groups["integer"]:
+        distractors.update(_integer_distractors(answers, questions, groups["integer"], rng))
+    if groups["decimal"]:
+        distractors.update(_decimal_distractors(answers, groups["decimal"], rng))
+    if groups["fraction"]:
+        distractors.update(_fraction_distractors(answers, groups["fraction"], rng))
+    for kind in ("power", "expression"):
+        if groups[kind]:
+            distractors.update(_string_distractors(answers, groups[kind], rng, kind))
+
+    positions = np.argsort(rng.random((len(answers), OPTION_COUNT)), axis=1)
+    options = []
+    for i, correct in enumerate(answers):
+        row = [correct] + distractors.get(i, [])[:DISTRACTOR_COUNT]
+        # Yeterli model adayı yoksa (çok kısa ifadeler) eski etiketli doldurma yöntemi
+        while len(row) < OPTION_COUNT:
+            row.append(f"{correct} ({len(row)})")
+        options.append([row[j] for j in positions[i]])
+    return options
+
+
+def precompute_bank(path, seed=0):
+    """Bankadaki her soru için seçenekleri üretip "mcq_opts" olarak kaydeder (atomik yazım)."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    total = 0
+    for level, questions in data.items():
+        opts = generate_options([q["a"] for q in questions], [q["q"] for q in questions], seed=seed)
+        for q, o in zip(questions, opts):
+            q["mcq_opts"] = o
+        total += len(questions)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+    os.replace(tmp_path, path)
+    return total
+
+
+if __name__ == "__main__":
+    # Kullanım: python distractors.py [data/questions.json] [tohum]
+    path = sys.argv[1] if len(sys.argv) > 1 else "data/questions.json"
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    count = precompute_bank(path, seed)
+    print(f"{count} soru için MCQ seçenekleri önceden hesaplandı: {path}")
@@ -0,0 +1,179 @@
+import sys
+import time
+from collections import namedtuple
+from collections.abc import Sequence
+
+import numpy as np
+
+# ------------------------------------------------
+# PROSEDÜREL SORU ÜRETİCİ
+# ------------------------------------------------
+# "kolay" ve "orta" seviyelerindeki şablon aritmetik sorular (ör. "5 + 7 = ?",
+# "81 / 9 = ?") parametrik şablonlardan NumPy ile toplu olarak üretilir. Tüm
+# parametreler ve cevaplar tek geçişte dizi olarak hesaplanır; soru metni yalnızca
+# soru ekrana geldiğinde biçimlendirilir. Sonuçlar her zaman tam sayıdır ve bölme
+# soruları kalansızdır (önce bölen ve bölüm seçilir, bölünen onlardan hesaplanır).
+
+# Oyun oturumu başına üretilen soru sayısı (QuizDeck bunlardan istendikçe çeker)
+SESSION_COUNT = 10_000
+
+# fmt: soru metni ({0}, {1}, {2} parametreleri), make: (rng, n, *ranges) -> (p0, p1, p2, cevap)
+Template = namedtuple("Template", "name fmt make ranges")
+
+SUPERSCRIPTS = {2: "²", 3: "³"}
+
+
+def _add(rng, n, lo, hi):
+    a = rng.integers(lo, hi + 1, n)
+    b = rng.integers(lo, hi + 1, n)
+    return a, b, a, a + b
+
+
+def _sub(rng, n, lo, hi):
+    # Sonuç negatif olmasın: önce fark ve çıkan seçilir
+    b = rng.integers(lo, hi + 1, n)
+    diff = rng.integers(0, hi + 1, n)
+    return b + diff, b, b, diff
+
+
+def _mul(rng, n, lo_a, hi_a, lo_b, hi_b):
+    a = rng.integers(lo_a, hi_a + 1, n)
+    b = rng.integers(lo_b, hi_b + 1, n)
+    return a, b, a, a * b
+
+
+def _div(rng, n, lo_d, hi_d, lo_q, hi_q):
+    divisor = rng.integers(lo_d, hi_d + 1, n)
+    quotient = rng.integers(lo_q, hi_q + 1, n)
+    return divisor * quotient, divisor, divisor, quotient
+
+
+def _pow(rng, n, exponent, lo, hi):
+    base = rng.integers(lo, hi + 1, n)
+    return base, np.full(n, exponent), base, base ** exponent
+
+
+def _linear(rng, n, lo_a, hi_a, lo_x, hi_x, lo_b, hi_b):
+    # ax + b = c ; x tam sayı olacak şekilde önce x seçilir
+    a = rng.integers(lo_a, hi_a + 1, n)
+    x = rng.integers(lo_x, hi_x + 1, n)
+    b = rng.integers(lo_b, hi_b + 1, n)
+    return a, b, a * x + b, x
+
+
+def _proportion(rng, n, lo, hi, lo_k, hi_k):
+    # a:b = c:x ; c = a·k olduğundan x = b·k tam sayıdır
+    a = rng.integers(lo, hi + 1, n)
+    b = rng.integers(lo, hi + 1, n)
+    k = rng.integers(lo_k, hi_k + 1, n)
+    return a, b, a * k, b * k
+
+
+TEMPLATES = {
+    "kolay": (
+        Template("add", "{0} + {1} = ?", _add, (1, 50)),
+        Template("sub", "{0} - {1} = ?", _sub, (1, 50)),
+        Template("mul", "{0} x {1} = ?", _mul, (2, 12, 2, 12)),
+        Template("div", "{0} / {1} = ?", _div, (2, 12, 1, 12)),
+        Template("square", "{0}² = ?", _pow, (2, 2, 15)),
+        Template("cube", "{0}³ = ?", _pow, (3, 2, 6)),
+    ),
+    "orta": (
+        Template("add", "{0} + {1} = ?", _add, (10, 999)),
+        Template("sub", "{0} - {1} = ?", _sub, (10, 999)),
+        Template("mul", "{0} x {1} = ?", _mul, (11, 99, 2, 20)),
+        Template("div", "{0} / {1} = ?", _div, (2, 25, 2, 40)),
+        Template("linear", "{0}x + {1} = {2} ise x kaçtır?", _linear, (2, 9, -10, 20, 1, 30)),
+        Template("proportion", "{0}:{1} = {2}:x ise x kaçtır?", _proportion, (1, 12, 2, 6)),
+    ),
+}
+
+
+def has_templates(level):
+    return level in TEMPLATES
+
+
+def generate_arrays(level, n, rng):
+    """Seviyenin şablonlarından n soru üretir; (şablon, p0, p1, p2, cevap) dizileri döndürür."""
+    templates = TEMPLATES[level]
+    kinds = rng.integers(0, len(templates), n).astype(np.uint8)
+    params = np.empty((4, n), dtype=np.int64)
+    for t, template in enumerate(templates):
+        mask = kinds == t
+        count = int(mask.sum())
+        if count:
+            params[:, mask] = template.make(rng, count, *template.ranges)
+    return kinds, params
+
+
+class GeneratedLevel(Sequence):
+    """Üretilmiş soruların tembel görünümü; soru sözlüğü erişildiğinde biçimlendirilir."""
+
+    def __init__(self, level, n=SESSION_COUNT, seed=None):
+        self.level = level
+        self.templates = TEMPLATES[level]
+        self.kinds, self.params = generate_arrays(level, n, np.random.default_rng(seed))
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        template = self.templates[self.kinds[index]]
+        p0, p1, p2, answer = self.params[:, index].tolist()
+        return {
+            "q": template.fmt.format(p0, p1, p2),
+            "a": str(answer),
+            "type": "classic",
+            "kategori": "üretilmiş",
+        }
+
+
+class MixedLevel(Sequence):
+    """Soru bankası ile üretilmiş soruları tek bir dizi gibi birleştirir."""
+
+    def __init__(self, *parts):
+        self.parts = [p for p in parts if len(p)]
+
+    def __len__(self):
+        return sum(len(p) for p in self.parts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        for part in self.parts:
+            if index < len(part):
+                return part[index]
+            index -= len(part)
+        raise IndexError("question index out of range")
+
+
+def generate(level, n=SESSION_COUNT, seed=None):
+    return GeneratedLevel(level, n, seed)
+
+
+# ------------------------------------------------
+# BENCHMARK
+# ------------------------------------------------
+def benchmark(n=1_000_000, seed=0):
+    """Toplu üretim hızını ve birkaç örnek soruyu gösterir."""
+    for level in TEMPLATES:
+        rng = np.random.default_rng(seed)
+        t = time.perf_counter()
+        kinds, params = generate_arrays(level, n, rng)
+        elapsed = time.perf_counter() - t
+        print(f"{level}: {n} soru {elapsed * 1000:.1f} ms ({n / elapsed / 1e6:.1f} M soru/s)")
+        sample = GeneratedLevel(level, 5, seed)
+        for q in sample:
+            print(f"    {q['q']}  ->  {q['a']}")
+
+
+if __name__ == "__main__":
+    # Kullanım: python generator.py [n] [seed]
+    benchmark(
+        n=int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+        seed=int(sys.argv[2]) if len(sys.argv) > 2 else 0,
+    )
@@ -0,0 +1,436 @@
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from analytics import DEFAULT_DIR, append_block, iter_blocks, question_id
+from question_db import LEVELS, QuestionDB
+from question_io import DEFAULT_DB, DEFAULT_JSON
+
+# ------------------------------------------------
+# ÇEVRİMDIŞI IRT KALİBRASYONU
+# ------------------------------------------------
+# Analitik kayıtlarındaki (bkz. analytics.py) cevap sonuçlarından her sorunun
+# zorluğunu madde tepki kuramıyla (1PL Rasch / 2PL lojistik model) tahmin eder:
+#
+#   P(doğru | kişi j, soru i) = sigmoid(a_i * (theta_j - b_i))
+#
+# "Kişi", bir oyun oturumundaki bir oyuncudur (oturum x oyuncu). Parametreler ortak
+# en çok olabilirlikle (JML) bulunur; her turda tüm cevaplar bloklar halinde
+# taranır, gradyan ve eğrilik np.bincount ile kişi / soru başına toplanır ve her
+# parametre kendi (köşegen) Newton adımıyla güncellenir. Normal önsel dağılımlar,
+# hepsini bilen / hiçbirini bilemeyen kişilerde tahminlerin sonsuza kaçmasını önler.
+#
+# Kayıtlar önce sıkıştırılmış dosyalardan bir kez açılıp disk üzerindeki (memmap)
+# kompakt dizilere çevrilir: cevap başına 9 bayt (int32 soru, int32 kişi, int8 sonuç).
+# Böylece bellekte yalnızca parametreler ve tek bir blok tutulur; milyonlarca cevap
+# tek makinede dakikalar değil saniyeler içinde işlenir.
+#
+# Kullanım:
+#   python irt.py                      -> kalibre eder, raporu yazdırır (bankaya dokunmaz)
+#   python irt.py --write              -> "irt_b", "irt_a", "irt_n" ve "onerilen_seviye" alanlarını bankaya yazar
+#   python irt.py --write --move       -> ayrıca soruları önerilen seviyelerine taşır
+#   python irt.py --simulate 5000000   -> sentetik kayıtlarla hız ve doğruluk ölçümü
+
+CHUNK_ROWS = 1 << 20
+MIN_RESPONSES = 30          # seviye önerisi için gereken en az cevap sayısı
+THETA_SD, B_SD, A_SD = 1.0, 2.0, 0.5
+A_RANGE = (0.25, 4.0)
+MAX_STEP = 1.0
+TOLERANCE = 1e-3
+
+
+class ResponseData:
+    """Kayıtlardan çıkarılmış (soru indeksi, kişi indeksi, sonuç) dizileri.
+
+    `items` soru kimliklerini (uint64), `persons` (oturum << 2 | oyuncu) anahtarlarını
+    sıralı tutar; dizilerdeki indeksler bu listelere göredir.
+    """
+
+    def __init__(self, items, persons, item, person, correct, workdir=None):
+        self.items = items
+        self.persons = persons
+        self.item = item
+        self.person = person
+        self.correct = correct
+        self.workdir = workdir
+
+    def __len__(self):
+        return len(self.correct)
+
+    def chunks(self, rows=CHUNK_ROWS):
+        for start in range(0, len(self), rows):
+            end = start + rows
+            yield self.item[start:end], self.person[start:end], self.correct[start:end]
+
+    def close(self):
+        self.item = self.person = self.correct = None
+        if self.workdir:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+            self.workdir = None
+
+    @staticmethod
+    def _person_keys(block):
+        return (block["session"].astype(np.uint64) << np.uint64(2)) | block["player"].astype(np.uint64)
+
+    @classmethod
+    def from_log(cls, directory=DEFAULT_DIR, since=None, until=None):
+        """Kayıtları iki geçişte okur: önce benzersiz soru / kişi kümeleri, sonra indeks dizileri."""
+
+        def blocks():
+            for block in iter_blocks(directory):
+                keep = np.ones(len(block["time"]), dtype=bool)
+                if since is not None:
+                    keep &= block["time"] >= since
+                if until is not None:
+                    keep &= block["time"] < until
+                if keep.any():
+                    yield {name: block[name][keep] for name in ("question", "session", "player", "correct")}
+
+        items = np.zeros(0, dtype=np.uint64)
+        persons = np.zeros(0, dtype=np.uint64)
+        total = 0
+        for block in blocks():
+            items = np.union1d(items, block["question"])
+            persons = np.union1d(persons, cls._person_keys(block))
+            total += len(block["question"])
+
+        workdir = tempfile.mkdtemp(prefix="irt-")
+        item = np.lib.format.open_memmap(os.path.join(workdir, "item.npy"), "w+", np.int32, (total,))
+        person = np.lib.format.open_memmap(os.path.join(workdir, "person.npy"), "w+", np.int32, (total,))
+        correct = np.lib.format.open_memmap(os.path.join(workdir, "correct.npy"), "w+", np.int8, (total,))
+        pos = 0
+        for block in blocks():
+            n = len(block["question"])
+            item[pos:pos + n] = np.searchsorted(items, block["question"])
+            person[pos:pos + n] = np.searchsorted(persons, cls._person_keys(block))
+            correct[pos:pos + n] = block["correct"] != 0
+            pos += n
+        return cls(items, persons, item, person, correct, workdir)
+
+
+# ------------------------------------------------
+# MODEL
+# ------------------------------------------------
+class Calibration:
+    """Kalibrasyon sonucu: soru başına zorluk (b), ayırt edicilik (a) ve cevap sayısı."""
+
+    def __init__(self, items, b, a, counts, accuracy, theta, log_likelihood, epochs):
+        self.items = items
+        self.b = b
+        self.a = a
+        self.counts = counts
+        self.accuracy = accuracy
+        self.theta = theta
+        self.log_likelihood = log_likelihood
+        self.epochs = epochs
+
+    def by_question(self):
+        """soru kimliği -> (b, a, cevap sayısı)"""
+        return {
+            int(qid): (float(b), float(a), int(n))
+            for qid, b, a, n in zip(self.items, self.b, self.a, self.counts)
+        }
+
+
+def fit(data, model="2pl", epochs=30, tolerance=TOLERANCE, verbose=False):
+    """ResponseData üzerinde JML ile 1PL / 2PL modelini kalibre eder."""
+    n_items, n_persons = len(data.items), len(data.persons)
+    theta = np.zeros(n_persons)
+    b = np.zeros(n_items)
+    a = np.ones(n_items)
+    two_pl = model == "2pl"
+
+    counts = np.zeros(n_items)
+    hits = np.zeros(n_items)
+    for item, _, correct in data.chunks():
+        counts += np.bincount(item, minlength=n_items)
+        hits += np.bincount(item, weights=correct, minlength=n_items)
+    accuracy = hits / np.maximum(counts, 1)
+    # Başlangıç: doğruluk oranının logit'i (0 / 1 oranlar kırpılır)
+    p0 = np.clip((hits + 0.5) / (counts + 1.0), 0.02, 0.98)
+    b = np.log((1 - p0) / p0)
+
+    def scan(by_person):
+        """Tüm cevapları tarayıp kişi (by_person) ya da soru başına gradyan / eğrilik toplar."""
+        size = n_persons if by_person else n_items
+        grads = [np.zeros(size) for _ in range(5)]
+        log_likelihood = 0.0
+        for item, person, correct in data.chunks():
+            ai = a[item]
+            diff = theta[person] - b[item]
+            z = ai * diff
+            p = 1.0 / (1.0 + np.exp(-z))
+            residual = correct - p
+            weight = np.maximum(p * (1.0 - p), 1e-9)
+            if by_person:
+                grads[0] += np.bincount(person, weights=ai * residual, minlength=size)
+                grads[1] += np.bincount(person, weights=ai * ai * weight, minlength=size)
+                continue
+            log_likelihood += float(np.sum(np.where(correct, -np.logaddexp(0.0, -z), -np.logaddexp(0.0, z))))
+            grads[0] -= np.bincount(item, weights=ai * residual, minlength=size)
+            grads[1] += np.bincount(item, weights=ai * ai * weight, minlength=size)
+            if two_pl:
+                grads[2] += np.bincount(item, weights=diff * residual, minlength=size)
+                grads[3] += np.bincount(item, weights=diff * diff * weight, minlength=size)
+                grads[4] -= np.bincount(item, weights=ai * diff * weight, minlength=size)
+        return grads, log_likelihood
+
+    # Kişi ve soru parametreleri sırayla güncellenir (birlikte güncellemek salınım yapar).
+    # Kişiler için tek değişkenli, sorular için (b, a) çiftinde 2x2 Newton adımı atılır
+    # (önsel terimler dahil); aşırı sıçramalar kırpılır.
+    log_likelihood = 0.0
+    done = 0
+    for done in range(1, epochs + 1):
+        (g_theta, h_theta, _, _, _), _ = scan(by_person=True)
+        theta += np.clip((g_theta - theta / THETA_SD ** 2) / (h_theta + 1 / THETA_SD ** 2), -MAX_STEP, MAX_STEP)
+
+        (g_b, h_b, g_a, h_a, h_ab), log_likelihood = scan(by_person=False)
+        g_b -= b / B_SD ** 2
+        h_b += 1 / B_SD ** 2
+        if two_pl:
+            g_a -= (a - 1.0) / A_SD ** 2
+            h_a += 1 / A_SD ** 2
+            det = h_b * h_a - h_ab * h_ab
+            step_b = np.clip((h_a * g_b - h_ab * g_a) / det, -MAX_STEP, MAX_STEP)
+            a += np.clip((h_b * g_a - h_ab * g_b) / det, -MAX_STEP, MAX_STEP)
+            np.clip(a, *A_RANGE, out=a)
+        else:
+            step_b = np.clip(g_b / h_b, -MAX_STEP, MAX_STEP)
+        b += step_b
+        # Ölçeğin konumu serbesttir: kişi ortalamasını sıfıra sabitle
+        shift = theta.mean()
+        theta -= shift
+        b -= shift
+
+        change = float(np.abs(step_b).max()) if n_items else 0.0
+        if verbose:
+            print(f"  tur {done:>2}: log-olabilirlik {log_likelihood:,.0f}, en büyük zorluk değişimi {change:.4f}")
+        if change < tolerance:
+            break
+    return Calibration(data.items, b, a, counts.astype(np.int64), accuracy, theta, log_likelihood, done)
+
+
+# ------------------------------------------------
+# SEVİYE ÖNERİSİ VE BANKAYA YAZMA
+# ------------------------------------------------
+def suggest_levels(bank, calibration, min_responses=MIN_RESPONSES):
+    """Yeterince cevaplanmış soruları zorluğa göre sıralayıp seviyelere böler.
+
+    Seviyelerin mevcut soru sayıları (kalibre edilen sorular arasında) korunur: en kolay
+    N_kolay soru "kolay", sonraki N_orta soru "orta", kalanlar "zor" önerilir.
+    (seviye, sıra) -> önerilen seviye sözlüğü döndürür.
+    """
+    params = calibration.by_question()
+    rated = []
+    for level in LEVELS:
+        for pos, q in enumerate(bank.get(level, [])):
+            entry = params.get(question_id(q["q"]))
+            if entry and entry[2] >= min_responses:
+                rated.append((entry[0], level, pos))
+    rated.sort()
+    suggestions = {}
+    start = 0
+    for level in LEVELS:
+        size = sum(1 for _, current, _ in rated if current == level)
+        for _, current, pos in rated[start:start + size]:
+            suggestions[(current, pos)] = level
+        start += size
+    return suggestions
+
+
+def apply_to_bank(bank, calibration, model="2pl", min_responses=MIN_RESPONSES, move=False):
+    """Kalibrasyonu {seviye: [soru]} verisine yazar; (güncellenen, seviye değişikliği önerilen) döndürür.
+
+    move=True ise önerilen seviyesi farklı olan sorular o seviyenin sonuna taşınır.
+    """
+    params = calibration.by_question()
+    suggestions = suggest_levels(bank, calibration, min_responses)
+    updated = 0
+    moves = []
+    for level in LEVELS:
+        for pos, q in enumerate(bank.get(level, [])):
+            entry = params.get(question_id(q["q"]))
+            if entry is None:
+                continue
+            b, a, n = entry
+            q["irt_b"] = round(b, 3)
+            if model == "2pl":
+                q["irt_a"] = round(a, 3)
+            else:
+                q.pop("irt_a", None)
+            q["irt_n"] = n
+            target = suggestions.get((level, pos), level)
+            if target != level:
+                q["onerilen_seviye"] = target
+                moves.append((level, pos, target))
+            else:
+                q.pop("onerilen_seviye", None)
+            updated += 1
+    if move and moves:
+        moved = {(level, pos) for level, pos, _ in moves}
+        for level, pos, target in moves:
+            q = bank[level][pos]
+            q.pop("onerilen_seviye", None)
+            bank.setdefault(target, []).append(q)
+        for level in LEVELS:
+            bank[level] = [q for pos, q in enumerate(bank.get(level, [])) if (level, pos) not in moved]
+    return updated, moves
+
+
+def write_bank(calibration, backend="json", bank_path=None, model="2pl", min_responses=MIN_RESPONSES, move=False):
+    """Bankayı okuyup kalibrasyonu işler ve tek seferde (atomik / tek transaction) geri yazar."""
+    if backend == "sqlite":
+        db = QuestionDB(bank_path or DEFAULT_DB)
+        try:
+            bank = db.export()
+            result = apply_to_bank(bank, calibration, model, min_responses, move)
+            db.import_json(bank, replace=True)
+        finally:
+            db.close()
+        return result
+
+    path = bank_path or DEFAULT_JSON
+    with open(path, "r", encoding="utf-8") as f:
+        bank = json.load(f)
+    result = apply_to_bank(bank, calibration, model, min_responses, move)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(bank, f, ensure_ascii=False, indent=4)
+    os.replace(tmp_path, path)
+    return result
+
+
+def load_bank(backend="json", bank_path=None):
+    if backend == "sqlite":
+        db = QuestionDB(bank_path or DEFAULT_DB)
+        try:
+            return db.export()
+        finally:
+            db.close()
+    with open(bank_path or DEFAULT_JSON, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def report(bank, calibration, min_responses=MIN_RESPONSES, limit=10):
+    """Seviye başına ortalama zorluk ve seviyesi değişmesi önerilen soruları yazdırır."""
+    params = calibration.by_question()
+    print(f"{len(calibration.items)} soru, {int(calibration.counts.sum()):,} cevap, "
+          f"{len(calibration.theta):,} kişi | {calibration.epochs} tur")
+    for level in LEVELS:
+        values = [params[k][0] for k in (question_id(q["q"]) for q in bank.get(level, [])) if k in params]
+        if values:
+            print(f"  {level:<6} {len(values):>5} soru | ortalama zorluk {np.mean(values):+.2f} "
+                  f"(min {np.min(values):+.2f}, maks {np.max(values):+.2f})")
+    suggestions = suggest_levels(bank, calibration, min_responses)
+    changes = [(level, pos, target) for (level, pos), target in suggestions.items() if target != level]
+    print(f"Seviye değişikliği önerilen soru: {len(changes)}")
+    for level, pos, target in changes[:limit]:
+        q = bank[level][pos]
+        print(f"  {level} -> {target}: {q['q']} (b={params[question_id(q['q'])][0]:+.2f})")
+
+
+# ------------------------------------------------
+# SİMÜLASYON (BENCHMARK)
+# ------------------------------------------------
+def simulate(directory, responses, n_items=2000, per_person=20, seed=0):
+    """Bilinen parametrelerle sentetik cevap kayıtları yazar; (kimlikler, gerçek b, gerçek a) döndürür."""
+    rng = np.random.default_rng(seed)
+    qids = rng.integers(1, 2 ** 63, n_items, dtype=np.uint64)
+    levels = rng.integers(0, len(LEVELS), n_items)
+    true_b = (levels - 1.0) * 1.2 + rng.normal(0, 0.6, n_items)
+    true_a = np.exp(rng.normal(0, 0.3, n_items))
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, "answers-sim.mqa")
+    n_persons = responses // per_person
+    batch = 65536 // per_person
+    for first in range(0, n_persons, batch):
+        persons = min(batch, n_persons - first)
+        rows = persons * per_person
+        theta = np.repeat(rng.normal(0, 1, persons), per_person)
+        item = rng.integers(0, n_items, rows)
+        p = 1.0 / (1.0 + np.exp(-true_a[item] * (theta - true_b[item])))
+        columns = {
+            "time": np.full(rows, time.time()),
+            "session": np.repeat(np.arange(first, first + persons, dtype=np.uint32), per_person),
+            "question": qids[item],
+            "level": levels[item],
+            "mode": np.zeros(rows),
+            "player": np.zeros(rows),
+            "response_ms": rng.integers(1000, 20000, rows),
+            "correct": rng.random(rows) < p,
+            "powerups": np.zeros(rows),
+            "penalty": np.full(rows, -1),
+        }
+        append_block(path, columns, rows)
+    return qids, true_b, true_a
+
+
+def benchmark(responses, model="2pl"):
+    workdir = tempfile.mkdtemp(prefix="irt-sim-")
+    try:
+        t = time.perf_counter()
+        qids, true_b, true_a = simulate(workdir, responses)
+        print(f"{responses:,} sentetik cevap yazıldı: {time.perf_counter() - t:.1f} s")
+        t = time.perf_counter()
+        data = ResponseData.from_log(workdir)
+        print(f"Kayıtlar okunup indekslendi: {time.perf_counter() - t:.1f} s")
+        t = time.perf_counter()
+        calibration = fit(data, model, verbose=True)
+        elapsed = time.perf_counter() - t
+        rows = len(data)
+        data.close()
+        order = np.searchsorted(calibration.items, qids)
+        b_corr = np.corrcoef(calibration.b[order], true_b)[0, 1]
+        line = f"Kalibrasyon: {elapsed:.1f} s ({rows * calibration.epochs / elapsed:,.0f} cevap/s, {calibration.epochs} tur)"
+        line += f" | zorluk korelasyonu {b_corr:.3f}"
+        if model == "2pl":
+            line += f", ayırt edicilik korelasyonu {np.corrcoef(calibration.a[order], true_a)[0, 1]:.3f}"
+        print(line)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cevap kayıtlarından soru zorluklarını IRT ile kalibre eder")
+    parser.add_argument("log", nargs="?", default=DEFAULT_DIR, help=f"Analitik kayıt dizini (varsayılan: {DEFAULT_DIR})")
+    parser.add_argument("--model", choices=("1pl", "2pl"), default="2pl")
+    parser.add_argument("--since", help="Yalnızca bu tarihten (YYYY-AA-GG) sonraki cevaplar")
+    parser.add_argument("--epochs", type=int, default=30)
+    parser.add_argument("--min-responses", type=int, default=MIN_RESPONSES, help="Seviye önerisi için en az cevap")
+    parser.add_argument("--write", action="store_true", help="Sonuçları soru bankasına yaz")
+    parser.add_argument("--move", action="store_true", help="Soruları önerilen seviyelerine taşı (--write ile)")
+    parser.add_argument("--backend", choices=("json", "sqlite"), default="json")
+    parser.add_argument("--bank", help=f"Soru bankası yolu (varsayılan: {DEFAULT_JSON} / {DEFAULT_DB})")
+    parser.add_argument("--simulate", type=int, metavar="N", help="N sentetik cevapla hız / doğruluk ölçümü")
+    args = parser.parse_args(argv)
+
+    if args.simulate:
+        benchmark(args.simulate, args.model)
+        return
+
+    since = time.mktime(time.strptime(args.since, "%Y-%m-%d")) if args.since else None
+    started = time.perf_counter()
+    data = ResponseData.from_log(args.log, since)
+    try:
+        if not len(data):
+            print(f"Kalibre edilecek cevap yok: {args.log}")
+            return
+        calibration = fit(data, args.model, args.epochs)
+    finally:
+        data.close()
+    bank = load_bank(args.backend, args.bank)
+    report(bank, calibration, args.min_responses)
+    if args.write:
+        updated, moves = write_bank(calibration, args.backend, args.bank, args.model, args.min_responses, args.move)
+        action = "taşındı" if args.move else "seviye değişikliği önerildi"
+        print(f"{updated} soru güncellendi, {len(moves)} soru için {action}")
+    print(f"Toplam süre: {time.perf_counter() - started:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
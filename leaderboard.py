@@ -0,0 +1,178 @@
+import heapq
+import itertools
+import json
+import os
+import sys
+import time
+
+# ------------------------------------------------
+# SKOR TABLOLARI (TOP-N)
+# ------------------------------------------------
+# Her seviye için en iyi N skor, boyutu N ile sınırlı bir min-heap'te tutulur:
+# heap[0] tablodaki en zayıf skordur. Yeni skor ondan iyi değilse O(1) ile
+# reddedilir, iyiyse O(log N) ile eklenir ve en zayıf skor tablodan düşer.
+# Böylece bir kiosk'a okulun tamamı skor gönderse de her ekleme sabit maliyetlidir.
+#
+# Dosya biçimi (kompakt JSON, anahtar adları tekrarlanmaz):
+#   {"v": 1, "size": N, "levels": {"kolay": [[skor, zaman, isim, mod], ...], ...}}
+
+VERSION = 1
+DEFAULT_SIZE = 100
+MAX_NAME_LENGTH = 16
+
+
+class Entry(tuple):
+    """(skor, zaman, isim, mod). Heap sırası: düşük skor önce; eşitlikte yeni kayıt önce düşer."""
+
+    __slots__ = ()
+
+    def __new__(cls, score, when, name, mode):
+        return tuple.__new__(cls, (score, when, name, mode))
+
+    score = property(lambda self: self[0])
+    time = property(lambda self: self[1])
+    name = property(lambda self: self[2])
+    mode = property(lambda self: self[3])
+
+    def key(self):
+        return (self[0], -self[1])
+
+
+class Leaderboard:
+    """Tek bir seviyenin sınırlı boyutlu skor tablosu."""
+
+    def __init__(self, size=DEFAULT_SIZE, entries=()):
+        self.size = size
+        self.heap = []
+        self._counter = itertools.count()
+        self._ranked = None
+        for entry in entries:
+            self.push(*entry)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def min_score(self):
+        """Tabloya girmek için geçilmesi gereken skor (tablo doluysa), yoksa None."""
+        return self.heap[0][0][0] if len(self.heap) >= self.size else None
+
+    def push(self, score, when, name, mode):
+        """Skoru ekler; tabloya girdiyse True döndürür."""
+        entry = Entry(score, when, name, mode)
+        # Heap öğesi: (sıralama anahtarı, eşitlik bozucu, kayıt); aynı anahtarda sonra gelen önce düşer
+        item = (entry.key(), -next(self._counter), entry)
+        if len(self.heap) < self.size:
+            heapq.heappush(self.heap, item)
+        elif item[0] > self.heap[0][0]:
+            heapq.heapreplace(self.heap, item)
+        else:
+            return False
+        self._ranked = None
+        return True
+
+    def ranked(self):
+        """Kayıtları en iyiden en kötüye sıralı döndürür (değişiklik olana kadar önbellekte)."""
+        if self._ranked is None:
+            self._ranked = [item[2] for item in sorted(self.heap, reverse=True)]
+        return self._ranked
+
+    def page(self, page, page_size):
+        """`page`. sayfadaki (0 tabanlı) kayıtları (sıra no, kayıt) olarak döndürür."""
+        start = page * page_size
+        return list(enumerate(self.ranked()[start:start + page_size], start=start + 1))
+
+    def page_count(self, page_size):
+        return max(1, -(-len(self.heap) // page_size))
+
+    def best(self):
+        return self.ranked()[0].score if self.heap else 0
+
+    def rank_of(self, entry):
+        """Kaydın tablodaki sırası (1 tabanlı), yoksa None."""
+        for i, e in enumerate(self.ranked(), start=1):
+            if e is entry or e == entry:
+                return i
+        return None
+
+
+class Leaderboards:
+    """Seviye -> Leaderboard; JSON dosyasına atomik olarak kaydedilir."""
+
+    def __init__(self, path, levels, size=DEFAULT_SIZE):
+        self.path = path
+        self.size = size
+        self.boards = {level: Leaderboard(size) for level in levels}
+
+    def board(self, level):
+        if level not in self.boards:
+            self.boards[level] = Leaderboard(self.size)
+        return self.boards[level]
+
+    def submit(self, level, score, name, mode, when=None):
+        """Skoru gönderir; tabloya girdiyse dosyayı günceller ve sırasını, girmediyse None döndürür."""
+        name = (name or "").strip()[:MAX_NAME_LENGTH] or "Oyuncu"
+        entry = Entry(int(score), when if when is not None else int(time.time()), name, mode)
+        board = self.board(level)
+        if not board.push(*entry):
+            return None
+        self.save()
+        return board.rank_of(entry)
+
+    def best_scores(self):
+        return {level: board.best() for level, board in self.boards.items()}
+
+    # ---------------- KALICILIK ----------------
+
+    @classmethod
+    def load(cls, path, levels, size=DEFAULT_SIZE, legacy_highscores=None):
+        """Tabloları yükler. Dosya yoksa eski highscore.json değerleri (>0) başlangıç kaydı olur."""
+        boards = cls(path, levels, size)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for level, entries in data.get("levels", {}).items():
+                board = boards.board(level)
+                for score, when, name, mode in entries:
+                    board.push(score, when, name, mode)
+        except FileNotFoundError:
+            for level, score in (legacy_highscores or {}).items():
+                if isinstance(score, int) and score > 0:
+                    boards.board(level).push(score, 0.0, "Eski Rekor", "")
+        except (OSError, ValueError, TypeError) as e:
+            print(f"⚠️ Skor tablosu okunamadı, boş tablo ile devam ediliyor: {e}")
+        return boards
+
+    def save(self):
+        data = {
+            "v": VERSION,
+            "size": self.size,
+            "levels": {level: [list(e) for e in board.ranked()] for level, board in self.boards.items()},
+        }
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"❌ Skor tablosu kaydedilemedi: {e}")
+
+
+# ------------------------------------------------
+# BENCHMARK
+# ------------------------------------------------
+def benchmark(submissions=1_000_000, size=DEFAULT_SIZE):
+    """Bir okulun tamamının skor göndermesini taklit eder; ekleme başına maliyeti ölçer."""
+    import random
+    rng = random.Random(1)
+    board = Leaderboard(size)
+    t = time.perf_counter()
+    for i in range(submissions):
+        board.push(rng.randrange(0, 500), float(i), "oyuncu", "MCQ")
+    elapsed = time.perf_counter() - t
+    print(f"{submissions} skor, tablo boyutu {size}: {elapsed / submissions * 1e6:.2f} µs/skor")
+    print("İlk 3:", [(e.score, e.name) for e in board.ranked()[:3]])
+
+
+if __name__ == "__main__":
+    # Kullanım: python leaderboard.py [gönderim sayısı]
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
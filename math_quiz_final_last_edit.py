@@ -6,7 +6,28 @@ import random
 import time
 import math 
 import subprocess
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import List, Dict, Optional, Tuple
+from analytics import PENALTY_GOAL, PENALTY_SAVED, POWERUP_BITS, AnswerLog, question_id
+from answers import answers_equal, normalize_answer
+from distractors import generate_options
+from generator import MixedLevel, generate as generate_questions, has_templates
+from leaderboard import Leaderboards
+from penalty_worker import PenaltyWorker, PenaltyWorkerError
+from question_db import LEVELS, QuestionDB
+from question_index import DuplicateIndex, SearchIndex, question_key
+from question_pack import open_pack
+from practice import PracticeStore
+from question_stream import StreamingQuestionBank
+from ratings import RatingIndex, Ratings, target_rating
+from sampling import LazyPermutation, make_rng, sample_indices
+
+try:
+    import soccer
+except ImportError as e:  # penaltı yine de ayrı süreçte (soccer.py) oynanabilir
+    print(f"⚠️ soccer modülü yüklenemedi, penaltılar ayrı süreçte açılacak: {e}")
+    soccer = None
 
 # --------------------
 # 1. KONFIGÜRASYON VE SABİTLER
@@ -57,19 +78,62 @@ FONTS = {
 # Dosya Yolları
 FILES = {
     "questions": "data/questions.json",
-    "highscore": "data/highscore.json",
+    "questions_db": "data/questions.db",
+    "questions_pack": "data/questions.pack",
+    "highscore": "data/highscore.json",  # Eski biçim (seviye başına tek skor); yalnızca ilk geçişte okunur
+    "leaderboard": "data/leaderboard.json",
+    "analytics": "data/analytics",  # Cevap olaylarının sütunlu kayıtları (bkz. analytics.py)
+    "ratings": "data/ratings.json",  # Adaptif mod için oyuncu ve soru Elo puanları
+    "practice": "data/practice.json",  # Tekrar modu için oyuncu başına SM-2 takvimleri
     "sounds": "data/music1.mp3.mp3"  # Arka plan müziği dosyası
 }
 
+# Soru bankası arka ucu: "json" (varsayılan, data/questions.json), "sqlite" (data/questions.db)
+# "pack" (questions.json'dan derlenen, mmap ile açılan data/questions.pack; salt okunur)
+# veya "stream" (çok büyük questions.json için ofset indeksli, sorular istendikçe okunur)
+QUESTION_BACKEND = "json"
+
 # Varsayılan Ayarlar
 DEFAULT_SETTINGS = {
     "music": True,
     "sfx": True,
     "fullscreen": False,
     "time_per_question": 30,
-    "mode": "MCQ" # Bu tek kişilik mod için
+    "mode": "MCQ", # Bu tek kişilik mod için
+    "seed": None, # Soru seçimi için tohum (None = her oyunda farklı sıra)
+    "question_source": "Bank" # Bank: questions.json, Generated: üretici, Mixed: ikisi birlikte
 }
 
+QUESTION_SOURCES = ("Bank", "Generated", "Mixed")
+
+# Admin panelinde arama sonucu olarak gösterilen en fazla soru sayısı
+ADMIN_SEARCH_LIMIT = 6
+
+# Skor tablosu: seviye başına saklanan en iyi skor sayısı ve bir sayfadaki satır sayısı
+LEADERBOARD_SIZE = 100
+LEADERBOARD_PAGE_SIZE = 10
+
+# Adaptif mod: sorular tüm seviyelerden oyuncunun Elo puanına göre seçilir;
+# skorları ayrı bir tabloda tutulur
+ADAPTIVE_BOARD = "adaptif"
+ADAPTIVE_QUIZ_LENGTH = 20
+SCORE_BOARDS = LEVELS + (ADAPTIVE_BOARD,)
+
+# Penaltının oynandığı yer: "scene" (oyunun penceresinde, aynı süreçte; en hızlısı) veya
+# "worker" (açılışta başlatılan, görselleri önceden yüklenmiş ayrı süreç; penaltıdaki bir
+# çökme oyunu etkilemez, ölen süreç otomatik olarak yeniden başlatılır)
+PENALTY_MODE = "scene"
+
+# Penaltı ayrı süreçteyken oyunun kuyruğunda biriken (oyunculara ait) giriş olayları
+PLAYER_INPUT_EVENTS = (
+    pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+    pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP, pygame.JOYHATMOTION, pygame.JOYAXISMOTION,
+)
+
+# Tekrar modu: zamanı gelen tekrarlar, yoksa oyuncunun henüz görmediği sorular (skor tablosu yok)
+PRACTICE_LEVEL = "tekrar"
+PRACTICE_QUIZ_LENGTH = 15
+
 # --------------------
 # 2. YARDIMCI SINIFLAR
 # --------------------
@@ -79,8 +143,14 @@ class DataManager:
     def init_files():
         if not os.path.exists(FILES["questions"]):
             DataManager.save_json(FILES["questions"])
-        if not os.path.exists(FILES["highscore"]):
-            DataManager.save_json(FILES["highscore"], {"kolay": 0, "orta": 0, "zor": 0})
+
+    @staticmethod
+    def load_leaderboards():
+        """Skor tablolarını yükler; tablo dosyası henüz yoksa eski highscore.json rekorları aktarılır."""
+        return Leaderboards.load(
+            FILES["leaderboard"], SCORE_BOARDS, LEADERBOARD_SIZE,
+            legacy_highscores=DataManager.load_json(FILES["highscore"]),
+        )
 
     @staticmethod
     def load_json(path, default=None):
@@ -95,6 +165,416 @@ class DataManager:
         with open(path, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=4)
 
+    # ---------------- SORU BANKASI (JSON / SQLITE) ----------------
+
+    _question_db = None
+
+    @classmethod
+    def question_db(cls):
+        """SQLite soru bankasını açar; veritabanı boşsa mevcut JSON'u içeri aktarır."""
+        if cls._question_db is None:
+            db = QuestionDB(FILES["questions_db"])
+            if db.count() == 0 and os.path.exists(FILES["questions"]):
+                imported = db.import_json(FILES["questions"])
+                print(f"📦 {imported} soru SQLite bankasına aktarıldı: {FILES['questions_db']}")
+            cls._question_db = db
+        return cls._question_db
+
+    _question_pack = None
+    _question_pack_stamp = None
+
+    @classmethod
+    def question_pack(cls):
+        """Derlenmiş soru paketini açar; questions.json değiştiyse paket yeniden derlenir."""
+        try:
+            st = os.stat(FILES["questions"])
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+        # Kaynak dosya değişmediyse açık paketi (ve özet kontrolünü) yeniden kullan
+        if cls._question_pack is None or stamp != cls._question_pack_stamp:
+            if cls._question_pack is not None:
+                cls._question_pack.close()
+            cls._question_pack = open_pack(FILES["questions"], FILES["questions_pack"])
+            cls._question_pack_stamp = stamp
+        return cls._question_pack
+
+    _question_stream = None
+
+    @classmethod
+    def question_stream(cls):
+        """Akışlı soru bankasını açar; questions.json değiştiyse ofset indeksi yeniden kurulur."""
+        bank = cls._question_stream
+        try:
+            st = os.stat(FILES["questions"])
+            changed = bank is None or bank.stamp != (st.st_size, st.st_mtime_ns)
+        except OSError:
+            changed = bank is None
+        if changed:
+            if bank is not None:
+                bank.close()
+            cls._question_stream = StreamingQuestionBank(FILES["questions"])
+        return cls._question_stream
+
+    @staticmethod
+    def level_source(level):
+        """Seviyenin sorularını sıralı bir dizi (len + indeks) olarak döndürür.
+
+        "pack" ve "stream" arka uçlarında sorular ancak indekslendiklerinde çözülür.
+        """
+        if QUESTION_BACKEND == "pack":
+            return DataManager.question_pack().level(level)
+        if QUESTION_BACKEND == "stream":
+            return DataManager.question_stream().level(level)
+        return DataManager.load_level(level)
+
+    @staticmethod
+    def load_level(level):
+        """Bir seviyenin sorularını aktif arka uçtan liste olarak yükler."""
+        if QUESTION_BACKEND == "sqlite":
+            return DataManager.question_db().level_questions(level)
+        if QUESTION_BACKEND in ("pack", "stream"):
+            return list(DataManager.level_source(level))
+        return DataManager.load_json(FILES["questions"]).get(level, [])
+
+    # ---------------- TEKRAR VE ARAMA İNDEKSLERİ ----------------
+    # Her iki indeks de ilk ihtiyaçta tüm seviyelerden bir kez kurulur, sonra aşağıdaki
+    # yazma işlemleriyle artımlı güncellenir. Arama indeksi soruları (seviye, sıra) ile tutar.
+
+    _duplicate_index = None
+    _search_index = None
+    _ratings = None
+    _rating_index = None
+    _question_locations = None
+    _practice = None
+
+    @classmethod
+    def _build_indexes(cls):
+        duplicates, search = DuplicateIndex(), SearchIndex()
+        for level in LEVELS:
+            questions = DataManager.load_level(level)
+            duplicates.build(level, questions)
+            search.build(level, questions)
+        cls._duplicate_index, cls._search_index = duplicates, search
+
+    @classmethod
+    def duplicate_index(cls):
+        """Soru metni tekrar indeksini döndürür."""
+        if cls._duplicate_index is None:
+            cls._build_indexes()
+        return cls._duplicate_index
+
+    @classmethod
+    def search_index(cls):
+        """Soru/cevap metni arama indeksini döndürür."""
+        if cls._search_index is None:
+            cls._build_indexes()
+        return cls._search_index
+
+    @classmethod
+    def ratings(cls):
+        """Oyuncu ve soru Elo puanlarını döndürür (ilk çağrıda dosyadan yüklenir)."""
+        if cls._ratings is None:
+            cls._ratings = Ratings.load(FILES["ratings"])
+        return cls._ratings
+
+    @classmethod
+    def practice(cls):
+        """Oyuncuların aralıklı tekrar takvimlerini döndürür (ilk çağrıda dosyadan yüklenir)."""
+        if cls._practice is None:
+            cls._practice = PracticeStore.load(FILES["practice"])
+        return cls._practice
+
+    @classmethod
+    def _build_question_tables(cls):
+        """Soru kimliği tablolarını tek geçişte kurar: Elo puan kovaları ve kimlik -> konum."""
+        ratings, index, locations = cls.ratings(), RatingIndex(), {}
+        for level in LEVELS:
+            for position, q in enumerate(DataManager.load_level(level)):
+                qid = question_id(q["q"])
+                index.add((level, position), ratings.question(qid, level))
+                locations[qid] = (level, position)
+        cls._rating_index, cls._question_locations = index, locations
+
+    @classmethod
+    def rating_index(cls):
+        """Tüm seviyelerdeki soruları (seviye, sıra) ile Elo puan kovalarına yerleştiren indeks."""
+        if cls._rating_index is None:
+            cls._build_question_tables()
+        return cls._rating_index
+
+    @classmethod
+    def question_locations(cls):
+        """Soru kimliği (analytics.question_id) -> (seviye, sıra) eşlemesi."""
+        if cls._question_locations is None:
+            cls._build_question_tables()
+        return cls._question_locations
+
+    @classmethod
+    def _index_added(cls, level, position, question):
+        if cls._duplicate_index is not None:
+            cls._duplicate_index.add(level, question["q"])
+            cls._search_index.add(level, position, question)
+        if cls._rating_index is not None:
+            qid = question_id(question["q"])
+            cls._rating_index.add((level, position), cls.ratings().question(qid, level))
+            cls._question_locations[qid] = (level, position)
+
+    @classmethod
+    def _index_removed(cls, level, position, question):
+        if cls._duplicate_index is not None:
+            cls._duplicate_index.remove(level, question["q"])
+            cls._search_index.remove(level, position)
+        if cls._rating_index is not None:
+            cls._rating_index.remove((level, position))
+            qid = question_id(question["q"])
+            if cls._question_locations.get(qid) == (level, position):
+                del cls._question_locations[qid]
+
+    @staticmethod
+    def find_duplicate(question_text):
+        """Aynı soru bankada varsa bulunduğu seviyeyi, yoksa None döndürür."""
+        return DataManager.duplicate_index().find(question_text)
+
+    @staticmethod
+    def search_questions(query, limit=8, level=None):
+        """Soru ve cevaplarda önek araması; [(seviye, sıra, soru, cevap), ...] döndürür."""
+        return DataManager.search_index().search(query, limit=limit, level=level)
+
+    @staticmethod
+    def import_questions(data, skip_duplicates=True):
+        """{seviye: [soru, ...]} biçimindeki soruları toplu ekler.
+
+        Tekrar kontrolü aynı indeksle yapılır (aynı içe aktarma içindeki tekrarlar dahil).
+        Eklenen ve atlanan soru sayılarını döndürür.
+        """
+        index = DataManager.duplicate_index()
+        added, skipped = 0, 0
+        fresh = {}
+        seen = DuplicateIndex()
+        for level, questions in data.items():
+            if level not in LEVELS:
+                skipped += len(questions)
+                continue
+            for q in questions:
+                if skip_duplicates and (index.find(q["q"]) is not None or seen.find(q["q"]) is not None):
+                    skipped += 1
+                    continue
+                seen.add(level, q["q"])
+                fresh.setdefault(level, []).append(q)
+                added += 1
+        if not fresh:
+            return added, skipped
+
+        if QUESTION_BACKEND == "sqlite":
+            db = DataManager.question_db()
+            start = {level: db.count(level=level) for level in fresh}
+            db.import_json(fresh, replace=False)
+        else:
+            all_q_data = DataManager.load_json(FILES["questions"])
+            start = {level: len(all_q_data.get(level, [])) for level in fresh}
+            for level, questions in fresh.items():
+                all_q_data.setdefault(level, []).extend(questions)
+            DataManager.save_json(FILES["questions"], all_q_data)
+        for level, questions in fresh.items():
+            for i, q in enumerate(questions):
+                DataManager._index_added(level, start[level] + i, q)
+        return added, skipped
+
+    # Not: "pack" arka ucunda yazma işlemleri questions.json'a gider; paket bir sonraki
+    # erişimde kaynak özeti değiştiği için yeniden derlenir.
+
+    @staticmethod
+    def add_question(level, question):
+        """Soruyu seviyeye ekler; seviyedeki yeni soru sayısını döndürür (geçersiz seviyede None)."""
+        if QUESTION_BACKEND == "sqlite":
+            if level not in LEVELS:   # şema seviyeyi kısıtlamaz; JSON dalıyla aynı davranış
+                return None
+            db = DataManager.question_db()
+            db.add(level, question)
+            count = db.count(level=level)
+        else:
+            all_q_data = DataManager.load_json(FILES["questions"])
+            if level not in all_q_data:
+                return None
+            all_q_data[level].append(question)
+            DataManager.save_json(FILES["questions"], all_q_data)
+            count = len(all_q_data[level])
+        DataManager._index_added(level, count - 1, question)
+        return count
+
+    @staticmethod
+    def update_question(level, position, changes):
+        """Seviyedeki `position`. sorunun alanlarını `changes` ile günceller.
+
+        Soru veya cevap değişirse önceden hesaplanmış MCQ seçenekleri ("mcq_opts")
+        geçersiz olacağı için silinir. Güncellenmiş soruyu döndürür (yoksa None).
+        """
+        drop = ("mcq_opts",) if "q" in changes or "a" in changes else ()
+        if QUESTION_BACKEND == "sqlite":
+            result = DataManager.question_db().update_at(level, position, changes, drop)
+            if result is None:
+                return None
+            old_q, new_q = result
+        else:
+            all_q_data = DataManager.load_json(FILES["questions"])
+            questions = all_q_data.get(level, [])
+            if not 0 <= position < len(questions):
+                return None
+            old_q = questions[position]
+            new_q = {k: v for k, v in {**old_q, **changes}.items() if k not in drop}
+            questions[position] = new_q
+            DataManager.save_json(FILES["questions"], all_q_data)
+        DataManager._index_removed(level, position, old_q)
+        DataManager._index_added(level, position, new_q)
+        return new_q
+
+    @staticmethod
+    def delete_last_question(level):
+        """Seviyedeki son soruyu siler ve döndürür (silinecek soru yoksa None)."""
+        if QUESTION_BACKEND == "sqlite":
+            db = DataManager.question_db()
+            deleted_q = db.pop_last(level)
+            position = db.count(level=level)
+        else:
+            all_q_data = DataManager.load_json(FILES["questions"])
+            if not all_q_data.get(level):
+                return None
+            deleted_q = all_q_data[level].pop()
+            DataManager.save_json(FILES["questions"], all_q_data)
+            position = len(all_q_data[level])
+        if deleted_q is not None:
+            DataManager._index_removed(level, position, deleted_q)
+        return deleted_q
+
+class QuizDeck:
+    """Soruları verilen sırayla, ancak erişildiklerinde kaynaktan yükleyen quiz listesi.
+
+    Yüklenen sorular saklanır; böylece bellek kullanımı seviyenin boyutuna değil,
+    oynanan soru sayısına bağlıdır.
+    """
+
+    def __init__(self, source, order):
+        self.source = source
+        self.order = order
+        self.loaded = {}
+
+    def __len__(self):
+        return len(self.order)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.order)
+        if index not in self.loaded:
+            self.loaded[index] = self.source[self.order[index]]
+        return self.loaded[index]
+
+class ChoosingDeck(ABC):
+    """Sıradaki soruyu ancak istendiğinde seçen quiz listelerinin ortak tabanı.
+
+    Alt sınıflar `choose()` ile bir (seviye, sıra) konumu döndürür; seçilen sorular
+    kaynaktan yüklenip saklanır. Oturumda aynı soru ikinci kez gelmez. Seçim o anki
+    duruma (puan, tekrar takvimi) bağlı olduğu için sorular önceden hazırlanmaz.
+    """
+
+    def __init__(self, length, rng):
+        self.length = length
+        self.rng = rng
+        self.sources = {}
+        self.items = []      # (seviye, sıra)
+        self.questions = []
+        self.asked = set()
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError(index)
+        while len(self.questions) <= index:
+            item = self.choose()
+            level, position = item
+            if level not in self.sources:
+                self.sources[level] = DataManager.level_source(level)
+            self.asked.add(item)
+            self.items.append(item)
+            self.questions.append(self.sources[level][position])
+        return self.questions[index]
+
+    def level_of(self, index):
+        return self.items[index][0]
+
+    @abstractmethod
+    def choose(self):
+        """Sıradaki sorunun (seviye, sıra) konumunu döndürür; self.asked içindekiler dışında."""
+
+    def record(self, index, correct):
+        """index. sorunun cevabını işler (varsayılan: bir şey yapmaz)."""
+
+class AdaptiveDeck(ChoosingDeck):
+    """Sıradaki soruyu oyuncunun o anki Elo puanına göre seçen quiz listesi.
+
+    Her cevaptan sonra `record` oyuncu ve soru puanlarını günceller; bir sonraki
+    soru bu yeni puana göre seçilir.
+    """
+
+    def __init__(self, index, ratings, player, length, rng):
+        super().__init__(min(length, len(index)), rng)
+        self.index = index
+        self.ratings = ratings
+        self.player = player
+
+    def choose(self):
+        return self.index.pick(target_rating(self.ratings.player(self.player)), self.rng, self.asked)
+
+    def record(self, index, correct):
+        """index. sorunun sonucunu puanlara işler ve sorunun indeksteki kovasını günceller."""
+        level = self.items[index][0]
+        qid = question_id(self.questions[index]["q"])
+        _, rating = self.ratings.update(self.player, qid, level, correct)
+        self.index.move(self.items[index], rating)
+
+class PracticeDeck(ChoosingDeck):
+    """Önce zamanı gelmiş tekrarları (en gecikmiş önce), sonra görülmemiş soruları veren quiz listesi.
+
+    Kartlar cevaplar işlendikçe (check_answer) güncellenir; yanlış cevaplanan bir
+    soru tekrar zamanı gelince sonraki oturumlarda geri döner.
+    """
+
+    def __init__(self, schedule, locations, length, rng):
+        super().__init__(min(length, len(locations)), rng)
+        self.schedule = schedule
+        self.locations = locations
+        self.asked_ids = set()
+        self.kinds = []  # soru başına "tekrar" / "yeni"
+        self.seen = {locations[qid] for qid in schedule.cards if qid in locations}
+        self.unseen = [item for item in locations.values() if item not in self.seen]
+
+    def choose(self):
+        while True:
+            qid = self.schedule.next_due(exclude=self.asked_ids)
+            if qid is None:
+                break
+            self.asked_ids.add(qid)
+            if qid in self.locations:  # silinmiş sorular atlanır
+                self.kinds.append("tekrar")
+                return self.locations[qid]
+        # Görülmemiş sorulardan rastgele biri (sondakiyle yer değiştirerek O(1) çıkarma)
+        while self.unseen:
+            i = self.rng.randrange(len(self.unseen))
+            self.unseen[i], self.unseen[-1] = self.unseen[-1], self.unseen[i]
+            item = self.unseen.pop()
+            if item not in self.asked:
+                self.kinds.append("yeni")
+                return item
+        # Hepsi görülmüşse zamanı henüz gelmemiş kartlardan biri (erken tekrar)
+        for item in self.seen - self.asked:
+            self.kinds.append("tekrar")
+            return item
+        raise IndexError("seçilecek soru kalmadı")
+
 class SoundManager:
     
     def __init__(self, bgm_file="background_music.mp3", sfx_volume=0.7, bgm_volume=0.3):
@@ -195,37 +675,48 @@ class Utils:
 
     @staticmethod
     def normalize_answer(s: str) -> str:
-        if not s: return ""
-        s = s.strip().lower().replace(" ", "")
-        s = s.replace("²", "^2").replace("³", "^3").replace("⁴", "^4")
-        return s
+        return normalize_answer(s)
 
     @staticmethod
-    def generate_mcq_options(correct: str) -> List[str]:
-        # Basitçe 4 seçenek üretme mantığı
-        options = [correct]
-        try:
-            val = float(correct)
-            for i in [-1, 1, 2, -2]:
-                cand = str(int(val + i)) if (val+i).is_integer() else f"{val+i:.1f}"
-                if cand not in options: options.append(cand)
-        except:
-            suffixes = [" + C", " - 1", "²", "/2", " + 1", "x"]
-            for s in suffixes:
-                cand = correct + s
-                if cand not in options: options.append(cand)
-        
-        while len(options) < 4:
-            options.append(f"{correct} ({len(options)})")
-        
-        final_opts = options[:4]
-        random.shuffle(final_opts)
-        
-        if correct not in final_opts:
-            final_opts[0] = correct
-            random.shuffle(final_opts)
-            
-        return final_opts
+    def answers_match(given: str, expected: str) -> bool:
+        # "0.5", "1/2", ",5" ve "%50" gibi aynı değerdeki cevaplar doğru sayılır
+        return answers_equal(given, expected)
+
+    @staticmethod
+    def generate_mcq_options(correct: str, rng=None, question: str = "") -> List[str]:
+        # Cevabın türüne göre (tam sayı, ondalık, kesir, üs, ifade) olası hatalardan 4 seçenek
+        seed = (rng or random).getrandbits(64)
+        return generate_options([correct], [question], seed=seed)[0]
+
+class McqOptionCache:
+    """MCQ seçeneklerini (soru kimliği, tohum) anahtarıyla saklayan sınırlı LRU önbellek.
+
+    Seçenekler aynı anahtardan türetilen bir üreteçle karıştırıldığı için aynı tohumla
+    tekrar oynanan oturum, önbellekten düşmüş olsa bile aynı seçenekleri gösterir.
+    """
+
+    def __init__(self, max_size=512):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+
+    @staticmethod
+    def question_key(q):
+        return (q.get("id"), q["q"], q["a"])
+
+    def get(self, q, seed):
+        if q.get("mcq_opts"):
+            # distractors.py ile önceden hesaplanmış seçenekler olduğu gibi kullanılır
+            return list(q["mcq_opts"])
+        key = (self.question_key(q), seed)
+        opts = self.entries.get(key)
+        if opts is None:
+            opts = Utils.generate_mcq_options(str(q["a"]), random.Random(f"{seed}:{key[0]}"), q["q"])
+            self.entries[key] = opts
+            if len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+        else:
+            self.entries.move_to_end(key)
+        return opts
 
 # --------------------
 # 3. UI BİLEŞENLERİ & EFEKTLER
@@ -388,12 +879,25 @@ class Game:
     def __init__(self):
         DataManager.init_files()
         self.settings = DEFAULT_SETTINGS.copy()
-        self.highscores = DataManager.load_json(FILES["highscore"])
+        self.leaderboards = DataManager.load_leaderboards()
+        self.player_name = ""  # Son girilen oyuncu adı; bir sonraki oyunda kutuya hazır gelir
+        self.pending_score = None  # GAMEOVER ekranında isim bekleyen skor: (seviye, skor, mod)
+        self.highscore_level = "kolay"
+        self.highscore_page = 0
+        self.highscore_rank = None  # Son kaydedilen skorun (seviye, sıra) bilgisi; tabloda vurgulanır
+        self.answer_log = AnswerLog(FILES["analytics"])
+        self.question_id = 0  # Ekrandaki sorunun analitik kimliği
+        self.question_level = None  # Ekrandaki sorunun seviyesi (adaptif modda sorudan soruya değişir)
+        self.question_shown_time = 0  # Cevap süresi buradan ölçülür (ek süre jokeri etkilemez)
+        self.question_powerups = 0  # Bu soruda kullanılan jokerlerin bit maskesi
+        self.answer_rows = {}  # İki kişilik modda bu sorunun analitik satırları (penaltı sonucu için)
         self.sound_manager = SoundManager()
         self.state = "MENU"
         self.current_level = "kolay"
         self.quiz_data = []
         self.current_q_index = 0
+        self.mcq_cache = McqOptionCache()
+        self.session_seed = None  # Oturumun soru sırası ve MCQ seçenekleri bu tohumdan türetilir
         self.score = 0
         self.start_time = 0
         self.powerups = {"extra": 1, "skip": 1, "hint": 1}
@@ -420,6 +924,21 @@ class Game:
         )
         self.mcq_buttons = []
         self.buttons = {}
+
+        # Oyun sonu isim kutusu ve skor tablosu sayfalama butonları
+        self.name_input = InputBox(self.CX - 300, self.CY + 20, 600, 70)
+        # Oyuncuya özel modlarda (adaptif, tekrar) oyun öncesi isim girişi
+        self.setup_name_input = InputBox(self.CX - 300, self.CY - 60, 600, 70)
+        self.setup_start_button = Button(self.CX - 150, self.CY + 140, 300, 80, "BAŞLA", color=COLORS["GREEN"], action=self.start_player_mode)
+        self.player_setup_mode = "adaptive"
+        self.highscore_buttons = {
+            "level_kolay": Button(self.CX - 590, 230, 230, 60, "KOLAY", color=COLORS["GREEN"], action=lambda: self.set_highscore_level("kolay")),
+            "level_orta": Button(self.CX - 290, 230, 230, 60, "ORTA", color=COLORS["YELLOW"], action=lambda: self.set_highscore_level("orta")),
+            "level_zor": Button(self.CX + 10, 230, 230, 60, "ZOR", color=COLORS["RED"], action=lambda: self.set_highscore_level("zor")),
+            "level_adaptif": Button(self.CX + 310, 230, 230, 60, "ADAPTİF", color=COLORS["PURPLE"], action=lambda: self.set_highscore_level(ADAPTIVE_BOARD)),
+            "prev": Button(self.CX - 450, HEIGHT - 140, 250, 70, "< Önceki", color=COLORS["GRAY"], action=lambda: self.turn_highscore_page(-1)),
+            "next": Button(self.CX + 200, HEIGHT - 140, 250, 70, "Sonraki >", color=COLORS["GRAY"], action=lambda: self.turn_highscore_page(1)),
+        }
         
         # İKİ OYUNCULU MOD DEĞİŞKENLERİ
         self.p1_score = 0
@@ -441,6 +960,8 @@ class Game:
         self.penalty_goalkeeper = None  # "p1" or "p2"
         self.penalty_attacker = None  # "p1" or "p2"
         self.penalty_handled = False  # Flag to ensure penalty is only handled once
+        self.penalty_result = None  # Son penaltının ayrıntıları (yön, karar süreleri)
+        self.penalty_worker = PenaltyWorker().start() if PENALTY_MODE == "worker" else None
         self.penalty_start_time = None  # Time when penalty started (to pause timer)
         self.time_remaining_before_penalty = None  # Time remaining when penalty started
         self.time_remaining_when_both_answered = None  # Time remaining when both players answered
@@ -483,6 +1004,11 @@ class Game:
             admin_input_h, 
             text="Cevap (Kesin Değer)", player_color=COLORS["GRAY"]
         )
+        # Soru arama kutusu (sol sütun); sonuçlar yazdıkça altında listelenir
+        self.admin_search_input = InputBox(30, admin_y_start, 410, admin_input_h, text="")
+        self.admin_search_results = []
+        self.admin_result_buttons = []
+        self.admin_editing = None  # Düzenlenen soru: (seviye, sıra, orijinal soru metni)
         # ... diğer admin butonları ...
         self.admin_buttons = {
             "save": Button(self.CX - 150 - 200, HEIGHT * 0.85, 300, 80, "Soru KAYDET", color=COLORS["GREEN"], action=self.save_new_question),
@@ -658,6 +1184,11 @@ class Game:
                 print(f"   → Two player mode toggle clicked")
             return
         
+        # Player setup - start the mode with the typed name
+        if self.state == "PLAYER_SETUP":
+            self.start_player_mode()
+            return
+
         # Game over screens - go back to menu
         if self.state in ["GAMEOVER", "TWO_PLAYER_GAMEOVER"]:
             print(f"   → Returning to menu from {self.state}")
@@ -715,7 +1246,9 @@ class Game:
         modes_gap = 120
         self.buttons["modes_menu"] = [
             Button(self.CX - 350, modes_y_start, 700, 80, "Tek Kişilik (Classic/MCQ)", color=COLORS["BLUE"], action=lambda: self.set_state("MENU")),
-            Button(self.CX - 350, modes_y_start + modes_gap, 700, 80, "İKİ KİŞİLİK YARIŞ", color=COLORS["P1"], action=lambda: self.set_state("TWO_PLAYER_SETUP"))
+            Button(self.CX - 350, modes_y_start + modes_gap, 700, 80, "TEKRAR (Aralıklı Tekrar)", color=COLORS["GREEN"], action=lambda: self.open_player_setup("practice")),
+            Button(self.CX - 350, modes_y_start + 2 * modes_gap, 700, 80, "İKİ KİŞİLİK YARIŞ", color=COLORS["P1"], action=lambda: self.set_state("TWO_PLAYER_SETUP")),
+            Button(self.CX - 350, modes_y_start + 3 * modes_gap, 700, 80, "ADAPTİF (Seviyene Göre)", color=COLORS["PURPLE"], action=lambda: self.open_player_setup("adaptive")),
             # Buraya gelecekte Zamana Karşı, vs. modları eklenebilir.
         ]
         
@@ -742,18 +1275,21 @@ class Game:
     def set_state(self, new_state):
         # Save score if exiting from single player quiz
         if self.state == "QUIZ" and new_state == "MENU":
-            # User is exiting quiz - save current score if it's a new highscore
-            if self.current_level and self.current_level in ["kolay", "orta", "zor"]:
-                current_highscore = self.highscores.get(self.current_level, 0)
-                if self.score >= current_highscore:
-                    self.highscores[self.current_level] = self.score
-                    try:
-                        DataManager.save_json(FILES["highscore"], self.highscores)
-                        print(f"💾 Score saved on exit: {self.current_level} = {self.score}")
-                    except Exception as e:
-                        print(f"❌ Error saving score on exit: {e}")
-        
+            # User is exiting quiz - submit current score under the last used name
+            if self.current_level in SCORE_BOARDS and self.score > 0:
+                rank = self.leaderboards.submit(self.current_level, self.score, self.player_name, self.settings["mode"])
+                if rank:
+                    print(f"💾 Score saved on exit: {self.current_level} = {self.score} (#{rank})")
+        # Leaving the game over screen without pressing ENTER still records the score
+        if self.state == "GAMEOVER" and self.pending_score:
+            self.submit_pending_score()
+
         self.state = new_state
+        # Write buffered answer events and changed ratings at session boundaries (never per answer)
+        if new_state in ("MENU", "GAMEOVER", "TWO_PLAYER_GAMEOVER"):
+            self.answer_log.flush()
+            DataManager.ratings().save()
+            DataManager.practice().save()
         # Reset scores when returning to MENU
         if new_state == "MENU":
             self.p1_score = 0
@@ -764,29 +1300,54 @@ class Game:
             self.current_level = None
             self.current_q_index = 0
             self.quiz_data = []
-        # Reload highscores when entering HIGHSCORE state to show latest data
+        # Show the page holding the last submitted score, or the first page
         elif new_state == "HIGHSCORE":
-            self.highscores = DataManager.load_json(FILES["highscore"])
-            print(f"📊 Highscores reloaded: {self.highscores}")
+            if self.highscore_rank:
+                level, rank = self.highscore_rank
+                self.highscore_level = level
+                self.highscore_page = (rank - 1) // LEADERBOARD_PAGE_SIZE
+            else:
+                self.highscore_page = 0
         time.sleep(0.1)
 
     # ---------------- TEK KİŞİLİK QUIZ MANTIKLARI ----------------
     
     def start_quiz(self, level):
-        all_q = DataManager.load_json(FILES["questions"])
-        self.quiz_data = all_q.get(level, [])
-        # ... (MCQ ve shuffle mantığı) ...
-        for q in self.quiz_data:
-            if self.settings["mode"] == "MCQ":
-                q["mcq_opts"] = Utils.generate_mcq_options(q["a"])
-        
-        if self.quiz_data:
-            random.shuffle(self.quiz_data)
-        
+        self.session_seed = self.new_session_seed()
+        source = self.quiz_source(level)
+        # Seviye baştan karıştırılmaz; sıradaki soru istendikçe çekilir (kısmi Fisher–Yates).
+        # MCQ seçenekleri de soru ekrana gelirken üretilir (bkz. get_mcq_options).
+        order = LazyPermutation(len(source), make_rng(self.session_seed))
+        self.begin_quiz(level, QuizDeck(source, order))
+
+    def start_adaptive_quiz(self, player):
+        """Tüm seviyelerden, oyuncunun Elo puanına göre seçilen sorularla tek kişilik quiz başlatır."""
+        index = DataManager.rating_index()
+        if not len(index):
+            self.feedback = {"msg": "Soru bankası boş!", "color": COLORS["RED"], "time": time.time()}
+            return
+        self.session_seed = self.new_session_seed()
+        deck = AdaptiveDeck(index, DataManager.ratings(), player, ADAPTIVE_QUIZ_LENGTH, make_rng(self.session_seed))
+        self.begin_quiz(ADAPTIVE_BOARD, deck)
+
+    def start_practice_quiz(self, player):
+        """Oyuncunun aralıklı tekrar takvimine göre tek kişilik tekrar oturumu başlatır."""
+        locations = DataManager.question_locations()
+        if not locations:
+            self.feedback = {"msg": "Soru bankası boş!", "color": COLORS["RED"], "time": time.time()}
+            return
+        self.session_seed = self.new_session_seed()
+        schedule = DataManager.practice().schedule(player)
+        deck = PracticeDeck(schedule, locations, PRACTICE_QUIZ_LENGTH, make_rng(self.session_seed))
+        self.begin_quiz(PRACTICE_LEVEL, deck)
+
+    def begin_quiz(self, level, deck):
+        self.quiz_data = deck
         self.current_level = level
         self.current_q_index = 0
         self.score = 0
         self.powerups = {"extra": 1, "skip": 1, "hint": 1}
+        self.answer_log.new_session()
         # Track when quiz started to prevent immediate answer checks from stale events
         self.quiz_start_time = time.time()
         self.start_turn()
@@ -799,15 +1360,48 @@ class Game:
             
     # Diğer tek kişilik metotlar (check_answer, next_question, end_game, use_powerup) değişmedi
 
+    def quiz_source(self, level):
+        """Ayara göre soru bankasını, üretilmiş soruları veya ikisinin karışımını döndürür.
+
+        Şablonu olmayan seviyeler (ör. "zor") her zaman soru bankasından gelir.
+        Üretici, oturum tohumundan beslendiği için aynı tohum aynı soruları verir.
+        """
+        choice = self.settings["question_source"]
+        bank = DataManager.level_source(level)
+        if choice == "Bank" or not has_templates(level):
+            return bank
+        # Oturum, seviyenin soru bankası kadar (en az iki kişilik quiz uzunluğu kadar) üretilmiş
+        # soru sorar; Karışık modda bu banka ile yarı yarıya demektir. Sözlükler tembel biçimlendirilir.
+        count = max(len(bank), self.two_player_quiz_length)
+        generated = generate_questions(level, n=count, seed=self.session_seed)
+        if choice == "Generated":
+            return generated
+        return MixedLevel(bank, generated)
+
+    def new_session_seed(self):
+        """Ayarlarda tohum varsa onu, yoksa yeni rastgele bir oturum tohumu döndürür."""
+        if self.settings["seed"] is not None:
+            return self.settings["seed"]
+        return random.randrange(2**32)
+
+    def get_mcq_options(self, index):
+        """index. sorunun MCQ seçeneklerini döndürür ve bir sonraki sorununkileri önceden hazırlar."""
+        opts = self.mcq_cache.get(self.quiz_data[index], self.session_seed)
+        # Adaptif / tekrar destelerinde sıradaki soru ancak bu cevaptan sonra seçilebilir
+        if index + 1 < len(self.quiz_data) and not isinstance(self.quiz_data, ChoosingDeck):
+            self.mcq_cache.get(self.quiz_data[index + 1], self.session_seed)
+        return opts
+
     def start_turn(self):
         self.start_time = time.time()
+        self.begin_question_log()
         self.feedback = {"msg": "", "time": 0}
         self.input_box.text = ""
         self.mcq_selected_index = 0  # Joystick seçimini sıfırla
         # ... (MCQ butonları yerleştirme mantığı) ...
         
         if self.settings["mode"] == "MCQ" and self.current_q_index < len(self.quiz_data):
-            opts = self.quiz_data[self.current_q_index].get("mcq_opts", [])
+            opts = self.get_mcq_options(self.current_q_index)
             self.mcq_buttons = []
             
             mcq_btn_w = 900
@@ -828,6 +1422,17 @@ class Game:
                 ) 
                 self.mcq_buttons.append((btn, opt))
 
+    def begin_question_log(self):
+        """Ekrana gelen soru için analitik alanlarını sıfırlar."""
+        self.question_shown_time = time.time()
+        self.question_powerups = 0
+        self.answer_rows = {}
+        if self.current_q_index < len(self.quiz_data):
+            self.question_id = question_id(self.quiz_data[self.current_q_index]["q"])
+            self.question_level = self.current_level
+            if isinstance(self.quiz_data, ChoosingDeck):
+                self.question_level = self.quiz_data.level_of(self.current_q_index)
+
     def check_answer(self, user_ans):
         # Ensure we're in single player quiz state before counting score
         if self.state != "QUIZ":
@@ -857,7 +1462,18 @@ class Game:
             return
         
         correct_ans = self.quiz_data[self.current_q_index]["a"]
-        is_correct = Utils.normalize_answer(user_ans_str) == Utils.normalize_answer(str(correct_ans))
+        is_correct = Utils.answers_match(user_ans_str, str(correct_ans))
+        response_s = time.time() - self.question_shown_time
+        self.answer_log.record(
+            self.question_id, self.question_level, self.settings["mode"], "single",
+            response_s, is_correct, self.question_powerups,
+        )
+        if isinstance(self.quiz_data, ChoosingDeck):
+            self.quiz_data.record(self.current_q_index, is_correct)
+        # Tekrar modundaki cevaplar oyuncunun takvimine işlenir (yanlışlar yakında geri gelir);
+        # normal, adaptif ve süreli oyunlar takvimi değiştirmez
+        if isinstance(self.quiz_data, PracticeDeck) and self.player_name:
+            DataManager.practice().review(self.player_name, self.question_id, is_correct, response_s)
         
         if is_correct:
             self.score += 10
@@ -887,42 +1503,71 @@ class Game:
 
     def end_game(self):
         print(f"🎮 Game ended! Final score: {self.score} | Level: {self.current_level}")
-        print(f"📊 Current highscores before save: {self.highscores}")
-        
-        # Ensure current_level is valid
-        if not self.current_level or self.current_level not in ["kolay", "orta", "zor"]:
-            print(f"⚠️ Warning: Invalid current_level: {self.current_level}")
+
+        # Ensure current_level is valid (practice sessions are not ranked)
+        if self.current_level not in SCORE_BOARDS:
+            if self.current_level != PRACTICE_LEVEL:
+                print(f"⚠️ Warning: Invalid current_level: {self.current_level}")
+            self.pending_score = None
             self.set_state("GAMEOVER")
             return
-        
-        current_highscore = self.highscores.get(self.current_level, 0)
-        print(f"📊 Current highscore for {self.current_level}: {current_highscore}")
-        
-        # Save score if it's greater than or equal to current highscore
-        # (Use >= to update even if equal, and to save first score)
-        if self.score >= current_highscore:
-            self.highscores[self.current_level] = self.score
-            try:
-                DataManager.save_json(FILES["highscore"], self.highscores)
-                print(f"🏆 Highscore saved! {self.current_level}: {current_highscore} -> {self.score}")
-                print(f"💾 File saved to: {FILES['highscore']}")
-            except Exception as e:
-                print(f"❌ Error saving highscore: {e}")
-        else:
-            print(f"ℹ️ Score {self.score} did not beat highscore {current_highscore} for {self.current_level}")
-        
-        # Reload highscores to ensure we have the latest data
-        try:
-            self.highscores = DataManager.load_json(FILES["highscore"])
-            print(f"📊 Updated highscores after reload: {self.highscores}")
-        except Exception as e:
-            print(f"❌ Error reloading highscores: {e}")
-        
+
+        # Skor, GAMEOVER ekranında isim girilince (veya ekrandan çıkılınca) tabloya yazılır
+        self.pending_score = (self.current_level, self.score, self.settings["mode"])
+        self.highscore_rank = None
+        self.name_input.text = self.player_name
+        self.name_input.active = True
+        self.name_input.color = COLORS["BLUE"]
         self.set_state("GAMEOVER")
 
+    def submit_pending_score(self):
+        """GAMEOVER ekranındaki skoru girilen isimle skor tablosuna gönderir."""
+        level, score, mode = self.pending_score
+        self.pending_score = None
+        self.player_name = self.name_input.text.strip()
+        rank = self.leaderboards.submit(level, score, self.player_name, mode)
+        if rank:
+            self.highscore_rank = (level, rank)
+            print(f"🏆 Score saved: {level} #{rank} -> {score}")
+        else:
+            print(f"ℹ️ Score {score} did not make the {level} leaderboard")
+        return rank
+
+    def set_highscore_level(self, level):
+        self.highscore_level = level
+        self.highscore_page = 0
+
+    def turn_highscore_page(self, step):
+        pages = self.leaderboards.board(self.highscore_level).page_count(LEADERBOARD_PAGE_SIZE)
+        self.highscore_page = max(0, min(pages - 1, self.highscore_page + step))
+
+    # ---------------- OYUNCUYA ÖZEL MODLAR ----------------
+
+    PLAYER_MODES = {"adaptive": "ADAPTİF MOD", "practice": "TEKRAR MODU"}
+
+    def open_player_setup(self, mode):
+        """İsim isteyen modlar için hazırlık ekranını açar."""
+        self.player_setup_mode = mode
+        self.setup_name_input.text = self.player_name
+        self.setup_name_input.active = True
+        self.setup_name_input.color = COLORS["BLUE"]
+        self.set_state("PLAYER_SETUP")
+
+    def start_player_mode(self):
+        name = self.setup_name_input.text.strip()
+        if not name:
+            self.feedback = {"msg": "Önce ismini yaz!", "color": COLORS["RED"], "time": time.time()}
+            return
+        self.player_name = name
+        if self.player_setup_mode == "adaptive":
+            self.start_adaptive_quiz(name)
+        elif self.player_setup_mode == "practice":
+            self.start_practice_quiz(name)
+
     def use_powerup(self, p_type):
         if self.powerups.get(p_type, 0) > 0:
             self.powerups[p_type] -= 1
+            self.question_powerups |= POWERUP_BITS[p_type]
             self.sound_manager.play("powerup", self.settings["sfx"])
             
             if p_type == "extra":
@@ -943,31 +1588,30 @@ class Game:
     # ---------------- İKİ KİŞİLİK MOD MANTIKLARI ----------------
     
     def start_two_player_quiz(self, level):
-        all_q = DataManager.load_json(FILES["questions"])
-        self.quiz_data = all_q.get(level, [])
+        self.session_seed = self.new_session_seed()
+        source = self.quiz_source(level)
         
-        if len(self.quiz_data) < self.two_player_quiz_length:
+        if len(source) < self.two_player_quiz_length:
              self.show_feedback(f"'{level.upper()}' seviyesinde {self.two_player_quiz_length} soru yok!", COLORS["RED"])
              return
 
-        # MCQ modunda seçenekleri oluştur
-        for q in self.quiz_data:
-            if self.two_player_mode == "MCQ":
-                q["mcq_opts"] = Utils.generate_mcq_options(q["a"])
-
-        random.shuffle(self.quiz_data)
-        self.quiz_data = self.quiz_data[:self.two_player_quiz_length] # Sadece 10 soru kullan
+        # Sadece 10 soru çekilir ve yüklenir; maliyet seviyenin boyutundan bağımsızdır.
+        # MCQ seçenekleri her tur başında üretilir (bkz. get_mcq_options).
+        picked = sample_indices(len(source), self.two_player_quiz_length, make_rng(self.session_seed))
+        self.quiz_data = [source[i] for i in picked]
         
         self.current_level = level
         self.current_q_index = 0
         self.p1_score = 0
         self.p2_score = 0
         self.winner = None
+        self.answer_log.new_session()
         self.start_two_player_turn()
         self.set_state("TWO_PLAYER_QUIZ")
         
     def start_two_player_turn(self):
         self.start_time = time.time()
+        self.begin_question_log()
         self.two_player_q_answered = {"p1": False, "p2": False}
         self.two_player_q_correct = {"p1": None, "p2": None}  # Reset correctness tracking
         self.both_players_answered = False  # Reset both players answered flag
@@ -987,7 +1631,7 @@ class Game:
         
         # MCQ modunda butonları oluştur
         if self.two_player_mode == "MCQ" and self.current_q_index < len(self.quiz_data):
-            opts = self.quiz_data[self.current_q_index].get("mcq_opts", [])
+            opts = self.get_mcq_options(self.current_q_index)
             self.p1_mcq_buttons = []
             self.p2_mcq_buttons = []
             
@@ -1028,10 +1672,14 @@ class Game:
         correct_ans = self.quiz_data[self.current_q_index]["a"]
         
         score_diff = 10 # Her soru 10 puan değerinde
-        is_correct = Utils.normalize_answer(str(user_ans)) == Utils.normalize_answer(str(correct_ans))
+        is_correct = Utils.answers_match(str(user_ans), str(correct_ans))
         
         self.two_player_q_answered[player] = True
         self.two_player_q_correct[player] = is_correct
+        self.answer_rows[player] = self.answer_log.record(
+            self.question_id, self.question_level, self.two_player_mode, player,
+            time.time() - self.question_shown_time, is_correct,
+        )
         
         if is_correct:
             self.sound_manager.play("correct", self.settings["sfx"])
@@ -1171,54 +1819,22 @@ class Game:
             print(f"   Goalkeeper (answered correctly): {self.penalty_goalkeeper} ({goalkeeper_name})")
             print(f"   Attacker/Shooter (answered wrong): {self.penalty_attacker} ({attacker_name})")
             
-            # Get the absolute path to soccer.py
-            # Try multiple methods to get the correct path
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            soccer_path = os.path.join(current_dir, "soccer.py")
-            
-            # Convert to absolute path and normalize
-            soccer_path = os.path.abspath(soccer_path)
-            
-            # Fallback: Use the exact path provided by user if relative path doesn't exist
-            if not os.path.exists(soccer_path):
-                fallback_path = r"D:\coding\pythonuni\math project (2)\math_final-main\math_final-main\soccer.py"
-                if os.path.exists(fallback_path):
-                    soccer_path = fallback_path
-                    print(f"Using fallback path: {soccer_path}")
-                else:
-                    raise FileNotFoundError(f"soccer.py not found at: {soccer_path} or {fallback_path}")
-            
-            # Run soccer.py as a subprocess
-            # Exit code 0 = saved (True), exit code 1 = goal scored (False)
-            print(f"Running penalty shootout: {soccer_path}")
-            print(f"Python executable: {sys.executable}")
-            print(f"Passing arguments to soccer.py: goalkeeper={self.penalty_goalkeeper}, attacker={self.penalty_attacker}")
-            
-            # Run the subprocess with player role information as arguments
-            # Pass goalkeeper and attacker IDs so soccer.py can map joysticks correctly
-            # Arguments: [python_executable, soccer_path, goalkeeper_id, attacker_id]
-            result = subprocess.run(
-                [sys.executable, soccer_path, self.penalty_goalkeeper, self.penalty_attacker], 
-                capture_output=False,  # Don't capture, let it display
-                cwd=current_dir,
-                check=False  # Don't raise exception on non-zero exit
-            )
-            
-            print(f"Penalty shootout finished with exit code: {result.returncode}")
-            
-            # Get result from exit code: 0 = saved (True), 1 = goal (False)
-            keeper_saved = (result.returncode == 0)
-            
-            # Restore main game screen (soccer.py might have changed display mode)
-            try:
-                pygame.display.set_mode((WIDTH, HEIGHT))
-            except:
-                pass  # If screen restoration fails, continue anyway
+            keeper_saved = self.run_penalty_scene()
+            if keeper_saved is not None:
+                for row in self.answer_rows.values():
+                    self.answer_log.set_penalty(row, PENALTY_SAVED if keeper_saved else PENALTY_GOAL)
             
             # Process result
             # Award points ONLY if the goalkeeper (who answered correctly) saved the ball
             # Do NOT award points if a goal was scored (keeper_saved == False)
-            if keeper_saved:
+            if keeper_saved is None:
+                # Penalty window was closed before the shot finished - nobody scores
+                self.feedback = {
+                    "msg": "Penalty cancelled. No points awarded.",
+                    "color": COLORS["YELLOW"],
+                    "time": time.time()
+                }
+            elif keeper_saved:
                 # Goalkeeper saved - award points to whoever is the goalkeeper
                 if self.penalty_goalkeeper == "p1":
                     self.p1_score += 10
@@ -1303,6 +1919,104 @@ class Game:
         self.penalty_start_time = None
         self.time_remaining_before_penalty = None
     
+    def run_penalty_scene(self):
+        """Penaltıyı aynı süreçte, oyunun ekranını paylaşan bir sahne olarak oynatır.
+
+        Görseller ve penaltı durumu ilk penaltıdan sonra bellekte kalır; sonraki penaltılar
+        yeni bir Python süreci başlatmadan, görüntü modunu değiştirmeden hemen açılır.
+        Sahne açılamazsa soccer.py ayrı süreçte çalıştırılır. Kaleci kurtardıysa True, gol
+        olduysa False, penaltı penceresi atış bitmeden kapatıldıysa None döner (puan verilmez).
+        PENALTY_MODE "worker" ise penaltı kalıcı işçi süreçte oynanır (bkz. run_penalty_worker).
+        """
+        self.penalty_result = None
+        if self.penalty_worker is not None:
+            return self.run_penalty_worker()
+        if soccer is not None:
+            try:
+                saved = soccer.run_penalty_shootout(self.penalty_goalkeeper, self.penalty_attacker, embedded=True)
+                # Pencere kapatıldıysa run_game QUIT olayını kuyruğa geri koyar; oyun kapanacak
+                if pygame.event.peek(pygame.QUIT):
+                    return None
+                self.penalty_result = soccer.game.summary()
+                return saved
+            except Exception as e:
+                print(f"⚠️ Penaltı sahnesi açılamadı, ayrı süreçle deneniyor: {e}")
+                try:
+                    pygame.display.set_mode((WIDTH, HEIGHT))
+                except pygame.error:
+                    pass
+        return self.run_penalty_subprocess()
+
+    def run_penalty_worker(self):
+        """Penaltıyı önceden ısınmış işçi süreçte oynatır; işçi ölürse bu penaltı tek seferlik
+        süreçte oynanır (işçi bir sonraki penaltı için yeniden başlatılmıştır)."""
+        try:
+            # Beklerken oyun penceresi "yanıt vermiyor" durumuna düşmesin
+            result = self.penalty_worker.run_penalty(self.penalty_goalkeeper, self.penalty_attacker, idle=pygame.event.pump)
+        except PenaltyWorkerError as e:
+            print(f"⚠️ {e}; bu penaltı ayrı süreçte açılıyor")
+            return self.run_penalty_subprocess()
+        finally:
+            pygame.event.clear(PLAYER_INPUT_EVENTS)
+        if not result.get("ok"):
+            print(f"⚠️ Penaltı sürecinde hata: {result.get('error')}; bu penaltı ayrı süreçte açılıyor")
+            return self.run_penalty_subprocess()
+        if result.get("aborted"):
+            # İşçinin penceresi atış bitmeden kapatıldı: sonuç yok, puan verilmez
+            print("⚠️ Penaltı penceresi kapatıldı; penaltı sayılmadı")
+            return None
+        self.penalty_result = result
+        print(f"⚽ Penaltı: {'kurtarış' if result['saved'] else 'gol'} | şut {result['shot_direction']}, "
+              f"kaleci {result['keeper_zone']} | karar süreleri {result['shooter_ms']} / {result['keeper_ms']} ms")
+        return result["saved"]
+
+    def run_penalty_subprocess(self):
+        """Yedek yol: soccer.py'yi ayrı bir Python sürecinde çalıştırır (çıkış kodu 0 = kurtarış)."""
+        # Get the absolute path to soccer.py
+        # Try multiple methods to get the correct path
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        soccer_path = os.path.join(current_dir, "soccer.py")
+
+        # Convert to absolute path and normalize
+        soccer_path = os.path.abspath(soccer_path)
+
+        # Fallback: Use the exact path provided by user if relative path doesn't exist
+        if not os.path.exists(soccer_path):
+            fallback_path = r"D:\coding\pythonuni\math project (2)\math_final-main\math_final-main\soccer.py"
+            if os.path.exists(fallback_path):
+                soccer_path = fallback_path
+                print(f"Using fallback path: {soccer_path}")
+            else:
+                raise FileNotFoundError(f"soccer.py not found at: {soccer_path} or {fallback_path}")
+
+        # Run soccer.py as a subprocess
+        # Exit code 0 = saved (True), exit code 1 = goal scored (False)
+        print(f"Running penalty shootout: {soccer_path}")
+        print(f"Python executable: {sys.executable}")
+        print(f"Passing arguments to soccer.py: goalkeeper={self.penalty_goalkeeper}, attacker={self.penalty_attacker}")
+
+        # Run the subprocess with player role information as arguments
+        # Pass goalkeeper and attacker IDs so soccer.py can map joysticks correctly
+        # Arguments: [python_executable, soccer_path, goalkeeper_id, attacker_id]
+        result = subprocess.run(
+            [sys.executable, soccer_path, self.penalty_goalkeeper, self.penalty_attacker], 
+            capture_output=False,  # Don't capture, let it display
+            cwd=current_dir,
+            check=False  # Don't raise exception on non-zero exit
+        )
+
+        print(f"Penalty shootout finished with exit code: {result.returncode}")
+
+        # Get result from exit code: 0 = saved (True), 1 = goal (False)
+        keeper_saved = (result.returncode == 0)
+
+        # Restore main game screen (soccer.py might have changed display mode)
+        try:
+            pygame.display.set_mode((WIDTH, HEIGHT))
+        except:
+            pass  # If screen restoration fails, continue anyway
+        return keeper_saved
+
     def end_two_player_game(self):
         if self.p1_score > self.p2_score:
             self.winner = "Player 1 (Sol)"
@@ -1318,17 +2032,43 @@ class Game:
     def set_admin_level(self, level):
         """Admin panelinde aktif seviyeyi ayarlar."""
         self.admin_current_level = level
+        self.admin_editing = None
         self.feedback = {"msg": f"Aktif Kayıt Seviyesi: {level.upper()}", "color": COLORS["BLUE"], "time": time.time()}
 
+    def update_admin_search(self):
+        """Arama kutusundaki metinle soru bankasını arar ve sonuç butonlarını yeniler."""
+        query = self.admin_search_input.text.strip()
+        self.admin_search_results = DataManager.search_questions(query, limit=ADMIN_SEARCH_LIMIT) if query else []
+        self.admin_result_buttons = []
+        y = self.admin_search_input.rect.bottom + 20
+        for result in self.admin_search_results:
+            level, position, q, a = result
+            label = f"{level[0].upper()}{position + 1}: {q}"
+            if len(label) > 18:
+                label = label[:17] + "…"
+            self.admin_result_buttons.append(Button(
+                30, y, 410, 50, label,
+                color=COLORS["PANEL"], hover_color=COLORS["BLUE"], text_color=COLORS["DARK"],
+                action=lambda r=result: self.select_admin_question(r)
+            ))
+            y += 60
+
+    def select_admin_question(self, result):
+        """Arama sonucundaki soruyu düzenlemek üzere giriş kutularına yükler."""
+        level, position, q, a = result
+        self.admin_current_level = level
+        self.admin_editing = (level, position, q)
+        self.admin_question_input.text = q
+        self.admin_answer_input.text = a
+        self.feedback = {"msg": f"Düzenleniyor: {level.upper()} #{position + 1}", "color": COLORS["BLUE"], "time": time.time()}
+
     def delete_last_question(self):
-        """Aktif seviyedeki son soruyu JSON dosyasından siler."""
-        all_q_data = DataManager.load_json(FILES["questions"])
+        """Aktif seviyedeki son soruyu soru bankasından siler."""
         level = self.admin_current_level
+        self.admin_editing = None
+        deleted_q = DataManager.delete_last_question(level)
         
-        if level in all_q_data and all_q_data[level]:
-            deleted_q = all_q_data[level].pop() # Son soruyu listeden çıkar
-            DataManager.save_json(FILES["questions"], all_q_data)
-            
+        if deleted_q is not None:
             self.feedback = {"msg": f"'{level.upper()}' seviyesinden son soru ('{deleted_q['q'][:20]}...') SİLİNDİ!", 
                              "color": COLORS["RED"], "time": time.time()}
         else:
@@ -1347,6 +2087,22 @@ class Game:
             self.feedback = {"msg": "Soru ve Cevap Alanları BOŞ Bırakılamaz!", "color": COLORS["RED"], "time": time.time()}
             return
 
+        # Aynı soru bankada zaten varsa kaydetme (hash indeksi, O(1)).
+        # Düzenlenen soru metni değişmediyse kendisiyle çakışması tekrar sayılmaz.
+        editing = self.admin_editing
+        if editing and question_key(question_text) == question_key(editing[2]):
+            existing_level = None
+        else:
+            existing_level = DataManager.find_duplicate(question_text)
+        if existing_level is not None:
+            self.feedback = {"msg": f"Bu soru zaten '{existing_level.upper()}' seviyesinde var, kaydedilmedi!", 
+                             "color": COLORS["RED"], "time": time.time()}
+            return
+
+        if editing:
+            self.save_edited_question(editing, question_text, answer_text)
+            return
+
         # 2. Yeni Soru Objesi Oluşturma
         new_question = {
             "q": question_text,
@@ -1359,17 +2115,12 @@ class Game:
         level_to_save = self.admin_current_level 
         
         try:
-            all_q_data = DataManager.load_json(FILES["questions"])
+            # Soruyu aktif arka uca (JSON veya SQLite) ekle
+            level_count = DataManager.add_question(level_to_save, new_question)
             
-            if level_to_save in all_q_data:
-                # Soru listesine yeni soruyu ekle
-                all_q_data[level_to_save].append(new_question)
-                
-                # JSON dosyasına kaydet
-                DataManager.save_json(FILES["questions"], all_q_data)
-                
+            if level_count is not None:
                 # 4. Başarılı Geri Bildirim ve Inputları Temizleme
-                self.feedback = {"msg": f"Yeni Soru ('{level_to_save.upper()}') BAŞARIYLA Kaydedildi! Toplam Soru: {len(all_q_data[level_to_save])}", 
+                self.feedback = {"msg": f"Yeni Soru ('{level_to_save.upper()}') BAŞARIYLA Kaydedildi! Toplam Soru: {level_count}", 
                                  "color": COLORS["GREEN"], "time": time.time()}
                                  
                 # Input kutularını temizle
@@ -1384,6 +2135,21 @@ class Game:
              # Eğer JSON yükleme/kaydetme sırasında bir hata olursa (örn. dosya izni)
             self.feedback = {"msg": f"Kritik Hata: Dosya İşlemi Başarısız. {e}", "color": COLORS["RED"], "time": time.time()}
             
+    def save_edited_question(self, editing, question_text, answer_text):
+        """Arama ile seçilen sorunun metnini ve cevabını günceller."""
+        level, position, _ = editing
+        try:
+            updated = DataManager.update_question(level, position, {"q": question_text, "a": answer_text})
+        except Exception as e:
+            self.feedback = {"msg": f"Kritik Hata: Dosya İşlemi Başarısız. {e}", "color": COLORS["RED"], "time": time.time()}
+            return
+        if updated is None:
+            self.feedback = {"msg": "Düzenlenen soru artık bankada yok!", "color": COLORS["RED"], "time": time.time()}
+        else:
+            self.feedback = {"msg": f"Soru GÜNCELLENDİ: {level.upper()} #{position + 1}", "color": COLORS["GREEN"], "time": time.time()}
+        self.admin_editing = None
+        self.update_admin_search()
+
     # ---------------- DRAWING ----------------
 
     def draw_bg(self):
@@ -1438,6 +2204,34 @@ class Game:
         # Mod değiştirme butonunu çiz
         self.two_player_mode_toggle_button.draw(SCREEN)
 
+    def draw_player_setup(self):
+        self.draw_bg()
+        self.buttons["back_to_modes"].draw(SCREEN)
+
+        t = FONTS["title"].render(self.PLAYER_MODES[self.player_setup_mode], True, COLORS["BG"])
+        SCREEN.blit(t, (self.CX - t.get_width()//2, 100))
+
+        label = FONTS["large"].render("İsmin:", True, COLORS["TEXT"])
+        SCREEN.blit(label, (self.CX - label.get_width()//2, self.setup_name_input.rect.y - 90))
+        self.setup_name_input.draw(SCREEN)
+
+        name = self.setup_name_input.text.strip()
+        if name and self.player_setup_mode == "practice":
+            schedule = DataManager.practice().players.get(name)
+            info = f"{schedule.due_count()} tekrar bekliyor ({len(schedule)} kart)" if schedule else "Yeni oyuncu: yeni sorularla başlanır"
+        elif name:
+            ratings = DataManager.ratings()
+            known = name in ratings.players
+            info = f"Elo puanın: {ratings.player(name):.0f}" if known else "Yeni oyuncu: ilk sorular orta zorlukta başlar"
+        if name:
+            surf = FONTS["medium"].render(info, True, COLORS["PURPLE"])
+            SCREEN.blit(surf, (self.CX - surf.get_width()//2, self.setup_name_input.rect.bottom + 25))
+        self.setup_start_button.draw(SCREEN)
+
+        if time.time() - self.feedback.get("time", 0) < 2.0:
+            fb = FONTS["large"].render(self.feedback["msg"], True, self.feedback["color"])
+            SCREEN.blit(fb, (self.CX - fb.get_width()//2, HEIGHT * 0.85))
+
     def draw_quiz(self):
         self.draw_bg()
         # ... (Tek kişilik quiz çizim mantığı) ...
@@ -1445,8 +2239,15 @@ class Game:
         # Üst Panel
         pygame.draw.rect(SCREEN, COLORS["DARK"], (0, 0, WIDTH, 120)) 
         score_txt = FONTS["large"].render(f"Puan: {self.score}", True, COLORS["WHITE"])
-        lvl_txt = FONTS["medium"].render(f"{self.current_level.upper()} | {self.current_q_index+1}/{len(self.quiz_data)}", True, COLORS["GRAY"])
-        
+        lvl_label = self.current_level.upper()
+        if isinstance(self.quiz_data, AdaptiveDeck) and self.question_level:
+            elo = DataManager.ratings().player(self.quiz_data.player)
+            lvl_label = f"ADAPTİF ({self.question_level.upper()}) | Elo {elo:.0f}"
+        elif isinstance(self.quiz_data, PracticeDeck) and self.question_level:
+            kind = self.quiz_data.kinds[self.current_q_index].upper()
+            lvl_label = f"TEKRAR ({self.question_level.upper()}) | {kind}"
+        lvl_txt = FONTS["medium"].render(f"{lvl_label} | {self.current_q_index+1}/{len(self.quiz_data)}", True, COLORS["GRAY"])
+
         SCREEN.blit(lvl_txt, (40, 40))
         SCREEN.blit(score_txt, (WIDTH - 40 - score_txt.get_width(), 30))
         
@@ -1760,9 +2561,13 @@ class Game:
         t2 = FONTS["large"].render(f"Toplam Puan: {self.score}", True, COLORS["BLUE"])
         t3 = FONTS["medium"].render("Menüye dönmek için herhangi bir yere tıkla", True, COLORS["GRAY"])
         
-        SCREEN.blit(t1, (self.CX - t1.get_width()//2, panel.y + 80))
-        SCREEN.blit(t2, (self.CX - t2.get_width()//2, panel.y + 250))
-        SCREEN.blit(t3, (self.CX - t3.get_width()//2, panel.y + 450))
+        SCREEN.blit(t1, (self.CX - t1.get_width()//2, panel.y + 60))
+        SCREEN.blit(t2, (self.CX - t2.get_width()//2, panel.y + 190))
+        if self.pending_score:
+            label = FONTS["medium"].render("İsmini yaz, skor tablosuna kaydetmek için ENTER'a bas:", True, COLORS["TEXT"])
+            SCREEN.blit(label, (self.CX - label.get_width()//2, self.name_input.rect.y - 50))
+            self.name_input.draw(SCREEN)
+        SCREEN.blit(t3, (self.CX - t3.get_width()//2, panel.y + 480))
 
     def draw_penalty_shootout(self):
         """Draw the penalty shootout activation screen"""
@@ -1835,35 +2640,43 @@ class Game:
         SCREEN.blit(t3, (self.CX - t3.get_width()//2, panel.y + 520))
 
     def draw_highscores(self):
-        # ... (Yüksek skorlar çizim mantığı) ...
         self.draw_bg()
         self.buttons["back"].draw(SCREEN)
-        
-        # Note: Highscores are already reloaded when entering HIGHSCORE state in set_state()
-        # No need to reload every frame - it's inefficient and spams the console
-        
-        # Ensure highscores has all required levels
-        required_levels = ["kolay", "orta", "zor"]
-        for level in required_levels:
-            if level not in self.highscores:
-                self.highscores[level] = 0
-        
+
         t = FONTS["title"].render("SKORLAR", True, COLORS["BG"])
         SCREEN.blit(t, (self.CX - t.get_width()//2, 100))
-        
-        y = 250
-        card_w, card_h = 600, 100
-        # Display scores in order: kolay, orta, zor
-        for lvl in required_levels:
-            scr = self.highscores.get(lvl, 0)
-            card = pygame.Rect(self.CX - card_w//2, y, card_w, card_h)
-            pygame.draw.rect(SCREEN, COLORS["WHITE"], card, border_radius=15)
-            
-            lt = FONTS["large"].render(lvl.upper(), True, COLORS["BLUE"])
-            st = FONTS["large"].render(str(scr), True, COLORS["GREEN"])
-            SCREEN.blit(lt, (card.x + 40, card.y + 20))
-            SCREEN.blit(st, (card.right - 40 - st.get_width(), card.y + 20))
-            y += 130 
+
+        for key, btn in self.highscore_buttons.items():
+            if key.startswith("level_"):
+                btn.color = COLORS["PURPLE"] if key == f"level_{self.highscore_level}" else COLORS["GRAY"]
+            btn.draw(SCREEN)
+
+        board = self.leaderboards.board(self.highscore_level)
+        pages = board.page_count(LEADERBOARD_PAGE_SIZE)
+        self.highscore_page = min(self.highscore_page, pages - 1)
+        highlight = self.highscore_rank[1] if self.highscore_rank and self.highscore_rank[0] == self.highscore_level else None
+
+        table = pygame.Rect(self.CX - 600, 320, 1200, 60 + LEADERBOARD_PAGE_SIZE * 55)
+        pygame.draw.rect(SCREEN, COLORS["WHITE"], table, border_radius=15)
+        columns = ((table.x + 40, "#"), (table.x + 140, "İsim"), (table.x + 620, "Puan"), (table.x + 800, "Mod"), (table.x + 960, "Tarih"))
+        for x, title in columns:
+            SCREEN.blit(FONTS["medium"].render(title, True, COLORS["GRAY"]), (x, table.y + 15))
+
+        y = table.y + 65
+        rows = board.page(self.highscore_page, LEADERBOARD_PAGE_SIZE)
+        if not rows:
+            empty = FONTS["medium"].render("Bu seviyede henüz skor yok.", True, COLORS["GRAY"])
+            SCREEN.blit(empty, (self.CX - empty.get_width()//2, y + 40))
+        for rank, entry in rows:
+            color = COLORS["GREEN"] if rank == highlight else COLORS["TEXT"]
+            date = time.strftime("%d.%m.%Y", time.localtime(entry.time)) if entry.time else "-"
+            values = (f"{rank}.", entry.name, str(entry.score), entry.mode or "-", date)
+            for (x, _), value in zip(columns, values):
+                SCREEN.blit(FONTS["medium"].render(value, True, color), (x, y))
+            y += 55
+
+        info = FONTS["medium"].render(f"Sayfa {self.highscore_page + 1} / {pages}  (sol/sağ ok tuşları)", True, COLORS["TEXT"])
+        SCREEN.blit(info, (self.CX - info.get_width()//2, HEIGHT - 120))
 
     def draw_settings(self):
         # ... (Ayarlar çizim mantığı) ...
@@ -1876,7 +2689,8 @@ class Game:
         info_lines = [
             f"Müzik: {'AÇIK' if self.settings['music'] else 'KAPALI'} (M)",
             f"Ses Efektleri: {'AÇIK' if self.settings['sfx'] else 'KAPALI'} (S)",
-            f"Tam Ekran: {'AÇIK' if self.settings['fullscreen'] else 'KAPALI'} (F)"
+            f"Tam Ekran: {'AÇIK' if self.settings['fullscreen'] else 'KAPALI'} (F)",
+            f"Soru Kaynağı: {self.settings['question_source']} (G)"
         ]
         y = 300
         for line in info_lines:
@@ -1907,6 +2721,14 @@ class Game:
                 
         self.admin_question_input.draw(SCREEN)
         self.admin_answer_input.draw(SCREEN)
+
+        search_label = FONTS["small"].render("Soru Ara (soru veya cevap):", True, COLORS["TEXT"])
+        SCREEN.blit(search_label, (self.admin_search_input.rect.x, self.admin_search_input.rect.y - 40))
+        self.admin_search_input.draw(SCREEN)
+        for btn in self.admin_result_buttons:
+            btn.draw(SCREEN)
+
+        self.admin_buttons["save"].text = "Soruyu GÜNCELLE" if self.admin_editing else "Soru KAYDET"
         self.admin_buttons["save"].draw(SCREEN)
         self.admin_buttons["delete_last"].draw(SCREEN)
         
@@ -1918,6 +2740,7 @@ class Game:
         if self.state == "MENU": self.draw_menu()
         elif self.state == "MODES_MENU": self.draw_modes_menu()
         elif self.state == "TWO_PLAYER_SETUP": self.draw_two_player_setup()
+        elif self.state == "PLAYER_SETUP": self.draw_player_setup()
         elif self.state == "TWO_PLAYER_QUIZ": self.draw_two_player_quiz()
         elif self.state == "TWO_PLAYER_GAMEOVER": self.draw_two_player_gameover()
         elif self.state == "PENALTY_SHOOTOUT": self.draw_penalty_shootout()
@@ -1931,7 +2754,7 @@ class Game:
     # ---------------- MAIN LOOP ----------------
     
     def cleanup_and_exit(self):
-        """Cleanup function to reset highscores and scores before exiting the app"""
+        """Cleanup function to reset session scores before exiting the app (leaderboards are kept)"""
         # Reset all game scores before exiting
         self.score = 0
         self.p1_score = 0
@@ -1940,14 +2763,15 @@ class Game:
         self.current_q_index = 0
         self.quiz_data = []
         
-        # Reset highscore values to 0 for all difficulty levels
-        try:
-            self.highscores = {"kolay": 0, "orta": 0, "zor": 0}
-            DataManager.save_json(FILES["highscore"], self.highscores)
-            print(f"🔄 Highscores reset to 0 before exit: {self.highscores}")
-        except Exception as e:
-            print(f"⚠️ Warning: Could not reset highscores on exit: {e}")
-        
+        # A score still waiting for a name on the game over screen is not lost
+        if self.state == "GAMEOVER" and self.pending_score:
+            self.submit_pending_score()
+        self.answer_log.flush()
+        DataManager.ratings().save()
+        DataManager.practice().save()
+        if self.penalty_worker is not None:
+            self.penalty_worker.stop()
+
         print(f"🔄 Scores reset before exit")
         
         pygame.quit()
@@ -2051,10 +2875,27 @@ class Game:
                         if self.p2_input.active and not self.two_player_q_answered["p2"]:
                             self.p2_input.handle_event(event, submit_key=pygame.K_KP_ENTER, skip_mouse=True)
 
+                # --- OYUNCUYA ÖZEL MOD İSİM GİRİŞİ ---
+                if self.state == "PLAYER_SETUP":
+                    if self.setup_name_input.handle_event(event) is not None:
+                        self.start_player_mode()
+                        continue
+
+                # --- OYUN SONU İSİM GİRİŞİ ---
+                if self.state == "GAMEOVER" and self.pending_score:
+                    if self.name_input.handle_event(event) is not None:
+                        self.submit_pending_score()
+                        self.set_state("HIGHSCORE")
+                        continue
+
                 # --- ADMIN/DİĞER INPUTLAR ---
                 if self.state == "ADMIN":
                     self.admin_question_input.handle_event(event)
                     self.admin_answer_input.handle_event(event)
+                    previous_query = self.admin_search_input.text
+                    self.admin_search_input.handle_event(event)
+                    if self.admin_search_input.text != previous_query:
+                        self.update_admin_search()
 
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     mouse_click = True
@@ -2070,6 +2911,10 @@ class Game:
                             btn.update(mouse_pos, True)
                         self.buttons["back"].update(mouse_pos, True)
 
+                    if self.state == "PLAYER_SETUP":
+                        self.buttons["back_to_modes"].update(mouse_pos, True)
+                        self.setup_start_button.update(mouse_pos, True)
+
                     if self.state == "TWO_PLAYER_SETUP":
                         for btn in self.buttons["two_player_setup"]:
                             btn.update(mouse_pos, True)
@@ -2078,13 +2923,20 @@ class Game:
                         
                     if self.state in ["HIGHSCORE", "SETTINGS", "ADMIN"]:
                          self.buttons["back"].update(mouse_pos, True)
+
+                    if self.state == "HIGHSCORE":
+                        for btn in self.highscore_buttons.values():
+                            btn.update(mouse_pos, True)
                          
                     if self.state == "ADMIN":
                         for btn in self.admin_buttons.values():
                             btn.update(mouse_pos, True)
+                        for btn in list(self.admin_result_buttons):
+                            btn.update(mouse_pos, True)
 
                     if self.state == "GAMEOVER":
-                        if pygame.Rect(self.CX - 400, self.CY - 300, 800, 600).collidepoint(mouse_pos) or mouse_click:
+                        # İsim kutusuna tıklamak yazmaya devam etmektir; başka her yer menüye döner
+                        if not (self.pending_score and self.name_input.rect.collidepoint(mouse_pos)):
                              self.set_state("MENU")
 
                     if self.state == "TWO_PLAYER_GAMEOVER":
@@ -2109,7 +2961,7 @@ class Game:
                     if event.key == pygame.K_ESCAPE:
                         if self.state == "MENU": self.cleanup_and_exit()
                         elif self.state == "MODES_MENU": self.set_state("MENU")
-                        elif self.state == "TWO_PLAYER_SETUP": self.set_state("MODES_MENU")
+                        elif self.state in ["TWO_PLAYER_SETUP", "PLAYER_SETUP"]: self.set_state("MODES_MENU")
                         elif self.state in ["HIGHSCORE", "SETTINGS", "ADMIN", "GAMEOVER", "TWO_PLAYER_GAMEOVER"]: self.set_state("MENU")
                         elif self.state == "QUIZ": self.set_state("MENU") # Quiz'den çıkış
                         elif self.state == "TWO_PLAYER_QUIZ": self.set_state("MENU") # İki kişilik quiz'den çıkış
@@ -2124,12 +2976,19 @@ class Game:
                         if event.key == pygame.K_F3 or (event.key == pygame.K_3 and not is_typing): 
                             self.use_powerup("hint")
 
+                    if self.state == "HIGHSCORE":
+                        if event.key == pygame.K_LEFT: self.turn_highscore_page(-1)
+                        if event.key == pygame.K_RIGHT: self.turn_highscore_page(1)
+
                     if self.state == "SETTINGS":
                         if event.key == pygame.K_m: self.settings["music"] = not self.settings["music"]
                         if event.key == pygame.K_s: self.settings["sfx"] = not self.settings["sfx"]
                         if event.key == pygame.K_f:
                             self.settings["fullscreen"] = not self.settings["fullscreen"]
                             pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN if self.settings["fullscreen"] else 0)
+                        if event.key == pygame.K_g:
+                            i = QUESTION_SOURCES.index(self.settings["question_source"])
+                            self.settings["question_source"] = QUESTION_SOURCES[(i + 1) % len(QUESTION_SOURCES)]
 
             # Buton Hover Güncellemeleri
             if self.state == "MENU":
@@ -2143,15 +3002,25 @@ class Game:
                     btn.update(mouse_pos, False)
                  self.buttons["back"].update(mouse_pos, False)
             
+            elif self.state == "PLAYER_SETUP":
+                 self.buttons["back_to_modes"].update(mouse_pos, False)
+                 self.setup_start_button.update(mouse_pos, False)
+
             elif self.state == "TWO_PLAYER_SETUP":
                  for btn in self.buttons["two_player_setup"]:
                     btn.update(mouse_pos, False)
                  self.buttons["back_to_modes"].update(mouse_pos, False)
                  self.two_player_mode_toggle_button.update(mouse_pos, False)
             
+            elif self.state == "HIGHSCORE":
+                for btn in self.highscore_buttons.values():
+                    btn.update(mouse_pos, False)
+
             elif self.state == "ADMIN":
                 for btn in self.admin_buttons.values():
                     btn.update(mouse_pos, False)
+                for btn in self.admin_result_buttons:
+                    btn.update(mouse_pos, False)
 
             elif self.state == "QUIZ":
                  if self.settings["mode"] == "MCQ":
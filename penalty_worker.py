@@ -0,0 +1,281 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing.connection import Client, Listener
+
+# ------------------------------------------------
+# KALICI PENALTI SÜRECİ
+# ------------------------------------------------
+# Penaltının oyundan ayrı bir süreçte oynanması gerektiğinde (penaltıdaki bir çökme
+# oyunu düşürmesin diye) her penaltıda yeni Python süreci açmak yerine oyun açılırken
+# tek bir işçi süreç başlatılır. İşçi pygame'i ve penaltı görsellerini bir kez yükler,
+# gizli bir pencereyle bekler ve bağlantı üzerinden gelen komutları sırayla işler.
+#
+# İşçi multiprocessing.Process ile değil, `python penalty_worker.py --serve ADRES` olarak
+# başlatılır: "spawn" ile başlatılan süreç oyunun ana modülünü yeniden içe aktarır ve
+# oyun modülü içe aktarılırken kendi penceresini açar. İşçi, oyunun açtığı
+# multiprocessing.connection dinleyicisine (Unix soketi / Windows adlandırılmış borusu)
+# rastgele bir anahtarla bağlanır.
+#
+# Protokol (multiprocessing.Connection üzerinden sözlükler):
+#   işçi -> oyun   {"type": "ready", "load_ms": ...}                     açılış tamamlandı
+#   oyun -> işçi   {"cmd": "penalty", "goalkeeper": "p1", "attacker": "p2"}
+#   işçi -> oyun   {"type": "result", "ok": True, "saved": ..., "shot_direction": ...,
+#                   "ball_zone": ..., "keeper_zone": ..., "shooter_ms": ..., "keeper_ms": ...,
+#                   "duration_ms": ..., "aborted": ...}
+#                  {"type": "result", "ok": False, "error": "..."}
+#   oyun -> işçi   {"cmd": "prepare", ...}  sahneyi kurup ilk kareyi çizer (ölçüm için)
+#   oyun -> işçi   {"cmd": "ping"} -> {"type": "pong"},  {"cmd": "quit"}
+#
+# İşçi ölürse (çökme, pencere kapatma vb.) bekleyen penaltı PenaltyWorkerError ile
+# sonlanır ve işçi hemen yeniden başlatılır; sonraki penaltı yine önceden ısınmış
+# bir süreçte açılır.
+
+
+class PenaltyWorkerError(RuntimeError):
+    """İşçi süreç penaltı sonucunu döndüremeden öldü veya yanıt vermedi."""
+
+
+KEY_ENV = "PENALTY_WORKER_KEY"
+
+
+def serve(address, authkey):
+    """İşçi sürecin ana döngüsü (ayrı süreçte çalışır)."""
+    started = time.perf_counter()
+    conn = Client(address, authkey=authkey)
+    import pygame
+    import soccer
+
+    pygame.init()
+    # Görseller convert() için bir görüntü modu ister; pencere penaltıya kadar gizli kalır
+    soccer.screen = pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    soccer.load_all_images()
+    conn.send({"type": "ready", "load_ms": round((time.perf_counter() - started) * 1000, 1)})
+
+    def show():
+        soccer.screen = pygame.display.set_mode(pygame.display.get_desktop_sizes()[0], pygame.FULLSCREEN | pygame.SHOWN)
+        pygame.display.set_caption("Penalty Shootout 3D - Shooter First")
+
+    def hide():
+        soccer.screen = pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        pygame.event.clear()
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        command = message.get("cmd")
+        if command == "quit":
+            break
+        if command == "ping":
+            conn.send({"type": "pong"})
+            continue
+        if command not in ("penalty", "prepare"):
+            conn.send({"type": "result", "ok": False, "error": f"bilinmeyen komut: {command!r}"})
+            continue
+        t = time.perf_counter()
+        try:
+            show()
+            soccer.prepare_penalty(message["goalkeeper"], message["attacker"], embedded=True)
+            if command == "prepare":
+                soccer.draw()
+                pygame.display.flip()
+                reply = {"type": "prepared", "ok": True}
+            else:
+                soccer.run_game(quit_pygame=False, embedded=True)
+                reply = {"type": "result", "ok": True, **soccer.game.summary()}
+                # Pencere kapatıldıysa run_game QUIT olayını kuyruğa geri koyar
+                reply["aborted"] = bool(pygame.event.peek(pygame.QUIT))
+        except Exception as e:
+            reply = {"type": "result", "ok": False, "error": f"{type(e).__name__}: {e}"}
+        reply["duration_ms"] = round((time.perf_counter() - t) * 1000, 1)
+        hide()
+        conn.send(reply)
+    pygame.quit()
+
+
+class PenaltyWorker:
+    """Oyun tarafı: işçi süreci başlatır, komut gönderir, ölürse yeniden başlatır."""
+
+    def __init__(self, start_timeout=30.0):
+        self.start_timeout = start_timeout
+        self.process = None
+        self.conn = None
+        self.ready = False
+        self.load_ms = None
+        self.restarts = 0
+        self._accepting = None
+
+    def start(self):
+        """İşçiyi arka planda başlatır; ne bağlanmasını ne de hazır olmasını bekler."""
+        self.stop()
+        authkey = os.urandom(16)
+        listener = Listener(authkey=authkey)
+        here = os.path.dirname(os.path.abspath(__file__))
+        env = dict(os.environ, **{KEY_ENV: authkey.hex()})
+        self.process = subprocess.Popen(
+            [sys.executable, os.path.join(here, "penalty_worker.py"), "--serve", listener.address],
+            cwd=here, env=env,
+        )
+        accepted = []
+
+        def accept():
+            try:
+                accepted.append(listener.accept())
+            except OSError:
+                pass
+            finally:
+                listener.close()
+
+        thread = threading.Thread(target=accept, name="penalty-worker-accept", daemon=True)
+        thread.start()
+        self._accepting = (thread, accepted, listener)
+        self.ready = False
+        return self
+
+    def _connect(self):
+        """İşçinin bağlanmasını bekler (ilk komutta bir kez)."""
+        if self._accepting is None:
+            return
+        thread, accepted, listener = self._accepting
+        deadline = time.monotonic() + self.start_timeout
+        while thread.is_alive() and self.alive() and time.monotonic() < deadline:
+            thread.join(0.05)
+        self._accepting = None
+        if not accepted:
+            listener.close()
+            self._restart("penaltı süreci bağlanamadı")
+        self.conn = accepted[0]
+
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def ensure(self):
+        """İşçi ölmüşse yeniden başlatır."""
+        if not self.alive():
+            if self.process is not None:
+                self.restarts += 1
+                print(f"⚠️ Penaltı süreci kapanmış (çıkış kodu {self.process.returncode}), yeniden başlatılıyor")
+            self.start()
+
+    def stop(self):
+        if self._accepting is not None:
+            thread, accepted, listener = self._accepting
+            listener.close()
+            # Bağlantı, dinleyici kapanmadan hemen önce kabul edilmiş olabilir
+            thread.join(1.0)
+            for conn in accepted:
+                conn.close()
+            self._accepting = None
+        if self.conn is not None:
+            try:
+                self.conn.send({"cmd": "quit"})
+            except (OSError, ValueError):
+                pass
+            self.conn.close()
+            self.conn = None
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=2.0)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process = None
+        self.ready = False
+
+    def _restart(self, reason):
+        self.start()
+        self.restarts += 1
+        raise PenaltyWorkerError(f"{reason}, süreç yeniden başlatıldı")
+
+    def _receive(self, idle=None, timeout=None):
+        """Sıradaki yanıtı bekler ("ready" mesajını kendisi işler).
+
+        İşçi ölürse ya da `timeout` aşılırsa işçi yeniden başlatılır (yarım kalan yanıt
+        sonraki komutlara karışmasın diye) ve PenaltyWorkerError yükseltilir.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                if self.conn.poll(0.05):
+                    message = self.conn.recv()
+                    if message.get("type") != "ready":
+                        return message
+                    self.ready = True
+                    self.load_ms = message.get("load_ms")
+                    continue
+                dead = not self.alive()
+            except (EOFError, OSError):
+                dead = True
+            if dead:
+                self._restart(f"penaltı süreci kapandı (çıkış kodu {self.process.poll()})")
+            if deadline is not None and time.monotonic() > deadline:
+                self._restart("penaltı süreci zamanında yanıt vermedi")
+            if idle is not None:
+                idle()
+
+    def wait_ready(self, timeout=None):
+        """İşçi görselleri yükleyip hazır olana kadar bekler; yükleme süresini (ms) döndürür."""
+        self.request("ping", timeout=self.start_timeout if timeout is None else timeout)
+        return self.load_ms
+
+    def request(self, command, idle=None, timeout=None, **fields):
+        self.ensure()
+        self._connect()
+        try:
+            self.conn.send({"cmd": command, **fields})
+        except (OSError, ValueError) as e:
+            self._restart(f"penaltı sürecine komut gönderilemedi ({e})")
+        return self._receive(idle, timeout)
+
+    def run_penalty(self, goalkeeper, attacker, idle=None):
+        """Penaltıyı işçide oynatır ve sonuç sözlüğünü döndürür.
+
+        `idle`, beklerken düzenli çağrılır (ör. oyun penceresinin yanıt vermeye devam
+        etmesi için pygame.event.pump). İşçi içinde yakalanan hatalar "ok": False olarak
+        döner; işçi ölürse PenaltyWorkerError yükseltilir.
+        """
+        return self.request("penalty", idle, goalkeeper=goalkeeper, attacker=attacker)
+
+
+# ------------------------------------------------
+# BENCHMARK
+# ------------------------------------------------
+def benchmark(rounds=5):
+    """Isınmış işçide penaltı sahnesinin açılma süresi (yeni süreç açmakla karşılaştırma: soccer.py --bench)."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    t = time.perf_counter()
+    worker = PenaltyWorker().start()
+    worker.wait_ready()
+    print(f"İşçi açılışı (pygame + görseller): {(time.perf_counter() - t) * 1000:.0f} ms "
+          f"(işçi içinde {worker.load_ms} ms)")
+    times = []
+    for _ in range(rounds):
+        t = time.perf_counter()
+        reply = worker.request("prepare", goalkeeper="p1", attacker="p2", timeout=10)
+        times.append(time.perf_counter() - t)
+        assert reply.get("ok"), reply
+    print(f"Penaltı sahnesinin ilk karesi: {min(times) * 1000:.1f} ms (en iyi {rounds})")
+    worker.process.kill()
+    worker.process.wait()
+    t = time.perf_counter()
+    try:
+        worker.request("ping", timeout=10)
+    except PenaltyWorkerError as e:
+        print(f"Ölen işçi algılandı: {e}")
+    worker.wait_ready()
+    print(f"Yeniden başlatma + hazır olma: {(time.perf_counter() - t) * 1000:.0f} ms, yeniden başlatma sayısı {worker.restarts}")
+    worker.stop()
+
+
+if __name__ == "__main__":
+    # Kullanım: python penalty_worker.py --bench
+    #           (--serve ADRES: PenaltyWorker tarafından başlatılan işçi süreç)
+    if "--serve" in sys.argv:
+        serve(sys.argv[sys.argv.index("--serve") + 1], bytes.fromhex(os.environ[KEY_ENV]))
+    elif "--bench" in sys.argv:
+        benchmark()
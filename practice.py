@@ -0,0 +1,185 @@
+import heapq
+import json
+import os
+import random
+import sys
+import time
+
+# ------------------------------------------------
+# ARALIKLI TEKRAR (SM-2)
+# ------------------------------------------------
+# Oyuncunun gördüğü her soru için bir kart tutulur: bir sonraki tekrar zamanı,
+# aralık (gün), kolaylık katsayısı, art arda doğru sayısı ve unutma sayısı.
+# Kartlar SuperMemo-2 kuralıyla güncellenir: yanlış cevaplanan soru kısa süre
+# sonra geri gelir, doğru cevaplandıkça aralık 1 gün, 6 gün, sonra aralık x kolaylık
+# şeklinde uzar.
+#
+# Her oyuncunun kartları, tekrar zamanına göre bir min-heap'te de tutulur; sıradaki
+# tekrar O(log n) ile alınır. Güncellenen kart heap'e yeniden eklenir, eski kaydı
+# çekilirken (zamanı karttakiyle uyuşmadığı için) atlanır.
+#
+# Dosya biçimi (kompakt JSON):
+#   {"v": 1, "players": {isim: {soru_kimliği_hex: [zaman, aralık, kolaylık, tekrar, unutma]}}}
+
+VERSION = 1
+DAY = 86400
+START_EASE = 2.5
+MIN_EASE = 1.3
+RELEARN_SECONDS = 600       # yanlış cevaplanan soru 10 dakika sonra yeniden sorulur
+FAST_ANSWER_SECONDS = 5.0   # bu süreden hızlı doğru cevap "kusursuz" (kalite 5) sayılır
+
+
+def quality(correct, response_s):
+    """Cevabı SM-2 kalite notuna çevirir: yanlış 1, doğru 4, hızlı doğru 5."""
+    if not correct:
+        return 1
+    return 5 if response_s < FAST_ANSWER_SECONDS else 4
+
+
+def sm2(card, grade, now):
+    """Kartı [zaman, aralık, kolaylık, tekrar, unutma] SM-2 kuralıyla günceller (yerinde)."""
+    _, interval, ease, reps, lapses = card
+    if grade < 3:
+        reps = 0
+        lapses += 1
+        interval = RELEARN_SECONDS / DAY
+    else:
+        reps += 1
+        interval = 1.0 if reps == 1 else 6.0 if reps == 2 else interval * ease
+    ease = max(MIN_EASE, ease + 0.1 - (5 - grade) * (0.08 + (5 - grade) * 0.02))
+    card[:] = [int(now + interval * DAY), round(interval, 4), round(ease, 2), reps, lapses]
+    return card
+
+
+class Schedule:
+    """Tek bir oyuncunun kartları ve tekrar zamanına göre sıralı heap'i."""
+
+    def __init__(self, cards=None):
+        self.cards = cards or {}    # soru kimliği -> [zaman, aralık, kolaylık, tekrar, unutma]
+        self.heap = [(card[0], qid) for qid, card in self.cards.items()]
+        heapq.heapify(self.heap)
+
+    def __len__(self):
+        return len(self.cards)
+
+    def review(self, qid, grade, now=None):
+        """Cevabı karta işler (kart yoksa oluşturur) ve kartı döndürür."""
+        now = time.time() if now is None else now
+        card = self.cards.get(qid)
+        if card is None:
+            card = self.cards[qid] = [0, 0.0, START_EASE, 0, 0]
+        sm2(card, grade, now)
+        heapq.heappush(self.heap, (card[0], qid))
+        # Eski kayıtlar birikirse heap'i kartlardan yeniden kur
+        if len(self.heap) > 2 * len(self.cards) + 64:
+            self.heap = [(c[0], q) for q, c in self.cards.items()]
+            heapq.heapify(self.heap)
+        return card
+
+    def next_due(self, now=None, exclude=()):
+        """Zamanı gelmiş (`exclude` dışındaki) ilk kartın kimliğini döndürür; yoksa None."""
+        now = time.time() if now is None else now
+        heap = self.heap
+        skipped = []   # zamanı gelmiş ama bu oturumda sorulmuş kartlar: sonra geri konur
+        found = None
+        while heap:
+            due, qid = heap[0]
+            if self.cards.get(qid, (None,))[0] != due:
+                heapq.heappop(heap)     # kart yeniden çalışılmış: eski kayıt atılır
+                continue
+            if due > now:
+                break
+            if qid not in exclude:
+                found = qid
+                break
+            skipped.append(heapq.heappop(heap))
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+        return found
+
+    def due_count(self, now=None):
+        now = time.time() if now is None else now
+        return sum(1 for card in self.cards.values() if card[0] <= now)
+
+
+class PracticeStore:
+    """Oyuncu adı -> Schedule; JSON dosyasına atomik olarak kaydedilir."""
+
+    def __init__(self, path):
+        self.path = path
+        self.players = {}
+        self.dirty = False
+
+    def schedule(self, name):
+        if name not in self.players:
+            self.players[name] = Schedule()
+        return self.players[name]
+
+    def review(self, name, qid, correct, response_s, now=None):
+        self.dirty = True
+        return self.schedule(name).review(qid, quality(correct, response_s), now)
+
+    @classmethod
+    def load(cls, path):
+        store = cls(path)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for name, cards in data.get("players", {}).items():
+                store.players[name] = Schedule({int(qid, 16): list(card) for qid, card in cards.items()})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError) as e:
+            print(f"⚠️ Tekrar takvimi okunamadı, boş takvimle devam ediliyor: {e}")
+        return store
+
+    def save(self):
+        if not self.dirty:
+            return
+        data = {
+            "v": VERSION,
+            "players": {
+                name: {f"{qid:x}": card for qid, card in schedule.cards.items()}
+                for name, schedule in self.players.items()
+            },
+        }
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError as e:
+            print(f"❌ Tekrar takvimi kaydedilemedi: {e}")
+
+
+# ------------------------------------------------
+# BENCHMARK
+# ------------------------------------------------
+def benchmark(cards=100_000, reviews=50_000):
+    """Binlerce kartlı bir oyuncuda sıradaki tekrarı alma + cevabı işleme süresini ölçer."""
+    rng = random.Random(1)
+    now = time.time()
+    schedule = Schedule()
+    for qid in range(cards):
+        schedule.review(qid, rng.choice((1, 4, 5)), now - rng.randrange(30 * DAY))
+    t = time.perf_counter()
+    for i in range(reviews):
+        clock = now + i * 60
+        qid = schedule.next_due(clock)
+        if qid is None:
+            qid = rng.randrange(cards)
+        schedule.review(qid, rng.choice((1, 4, 4, 5)), clock)
+    us = (time.perf_counter() - t) / reviews * 1e6
+    print(f"{cards} kart: sıradaki tekrar + güncelleme {us:.1f} µs, heap {len(schedule.heap)} kayıt")
+
+
+if __name__ == "__main__":
+    # Kullanım: python practice.py [data/practice.json]  -> oyuncu başına bekleyen tekrarlar
+    #           python practice.py --bench
+    if "--bench" in sys.argv:
+        benchmark()
+        sys.exit()
+    store = PracticeStore.load(sys.argv[1] if len(sys.argv) > 1 else "data/practice.json")
+    for name, schedule in sorted(store.players.items()):
+        print(f"{name}: {len(schedule)} kart, {schedule.due_count()} tekrar bekliyor")
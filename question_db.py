@@ -0,0 +1,227 @@
+import json
+import os
+import random
+import sqlite3
+import sys
+
+# ------------------------------------------------
+# SQLITE SORU BANKASI
+# ------------------------------------------------
+# data/questions.json yerine kullanılabilen isteğe bağlı arka uç.
+# Varsayılan arka uç hâlâ JSON'dur (bkz. QUESTION_BACKEND).
+
+LEVELS = ("kolay", "orta", "zor")
+
+# Tabloda ayrı kolonu olan alanlar; geri kalan her şey "extra" içinde JSON olarak saklanır
+COLUMNS = ("q", "a", "type", "kategori", "mod")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY,
+    level TEXT NOT NULL,
+    q TEXT NOT NULL,
+    a TEXT NOT NULL,
+    type TEXT,
+    kategori TEXT,
+    mod TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_questions_level ON questions(level, id);
+CREATE INDEX IF NOT EXISTS idx_questions_type ON questions(type, level);
+CREATE INDEX IF NOT EXISTS idx_questions_kategori ON questions(kategori, level);
+"""
+
+
+class QuestionDB:
+    """Soruları seviye, tür ve kategori indeksli bir SQLite dosyasında tutar."""
+
+    def __init__(self, path):
+        self.path = path
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    # ---------------- YARDIMCILAR ----------------
+
+    @staticmethod
+    def _where(level=None, type=None, kategori=None):
+        """Filtrelerden WHERE cümlesi ve parametre listesi üretir."""
+        clauses, params = [], []
+        for column, value in (("level", level), ("type", type), ("kategori", kategori)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        return where, params
+
+    @staticmethod
+    def _row_to_question(row):
+        question = {"id": row["id"], "q": row["q"], "a": row["a"]}
+        for column in ("type", "kategori", "mod"):
+            if row[column] is not None:
+                question[column] = row[column]
+        if row["extra"]:
+            question.update(json.loads(row["extra"]))
+        return question
+
+    @staticmethod
+    def _question_to_row(level, question):
+        extra = {k: v for k, v in question.items() if k not in COLUMNS and k != "id"}
+        return (
+            level,
+            str(question["q"]),
+            str(question["a"]),
+            question.get("type"),
+            question.get("kategori"),
+            question.get("mod"),
+            json.dumps(extra, ensure_ascii=False) if extra else None,
+        )
+
+    # ---------------- SORGULAR ----------------
+
+    def count(self, level=None, type=None, kategori=None):
+        where, params = self._where(level, type, kategori)
+        return self.conn.execute(f"SELECT COUNT(*) FROM questions{where}", params).fetchone()[0]
+
+    def level_questions(self, level):
+        """Bir seviyedeki tüm soruları eklenme sırasıyla döndürür."""
+        return self.page(level=level, page=0, page_size=-1)
+
+    def page(self, level=None, page=0, page_size=50, type=None, kategori=None):
+        """Filtrelenmiş sonuçların `page`. sayfasını (0 tabanlı) döndürür."""
+        where, params = self._where(level, type, kategori)
+        rows = self.conn.execute(
+            f"SELECT * FROM questions{where} ORDER BY id LIMIT ? OFFSET ?",
+            params + [page_size, max(0, page) * max(0, page_size)],
+        ).fetchall()
+        return [self._row_to_question(r) for r in rows]
+
+    def sample(self, k, level=None, type=None, kategori=None, rng=None):
+        """Filtreye uyan sorulardan tekrarsız `k` tanesini rastgele seçer.
+
+        Yalnızca id'ler indeks üzerinden okunur; tam satırlar sadece seçilenler için çekilir.
+        """
+        rng = rng or random
+        where, params = self._where(level, type, kategori)
+        ids = [r[0] for r in self.conn.execute(f"SELECT id FROM questions{where}", params)]
+        chosen = rng.sample(ids, min(k, len(ids)))
+        if not chosen:
+            return []
+        placeholders = ",".join("?" * len(chosen))
+        rows = self.conn.execute(f"SELECT * FROM questions WHERE id IN ({placeholders})", chosen)
+        by_id = {r["id"]: self._row_to_question(r) for r in rows}
+        return [by_id[i] for i in chosen]
+
+    # ---------------- DEĞİŞİKLİKLER ----------------
+
+    def add(self, level, question):
+        """Yeni soruyu ekler ve id'sini döndürür."""
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO questions (level, q, a, type, kategori, mod, extra) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._question_to_row(level, question),
+            )
+        return cur.lastrowid
+
+    def pop_last(self, level):
+        """Seviyeye en son eklenen soruyu siler ve döndürür (yoksa None)."""
+        row = self.conn.execute(
+            "SELECT * FROM questions WHERE level = ? ORDER BY id DESC LIMIT 1", (level,)
+        ).fetchone()
+        if row is None:
+            return None
+        with self.conn:
+            self.conn.execute("DELETE FROM questions WHERE id = ?", (row["id"],))
+        return self._row_to_question(row)
+
+    def update_at(self, level, position, changes, drop=()):
+        """Seviyedeki `position`. (eklenme sırasına göre, 0 tabanlı) soruyu günceller.
+
+        `changes` mevcut alanların üzerine yazılır, `drop` içindeki alanlar silinir.
+        (eski, yeni) soru çiftini döndürür; böyle bir soru yoksa None.
+        """
+        row = self.conn.execute(
+            "SELECT * FROM questions WHERE level = ? ORDER BY id LIMIT 1 OFFSET ?", (level, position)
+        ).fetchone()
+        if row is None:
+            return None
+        old = self._row_to_question(row)
+        new = {k: v for k, v in {**old, **changes}.items() if k not in drop}
+        with self.conn:
+            self.conn.execute(
+                "UPDATE questions SET level = ?, q = ?, a = ?, type = ?, kategori = ?, mod = ?, extra = ? WHERE id = ?",
+                self._question_to_row(level, new) + (row["id"],),
+            )
+        return old, new
+
+    def insert_many(self, pairs):
+        """(seviye, soru) çiftlerini ekler; transaction'ı çağıran yönetir.
+
+        Birden çok çağrının tek bir `with db.conn:` bloğunda yapılması, toplu
+        içe aktarmanın tek seferde (ya hep ya hiç) yazılmasını sağlar.
+        """
+        self.conn.executemany(
+            "INSERT INTO questions (level, q, a, type, kategori, mod, extra) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (self._question_to_row(level, q) for level, q in pairs),
+        )
+
+    def iter_questions(self):
+        """Tüm soruları (seviye, soru) olarak id sırasıyla, belleğe almadan dolaşır."""
+        for row in self.conn.execute("SELECT * FROM questions ORDER BY id"):
+            question = self._row_to_question(row)
+            question.pop("id")
+            yield row["level"], question
+
+    # ---------------- GÖÇ (MIGRATION) ----------------
+
+    def import_json(self, source, replace=True):
+        """questions.json içeriğini (yol veya sözlük) veritabanına aktarır.
+
+        replace=True ise mevcut sorular silinir; işlem tek bir transaction içinde yapılır.
+        Aktarılan soru sayısını döndürür.
+        """
+        if isinstance(source, str):
+            with open(source, "r", encoding="utf-8") as f:
+                source = json.load(f)
+
+        rows = [
+            self._question_to_row(level, q)
+            for level, questions in source.items()
+            for q in questions
+        ]
+        with self.conn:
+            if replace:
+                self.conn.execute("DELETE FROM questions")
+            self.conn.executemany(
+                "INSERT INTO questions (level, q, a, type, kategori, mod, extra) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def export(self):
+        """Veritabanını questions.json biçiminde ({seviye: [soru, ...]}) döndürür."""
+        data = {level: [] for level in LEVELS}
+        for row in self.conn.execute("SELECT * FROM questions ORDER BY id"):
+            question = self._row_to_question(row)
+            question.pop("id")
+            data.setdefault(row["level"], []).append(question)
+        return data
+
+
+if __name__ == "__main__":
+    # Kullanım: python question_db.py [data/questions.json] [data/questions.db]
+    json_path = sys.argv[1] if len(sys.argv) > 1 else "data/questions.json"
+    db_path = sys.argv[2] if len(sys.argv) > 2 else "data/questions.db"
+
+    db = QuestionDB(db_path)
+    total = db.import_json(json_path)
+    print(f"{total} soru aktarıldı: {json_path} -> {db_path}")
+    for level in LEVELS:
+        print(f"  {level}: {db.count(level=level)}")
+    db.close()
@@ -0,0 +1,231 @@
+import hashlib
+import heapq
+import json
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+
+from answers import expand_superscripts, normalize_answer, turkish_lower
+
+# ------------------------------------------------
+# SORU İNDEKSLERİ
+# ------------------------------------------------
+# Soru bankası üzerinde bellekte tutulan indeksler. Her seviye ilk ihtiyaçta bir
+# kez indekslenir, sonra admin panelindeki ekleme/silmelerle artımlı güncellenir;
+# böylece kayıt sırasında JSON dosyasının taranması gerekmez.
+
+
+def question_key(text) -> str:
+    """Tekrar kontrolü için soru metninin normalize biçimi.
+
+    Büyük/küçük harf (Türkçe I/İ dahil), boşluklar, üst simgeler ve sondaki soru
+    işareti farkları yok sayılır: "5 + 7 = ?" ile "5+7=?" aynı anahtarı verir.
+    """
+    return normalize_answer(str(text)).rstrip("?").rstrip("=")
+
+
+def key_hash(text) -> int:
+    """question_key'in 8 baytlık özeti (toplu içe aktarma ve analitik kayıtları için)."""
+    return int.from_bytes(hashlib.blake2b(question_key(text).encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class DuplicateIndex:
+    """Normalize soru metni -> adet (seviye başına) hash indeksi; sorgular O(1)."""
+
+    def __init__(self):
+        self.levels = {}
+
+    def is_built(self, level):
+        return level in self.levels
+
+    def build(self, level, questions):
+        self.levels[level] = Counter(question_key(q["q"]) for q in questions)
+
+    def add(self, level, text):
+        self.levels.setdefault(level, Counter())[question_key(text)] += 1
+
+    def remove(self, level, text):
+        keys = self.levels.get(level)
+        if keys is None:
+            return
+        key = question_key(text)
+        keys[key] -= 1
+        if keys[key] <= 0:
+            del keys[key]
+
+    def find(self, text):
+        """Aynı metin indekslenmiş seviyelerden birinde varsa o seviyeyi, yoksa None döndürür."""
+        key = question_key(text)
+        for level, keys in self.levels.items():
+            if key in keys:
+                return level
+        return None
+
+    def duplicates(self, level):
+        """Seviyede birden fazla kez geçen anahtarlar ve adetleri."""
+        return {k: n for k, n in self.levels.get(level, {}).items() if n > 1}
+
+
+# Kelimeler (Türkçe harfler ve rakamlar dahil) ve tek tek matematik sembolleri
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+
+# Bu uzunluğa kadar her önek ayrı bir anahtar olarak indekslenir
+MAX_PREFIX = 12
+
+
+def tokenize(text):
+    """Metni aramada kullanılan parçalara böler: "∫ X² dx" -> ["∫", "x", "^", "2", "dx"]."""
+    return _TOKEN.findall(expand_superscripts(turkish_lower(str(text))))
+
+
+class SearchIndex:
+    """Soru ve cevap metinleri üzerinde önek aramalı ters (inverted) indeks.
+
+    Her parçanın ilk MAX_PREFIX karaktere kadarki tüm önekleri doküman kümelerine
+    eşlenir; böylece yazılırken aranan (yarım) kelime tek bir sözlük erişimiyle
+    bulunur. Sorgudaki her parça bir önek olarak eşleşmelidir (VE). Sıralama: önce
+    tüm parçaları tam kelime olarak içeren sorular, sonra diğerleri; her grupta
+    kısa sorular önce.
+
+    Doküman numarası (soru uzunluğu << 32 | sıra no) olarak verilir; böylece
+    numaraların doğal sırası sıralama ölçütüdür ve en iyi sonuçlar anahtar
+    fonksiyonu olmadan seçilir.
+    """
+
+    def __init__(self):
+        self.prefixes = defaultdict(set)    # önek -> doc id'ler
+        self.exact = defaultdict(set)       # tam parça -> doc id'ler
+        self.level_docs = defaultdict(set)  # seviye -> doc id'ler
+        self.docs = {}          # doc id -> (seviye, sıra, soru, cevap, parçalar)
+        self.positions = {}     # (seviye, sıra) -> doc id
+        self.next_seq = 0
+
+    def __len__(self):
+        return len(self.docs)
+
+    @staticmethod
+    def _prefixes(tokens):
+        keys = set()
+        for token in tokens:
+            for i in range(1, min(len(token), MAX_PREFIX) + 1):
+                keys.add(token[:i])
+        return keys
+
+    @staticmethod
+    def _discard(table, key, doc_id):
+        ids = table[key]
+        ids.discard(doc_id)
+        if not ids:
+            del table[key]
+
+    def build(self, level, questions):
+        for position, q in enumerate(questions):
+            self.add(level, position, q)
+
+    def add(self, level, position, question):
+        """Soruyu (seviye, sıra) konumuyla indeksler; konumda eski bir soru varsa yerini alır."""
+        if (level, position) in self.positions:
+            self.remove(level, position)
+        q, a = str(question["q"]), str(question["a"])
+        doc_id = (len(q) << 32) | self.next_seq
+        self.next_seq += 1
+        tokens = frozenset(tokenize(q) + tokenize(a))
+        for key in self._prefixes(tokens):
+            self.prefixes[key].add(doc_id)
+        for token in tokens:
+            self.exact[token].add(doc_id)
+        self.level_docs[level].add(doc_id)
+        self.docs[doc_id] = (level, position, q, a, tokens)
+        self.positions[(level, position)] = doc_id
+
+    def remove(self, level, position):
+        doc_id = self.positions.pop((level, position), None)
+        if doc_id is None:
+            return
+        tokens = self.docs.pop(doc_id)[4]
+        for key in self._prefixes(tokens):
+            self._discard(self.prefixes, key, doc_id)
+        for token in tokens:
+            self._discard(self.exact, token, doc_id)
+        self._discard(self.level_docs, level, doc_id)
+
+    def search(self, query, limit=8, level=None):
+        """Sorguya uyan en iyi `limit` sonucu [(seviye, sıra, soru, cevap), ...] olarak döndürür."""
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        sets = []
+        for term in terms:
+            ids = self.prefixes.get(term[:MAX_PREFIX])
+            if not ids:
+                return []
+            sets.append(ids)
+        if level is not None:
+            sets.append(self.level_docs.get(level, set()))
+        sets.sort(key=len)
+        candidates = sets[0].intersection(*sets[1:])
+
+        long_terms = [t for t in terms if len(t) > MAX_PREFIX]
+        if long_terms:
+            candidates = {
+                d for d in candidates
+                if all(any(tok.startswith(t) for tok in self.docs[d][4]) for t in long_terms)
+            }
+
+        # Önce tüm parçaları tam kelime olarak içerenler, sonra yalnızca önek olarak eşleşenler
+        exact_sets = sorted((self.exact.get(t, set()) for t in terms), key=len)
+        whole = exact_sets[0].intersection(*exact_sets[1:], candidates)
+        picked = heapq.nsmallest(limit, whole)
+        if len(picked) < limit:
+            picked += heapq.nsmallest(limit - len(picked), candidates - whole if whole else candidates)
+        return [self.docs[d][:4] for d in picked]
+
+
+# ------------------------------------------------
+# BENCHMARK
+# ------------------------------------------------
+def benchmark(path="data/questions.json", size=100_000, repeat=200):
+    """Soru bankasını üretilmiş sorularla `size` soruya tamamlayıp arama süresini ölçer."""
+    from generator import generate
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    index = SearchIndex()
+    t = time.perf_counter()
+    for level, questions in data.items():
+        index.build(level, questions)
+    filler = size - len(index)
+    for i, level in enumerate(("kolay", "orta")):
+        extra = generate(level, filler // 2, seed=i)
+        offset = len(data.get(level, []))
+        for position in range(len(extra)):
+            index.add(level, offset + position, extra[position])
+    print(f"{len(index)} soru indekslendi: {(time.perf_counter() - t) * 1000:.0f} ms")
+
+    for query in ("türev", "x kaç", "∫", "√", "log", "ış", "12 x", "15", "x^2"):
+        t = time.perf_counter()
+        for _ in range(repeat):
+            results = index.search(query)
+        ms = (time.perf_counter() - t) / repeat * 1000
+        first = results[0][2] if results else "-"
+        print(f"  {query!r:>9}: {ms:.3f} ms, ilk sonuç: {first}")
+
+
+if __name__ == "__main__":
+    # Kullanım: python question_index.py [data/questions.json] [--bench]
+    # Soru bankasında zaten bulunan tekrarları listeler; --bench arama süresini ölçer.
+    args = [a for a in sys.argv[1:] if a != "--bench"]
+    path = args[0] if args else "data/questions.json"
+    if "--bench" in sys.argv:
+        benchmark(path)
+        sys.exit()
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    index = DuplicateIndex()
+    for level, questions in data.items():
+        index.build(level, questions)
+        dups = index.duplicates(level)
+        print(f"{level}: {len(questions)} soru, {len(dups)} tekrar eden metin")
+        for key, n in dups.items():
+            print(f"    {n}x {key}")
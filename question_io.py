@@ -0,0 +1,394 @@
+import argparse
+import csv
+import json
+import os
+import shutil
+import tempfile
+import time
+import unicodedata
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from answers import turkish_lower
+from question_db import LEVELS, QuestionDB
+from question_index import key_hash
+
+# ------------------------------------------------
+# TOPLU İÇE / DIŞA AKTARMA (CSV, JSONL)
+# ------------------------------------------------
+# Öğretmenlerden gelen CSV / JSONL dosyaları soru bankasına akış halinde aktarılır:
+# dosya parçalar (batch) halinde okunur, ayrıştırma + normalizasyon + doğrulama bir
+# süreç havuzunda yapılır, sonuç tek geçişte ve atomik olarak yazılır.
+#
+# Bellek kullanımı satır sayısından bağımsızdır: havuzda aynı anda en fazla
+# 2 x işçi sayısı kadar parça bulunur, geçerli sorular seviye başına geçici
+# dosyalara biriktirilir. Tekrar kontrolü için soru başına yalnızca 8 baytlık
+# bir özet (hash) tutulur.
+#
+# Elektronik tablolar (Excel, Sheets) önce CSV (UTF-8) olarak dışa aktarılmalıdır.
+#
+# Kullanım:
+#   python question_io.py import sorular.csv [--level kolay] [--backend json|sqlite]
+#   python question_io.py export cikti.jsonl [--backend json|sqlite]
+
+DEFAULT_JSON = "data/questions.json"
+DEFAULT_DB = "data/questions.db"
+
+BATCH_SIZE = 2000
+MAX_QUESTION_LENGTH = 500
+MAX_ANSWER_LENGTH = 100
+
+# Dosyadaki kolon adları -> soru alanları (Türkçe başlıklar da kabul edilir)
+COLUMN_ALIASES = {
+    "level": "level", "seviye": "level",
+    "q": "q", "soru": "q", "question": "q",
+    "a": "a", "cevap": "a", "answer": "a",
+    "type": "type", "tür": "type", "tur": "type",
+    "kategori": "kategori", "category": "kategori",
+    "mod": "mod",
+    "extra": "extra",
+}
+LEVEL_ALIASES = {"easy": "kolay", "medium": "orta", "hard": "zor", "1": "kolay", "2": "orta", "3": "zor"}
+
+# Dışa aktarılan CSV kolonları; diğer alanlar "extra" kolonunda JSON olarak yazılır
+CSV_COLUMNS = ("level", "q", "a", "type", "kategori", "mod", "extra")
+
+
+class RowError(ValueError):
+    pass
+
+
+def _clean(text):
+    """Unicode NFC + boşlukları tek boşluğa indirir (tablo çıktılarındaki farkları giderir)."""
+    return " ".join(unicodedata.normalize("NFC", str(text)).split())
+
+
+def normalize_row(record, default_level=None):
+    """Ham kaydı (sözlük) doğrular ve (seviye, soru) döndürür; hatada RowError."""
+    level = _clean(record.get("level") or default_level or "")
+    level = turkish_lower(level)
+    level = LEVEL_ALIASES.get(level, level)
+    if level not in LEVELS:
+        raise RowError(f"geçersiz seviye: {level!r}")
+
+    # JSONL'de cevap sayı olabilir; 0 gibi değerler boş sayılmamalı
+    q = _clean(record["q"]) if record.get("q") is not None else ""
+    a = _clean(record["a"]) if record.get("a") is not None else ""
+    if not q:
+        raise RowError("soru metni boş")
+    if not a:
+        raise RowError("cevap boş")
+    if len(q) > MAX_QUESTION_LENGTH:
+        raise RowError(f"soru metni çok uzun ({len(q)} karakter)")
+    if len(a) > MAX_ANSWER_LENGTH:
+        raise RowError(f"cevap çok uzun ({len(a)} karakter)")
+
+    question = {"q": q, "a": a, "type": _clean(record.get("type") or "classic")}
+    for field in ("kategori", "mod"):
+        if record.get(field):
+            question[field] = _clean(record[field])
+    extra = record.get("extra")
+    if isinstance(extra, str) and extra.strip():
+        try:
+            extra = json.loads(extra)
+        except ValueError:
+            raise RowError("extra kolonu geçerli JSON değil")
+    if isinstance(extra, dict):
+        question.update({k: v for k, v in extra.items() if k not in question})
+    return level, question
+
+
+def process_batch(kind, header, items, first_line, default_level):
+    """İşçi süreçte çalışır: bir parçayı ayrıştırır ve doğrular.
+
+    (geçerli [(satır, seviye, soru, özet)], hatalar [(satır, mesaj)]) döndürür.
+    """
+    valid, errors = [], []
+    for offset, item in enumerate(items):
+        line = first_line + offset
+        try:
+            if kind == "jsonl":
+                if not item.strip():
+                    continue
+                try:
+                    raw = json.loads(item)
+                except ValueError as e:
+                    raise RowError(f"geçersiz JSON: {e}")
+                if not isinstance(raw, dict):
+                    raise RowError("satır bir JSON nesnesi değil")
+                record = {COLUMN_ALIASES.get(turkish_lower(k), k): v for k, v in raw.items()}
+                extra = {k: v for k, v in record.items() if k not in COLUMN_ALIASES.values()}
+                if extra:
+                    nested = record.get("extra")
+                    if nested is None:
+                        nested = {}
+                    elif isinstance(nested, str) and nested.strip():
+                        try:
+                            nested = json.loads(nested)
+                        except ValueError:
+                            raise RowError("extra kolonu geçerli JSON değil")
+                    if not isinstance(nested, dict):
+                        raise RowError("extra kolonu bir JSON nesnesi değil")
+                    record["extra"] = {**extra, **nested}
+            else:
+                if not any(cell.strip() for cell in item):
+                    continue
+                record = {name: value for name, value in zip(header, item) if name}
+            level, question = normalize_row(record, default_level)
+            valid.append((line, level, question, key_hash(question["q"])))
+        except (RowError, ValueError) as e:
+            errors.append((line, str(e)))
+    return valid, errors
+
+
+def read_batches(path, batch_size=BATCH_SIZE):
+    """Dosyayı parça parça okur; (tür, başlık, öğeler, ilk satır no) üretir."""
+    kind = "jsonl" if path.lower().endswith((".jsonl", ".ndjson")) else "csv"
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if kind == "jsonl":
+            header, line, batch = None, 1, []
+            for text in f:
+                batch.append(text)
+                if len(batch) >= batch_size:
+                    yield kind, header, batch, line
+                    line += len(batch)
+                    batch = []
+            if batch:
+                yield kind, header, batch, line
+            return
+
+        try:
+            dialect = csv.Sniffer().sniff(f.read(4096), delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        f.seek(0)
+        reader = csv.reader(f, dialect)
+        header_row = next(reader, [])
+        header = [COLUMN_ALIASES.get(turkish_lower(name.strip()), None) for name in header_row]
+        if "q" not in header or "a" not in header:
+            raise SystemExit(f"CSV başlığında soru ve cevap kolonları yok: {header_row}")
+        # Satır numarası tablo satırıdır (başlık 1. satır), çok satırlı hücreler tek sayılır
+        batch, line = [], 2
+        for row in reader:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield kind, header, batch, line
+                line += len(batch)
+                batch = []
+        if batch:
+            yield kind, header, batch, line
+
+
+def parallel_batches(path, default_level, workers):
+    """Parçaları havuzda işler; sonuçları dosya sırasıyla, sınırlı sayıda parça bekleterek verir."""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for kind, header, items, first_line in read_batches(path):
+            pending.append(pool.submit(process_batch, kind, header, items, first_line, default_level))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# ---------------- YAZICILAR ----------------
+
+def _question_block(question):
+    """save_json (indent=4) biçimiyle aynı görünen, seviye listesi içindeki soru bloğu."""
+    text = json.dumps(question, ensure_ascii=False, indent=4)
+    return "\n".join("        " + line for line in text.splitlines())
+
+
+class JsonBankWriter:
+    """Yeni soruları seviye başına geçici dosyalarda biriktirir, sonunda questions.json'u
+    mevcut sorular + yeniler olarak tek geçişte yeniden yazar (tmp + os.replace)."""
+
+    def __init__(self, path):
+        self.path = path
+        existing = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                existing = json.load(f)
+        self.existing = existing
+        self.spools = {}
+
+    def existing_hashes(self):
+        return {key_hash(q["q"]) for questions in self.existing.values() for q in questions}
+
+    def add(self, level, question):
+        spool = self.spools.get(level)
+        if spool is None:
+            spool = self.spools[level] = tempfile.TemporaryFile("w+", encoding="utf-8")
+        spool.write(",\n" + _question_block(question))
+
+    def commit(self):
+        tmp_path = self.path + ".tmp"
+        levels = list(self.existing) + [lv for lv in LEVELS if lv not in self.existing and lv in self.spools]
+        with open(tmp_path, "w", encoding="utf-8") as out:
+            out.write("{")
+            for i, level in enumerate(levels):
+                out.write(("," if i else "") + f"\n    {json.dumps(level, ensure_ascii=False)}: [")
+                blocks = [_question_block(q) for q in self.existing.get(level, [])]
+                body = ",\n".join(blocks)
+                spool = self.spools.get(level)
+                if body:
+                    out.write("\n" + body)
+                if spool is not None:
+                    spool.seek(0)
+                    if not body:
+                        spool.read(1)  # Baştaki virgülü atla
+                    shutil.copyfileobj(spool, out)
+                out.write("\n    ]" if body or spool is not None else "]")
+            out.write("\n}")
+        os.replace(tmp_path, self.path)
+        self.close()
+
+    def close(self):
+        for spool in self.spools.values():
+            spool.close()
+        self.spools = {}
+
+
+class SqliteBankWriter:
+    """Tüm eklemeleri tek bir transaction içinde yapar; hata olursa hiçbiri yazılmaz."""
+
+    def __init__(self, path):
+        self.db = QuestionDB(path)
+        self.db.conn.execute("BEGIN")
+        self.batch = []
+
+    def existing_hashes(self):
+        return {key_hash(row[0]) for row in self.db.conn.execute("SELECT q FROM questions")}
+
+    def add(self, level, question):
+        self.batch.append((level, question))
+        if len(self.batch) >= BATCH_SIZE:
+            self.db.insert_many(self.batch)
+            self.batch = []
+
+    def commit(self):
+        if self.batch:
+            self.db.insert_many(self.batch)
+        self.db.conn.commit()
+        self.db.close()
+
+    def close(self):
+        self.db.conn.rollback()
+        self.db.close()
+
+
+# ---------------- KOMUTLAR ----------------
+
+def import_file(path, backend="json", bank_path=None, default_level=None, workers=None,
+                allow_duplicates=False, errors_path=None, show_errors=20):
+    """Dosyayı soru bankasına aktarır ve özet istatistikleri döndürür."""
+    workers = workers or os.cpu_count() or 1
+    if backend == "sqlite":
+        writer = SqliteBankWriter(bank_path or DEFAULT_DB)
+    else:
+        writer = JsonBankWriter(bank_path or DEFAULT_JSON)
+    seen = set() if allow_duplicates else writer.existing_hashes()
+    stats = {"rows": 0, "added": 0, "errors": 0, "duplicates": 0}
+    error_file = open(errors_path, "w", encoding="utf-8", newline="") if errors_path else None
+    error_writer = csv.writer(error_file) if error_file else None
+    if error_writer:
+        error_writer.writerow(("satır", "hata"))
+
+    started = time.perf_counter()
+    try:
+        reported = 0
+        for valid, errors in parallel_batches(path, default_level, workers):
+            stats["rows"] += len(valid) + len(errors)
+            stats["errors"] += len(errors)
+            for line, level, question, digest in valid:
+                if not allow_duplicates:
+                    if digest in seen:
+                        errors.append((line, "tekrar eden soru"))
+                        stats["duplicates"] += 1
+                        continue
+                    seen.add(digest)
+                writer.add(level, question)
+                stats["added"] += 1
+            for line, message in sorted(errors):
+                if error_writer:
+                    error_writer.writerow((line, message))
+                if reported < show_errors:
+                    print(f"  satır {line}: {message}")
+                    reported += 1
+        writer.commit()
+    except BaseException:
+        writer.close()
+        raise
+    finally:
+        if error_file:
+            error_file.close()
+    stats["seconds"] = time.perf_counter() - started
+    return stats
+
+
+def export_bank(path, backend="json", bank_path=None):
+    """Soru bankasını CSV veya JSONL olarak (atomik) dışa aktarır; yazılan soru sayısını döndürür."""
+    if backend == "sqlite":
+        db = QuestionDB(bank_path or DEFAULT_DB)
+        pairs = db.iter_questions()
+    else:
+        db = None
+        with open(bank_path or DEFAULT_JSON, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        pairs = ((level, q) for level, questions in data.items() for q in questions)
+
+    count = 0
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="") as out:
+        if path.lower().endswith((".jsonl", ".ndjson")):
+            for level, q in pairs:
+                out.write(json.dumps({"level": level, **q}, ensure_ascii=False) + "\n")
+                count += 1
+        else:
+            writer = csv.writer(out)
+            writer.writerow(CSV_COLUMNS)
+            for level, q in pairs:
+                extra = {k: v for k, v in q.items() if k not in CSV_COLUMNS}
+                writer.writerow((level, q["q"], q["a"], q.get("type", ""), q.get("kategori", ""),
+                                 q.get("mod", ""), json.dumps(extra, ensure_ascii=False) if extra else ""))
+                count += 1
+    os.replace(tmp_path, path)
+    if db is not None:
+        db.close()
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Soru bankası toplu içe/dışa aktarma (CSV, JSONL)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    imp = sub.add_parser("import", help="CSV/JSONL dosyasını soru bankasına ekler")
+    imp.add_argument("file")
+    imp.add_argument("--level", help="Seviye kolonu olmayan dosyalar için seviye")
+    imp.add_argument("--workers", type=int, default=None, help="İşçi süreç sayısı (varsayılan: CPU sayısı)")
+    imp.add_argument("--allow-duplicates", action="store_true", help="Tekrar eden soruları da ekle")
+    imp.add_argument("--errors", help="Tüm satır hatalarının yazılacağı CSV dosyası")
+
+    exp = sub.add_parser("export", help="Soru bankasını CSV/JSONL olarak yazar")
+    exp.add_argument("file")
+
+    for p in (imp, exp):
+        p.add_argument("--backend", choices=("json", "sqlite"), default="json")
+        p.add_argument("--bank", help=f"Soru bankası yolu (varsayılan: {DEFAULT_JSON} / {DEFAULT_DB})")
+
+    args = parser.parse_args(argv)
+    if args.command == "import":
+        stats = import_file(args.file, args.backend, args.bank, args.level, args.workers,
+                            args.allow_duplicates, args.errors)
+        rate = stats["rows"] / stats["seconds"] if stats["seconds"] else 0.0
+        print(f"{stats['rows']} satır işlendi: {stats['added']} eklendi, {stats['duplicates']} tekrar, "
+              f"{stats['errors']} hatalı | {stats['seconds']:.2f} s ({rate:,.0f} satır/s)")
+    else:
+        started = time.perf_counter()
+        count = export_bank(args.file, args.backend, args.bank)
+        elapsed = time.perf_counter() - started
+        print(f"{count} soru dışa aktarıldı: {args.file} | {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Sequence
+
+from answers import normalize_answer
+
+# ------------------------------------------------
+# DERLENMİŞ SORU PAKETİ (mmap)
+# ------------------------------------------------
+# questions.json bir kez ikili pakete derlenir; oyun paketi mmap ile açar ve
+# soruları yalnızca erişildiklerinde çözer. Aynı makinedeki birden çok kiosk
+# süreci paketin sayfalarını işletim sistemi önbelleğinden paylaşır.
+#
+# Dosya düzeni (little-endian):
+#   HEADER                      magic, sürüm, seviye sayısı, kaynak SHA-256, string tablosu ofseti
+#   LEVEL_ENTRY x seviye        seviye adı (string ref), soru sayısı, kayıt dizisinin ofseti
+#   RECORD x soru               her alan için (ofset, uzunluk) — sabit genişlikli ofset dizisi
+#   string tablosu              tekilleştirilmiş UTF-8 metinler
+
+MAGIC = b"MQPK"
+VERSION = 2
+
+# "norm" alanı, normalize_answer ile önceden hesaplanmış cevaptır
+FIELDS = ("q", "a", "norm", "type", "kategori", "mod", "extra")
+# Kayıtta ayrı alanı olmayan anahtarlar "extra" içinde JSON olarak saklanır
+KNOWN_KEYS = ("q", "a", "type", "kategori", "mod")
+
+HEADER = struct.Struct("<4sHH32sQ")
+LEVEL_ENTRY = struct.Struct("<IIIQ")
+RECORD = struct.Struct("<" + "II" * len(FIELDS))
+
+# Uzunluk alanında bu değer "alan yok" anlamına gelir
+MISSING = 0xFFFFFFFF
+
+
+def file_sha256(path):
+    """Dosyanın SHA-256 özetini (ham bayt) döndürür."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+class _StringTable:
+    """Metinleri tekilleştirerek tek bir bayt dizisine ekler."""
+
+    def __init__(self):
+        self.buf = bytearray()
+        self.refs = {}
+
+    def ref(self, text):
+        if text is None:
+            return (0, MISSING)
+        if text not in self.refs:
+            data = text.encode("utf-8")
+            self.refs[text] = (len(self.buf), len(data))
+            self.buf += data
+        return self.refs[text]
+
+
+def build_pack(json_path, pack_path):
+    """questions.json dosyasını ikili pakete derler (atomik olarak yazar)."""
+    with open(json_path, "rb") as f:
+        raw = f.read()
+    source_hash = hashlib.sha256(raw).digest()
+    data = json.loads(raw.decode("utf-8"))
+
+    strings = _StringTable()
+    levels = []
+    for level, questions in data.items():
+        records = bytearray()
+        for q in questions:
+            extra = {k: v for k, v in q.items() if k not in KNOWN_KEYS}
+            values = (
+                str(q["q"]),
+                str(q["a"]),
+                normalize_answer(str(q["a"])),
+                q.get("type"),
+                q.get("kategori"),
+                q.get("mod"),
+                json.dumps(extra, ensure_ascii=False) if extra else None,
+            )
+            refs = []
+            for value in values:
+                refs.extend(strings.ref(value))
+            records += RECORD.pack(*refs)
+        levels.append((strings.ref(level), len(questions), records))
+
+    # Ofsetleri hesapla: başlık + seviye dizini + kayıt dizileri + string tablosu
+    offset = HEADER.size + LEVEL_ENTRY.size * len(levels)
+    directory = bytearray()
+    for (name_off, name_len), count, records in levels:
+        directory += LEVEL_ENTRY.pack(name_off, name_len, count, offset)
+        offset += len(records)
+    header = HEADER.pack(MAGIC, VERSION, len(levels), source_hash, offset)
+
+    tmp_path = pack_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(directory)
+        for _, _, records in levels:
+            f.write(records)
+        f.write(strings.buf)
+    os.replace(tmp_path, pack_path)
+    return source_hash
+
+
+class PackLevel(Sequence):
+    """Bir seviyenin sorularına tembel (lazy) erişim; her erişim yeni bir sözlük çözer."""
+
+    def __init__(self, pack, count, records_offset):
+        self.pack = pack
+        self.count = count
+        self.records_offset = records_offset
+
+    def __len__(self):
+        return self.count
+
+    def _record(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("question index out of range")
+        return RECORD.unpack_from(self.pack.mm, self.records_offset + index * RECORD.size)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.count))]
+        refs = self._record(index)
+        question = {}
+        for i, field in enumerate(FIELDS):
+            if field == "norm":
+                continue
+            value = self.pack.string(refs[2 * i], refs[2 * i + 1])
+            if value is None:
+                continue
+            if field == "extra":
+                question.update(json.loads(value))
+            else:
+                question[field] = value
+        return question
+
+    def normalized_answer(self, index):
+        """Önceden hesaplanmış normalize cevabı soruyu çözmeden döndürür."""
+        refs = self._record(index)
+        norm = FIELDS.index("norm")
+        return self.pack.string(refs[2 * norm], refs[2 * norm + 1])
+
+
+class QuestionPack:
+    """Derlenmiş soru paketini salt okunur mmap ile açar."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self.mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, level_count, self.source_hash, self.strings_offset = HEADER.unpack_from(self.mm, 0)
+        except struct.error:
+            magic, version = None, None
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Not a question pack (or unsupported version): {path}")
+
+        self.levels = {}
+        for i in range(level_count):
+            name_off, name_len, count, records_off = LEVEL_ENTRY.unpack_from(
+                self.mm, HEADER.size + i * LEVEL_ENTRY.size
+            )
+            self.levels[self.string(name_off, name_len)] = PackLevel(self, count, records_off)
+
+    def string(self, offset, length):
+        if length == MISSING:
+            return None
+        start = self.strings_offset + offset
+        return self.mm[start:start + length].decode("utf-8")
+
+    def level(self, name):
+        """Seviye görünümünü döndürür; bilinmeyen seviye için boş liste."""
+        return self.levels.get(name, [])
+
+    def close(self):
+        self.mm.close()
+        self._file.close()
+
+
+def open_pack(json_path, pack_path):
+    """Paketi açar; paket yoksa veya kaynak JSON değişmişse önce yeniden derler."""
+    source_hash = file_sha256(json_path) if os.path.exists(json_path) else None
+
+    if os.path.exists(pack_path):
+        try:
+            pack = QuestionPack(pack_path)
+            if source_hash is None or pack.source_hash == source_hash:
+                return pack
+            pack.close()
+            print(f"♻️ Soru paketi eski (kaynak değişmiş), yeniden derleniyor: {pack_path}")
+        except ValueError as e:
+            print(f"⚠️ Soru paketi okunamadı, yeniden derleniyor: {e}")
+
+    build_pack(json_path, pack_path)
+    return QuestionPack(pack_path)
+
+
+if __name__ == "__main__":
+    # Kullanım: python question_pack.py [data/questions.json] [data/questions.pack]
+    json_path = sys.argv[1] if len(sys.argv) > 1 else "data/questions.json"
+    pack_path = sys.argv[2] if len(sys.argv) > 2 else "data/questions.pack"
+
+    build_pack(json_path, pack_path)
+    pack = QuestionPack(pack_path)
+    print(f"Soru paketi derlendi: {json_path} -> {pack_path} ({os.path.getsize(pack_path)} bayt)")
+    for name, level in pack.levels.items():
+        print(f"  {name}: {len(level)}")
+    pack.close()
@@ -0,0 +1,168 @@
+import json
+import os
+import re
+import sys
+from array import array
+from collections.abc import Sequence
+
+# ------------------------------------------------
+# AKIŞLI (STREAMING) SORU BANKASI
+# ------------------------------------------------
+# Çok büyük questions.json dosyaları için: dosya bir kez parça parça taranır ve
+# her seviye için soru nesnelerinin bayt aralıkları (başlangıç, bitiş) indekslenir.
+# Sorular yalnızca istendiğinde diskten okunup çözülür; bellekte soru başına
+# sadece iki adet 8 baytlık ofset tutulur.
+#
+# İndeks, kaynağın yanındaki "<dosya>.idx" dosyasına yazılır ve kaynağın boyutu
+# ile değişiklik zamanı aynı kaldıkça yeniden kullanılır.
+
+CHUNK_SIZE = 1 << 20
+
+# Tarayıcının ilgilendiği tek baytlar: string sınırları, kaçış ve yapı karakterleri
+_TOKENS = re.compile(rb'["\\{}\[\]]')
+
+INDEX_SUFFIX = ".idx"
+
+
+def scan_offsets(path, chunk_size=CHUNK_SIZE):
+    """JSON'u belleğe almadan tarar; {seviye: (başlangıçlar, bitişler)} döndürür.
+
+    Beklenen biçim questions.json ile aynıdır: {"seviye": [ {...}, {...} ], ...}
+    """
+    levels = {}
+    depth = 0
+    in_string = False
+    skip_pos = -1          # Kaçış karakterinden sonraki bayt (yok sayılır)
+    key_start = None       # Derinlik 1'deki (seviye adı) string'in başlangıcı
+    last_key = None
+    current = None         # Aktif seviyenin (başlangıçlar, bitişler) dizileri
+    q_start = None
+
+    with open(path, "rb") as f, open(path, "rb") as key_reader:
+        base = 0
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            for m in _TOKENS.finditer(chunk):
+                pos = base + m.start()
+                if pos == skip_pos:
+                    continue
+                ch = m.group()
+                if in_string:
+                    if ch == b"\\":
+                        skip_pos = pos + 1
+                    elif ch == b'"':
+                        in_string = False
+                        if key_start is not None:
+                            key_reader.seek(key_start + 1)
+                            last_key = json.loads(b'"' + key_reader.read(pos - key_start - 1) + b'"')
+                            key_start = None
+                    continue
+                if ch == b'"':
+                    in_string = True
+                    if depth == 1:
+                        key_start = pos
+                elif ch in (b"{", b"["):
+                    depth += 1
+                    if depth == 2 and ch == b"[":
+                        current = levels.setdefault(last_key, (array("Q"), array("Q")))
+                    elif depth == 3 and ch == b"{" and current is not None:
+                        q_start = pos
+                else:
+                    if depth == 3 and ch == b"}" and q_start is not None:
+                        current[0].append(q_start)
+                        current[1].append(pos + 1)
+                        q_start = None
+                    elif depth == 2:
+                        current = None
+                    depth -= 1
+            base += len(chunk)
+    return levels
+
+
+class StreamLevel(Sequence):
+    """Bir seviyenin sorularını istek üzerine diskten okuyan görünüm."""
+
+    def __init__(self, bank, starts, ends):
+        self.bank = bank
+        self.starts = starts
+        self.ends = ends
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        start = self.starts[index]
+        return json.loads(self.bank.read(start, self.ends[index] - start))
+
+
+class StreamingQuestionBank:
+    """questions.json'u seviye başına ofset indeksiyle açar."""
+
+    def __init__(self, path, index_path=None):
+        self.path = path
+        self.index_path = index_path or path + INDEX_SUFFIX
+        st = os.stat(path)
+        self.stamp = (st.st_size, st.st_mtime_ns)
+
+        offsets = self._load_index()
+        if offsets is None:
+            offsets = scan_offsets(path)
+            self._save_index(offsets)
+        self.levels = {name: StreamLevel(self, s, e) for name, (s, e) in offsets.items()}
+        self._file = open(path, "rb")
+
+    def read(self, offset, length):
+        self._file.seek(offset)
+        return self._file.read(length)
+
+    def level(self, name):
+        return self.levels.get(name, [])
+
+    def close(self):
+        self._file.close()
+
+    # ---------------- İNDEKS DOSYASI ----------------
+    # Biçim: tek satırlık JSON başlık, ardından her seviye için başlangıç ve bitiş dizileri
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "rb") as f:
+                header = json.loads(f.readline())
+                if tuple(header["stamp"]) != self.stamp:
+                    return None
+                offsets = {}
+                for name, count in header["levels"]:
+                    starts, ends = array("Q"), array("Q")
+                    starts.fromfile(f, count)
+                    ends.fromfile(f, count)
+                    offsets[name] = (starts, ends)
+                return offsets
+        except (OSError, ValueError, KeyError, EOFError):
+            return None
+
+    def _save_index(self, offsets):
+        header = {"stamp": list(self.stamp), "levels": [[name, len(s)] for name, (s, _) in offsets.items()]}
+        tmp_path = self.index_path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n")
+                for starts, ends in offsets.values():
+                    starts.tofile(f)
+                    ends.tofile(f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"⚠️ Soru indeksi kaydedilemedi: {e}")
+
+
+if __name__ == "__main__":
+    # Kullanım: python question_stream.py [data/questions.json]
+    path = sys.argv[1] if len(sys.argv) > 1 else "data/questions.json"
+    bank = StreamingQuestionBank(path)
+    print(f"Akışlı soru bankası indekslendi: {path} -> {bank.index_path}")
+    for name, level in bank.levels.items():
+        print(f"  {name}: {len(level)}")
+    bank.close()
@@ -0,0 +1,219 @@
+import bisect
+import json
+import math
+import os
+import random
+import sys
+import time
+
+# ------------------------------------------------
+# UYARLANABİLİR ZORLUK (ELO)
+# ------------------------------------------------
+# Her oyuncu ve her soru için bir Elo puanı tutulur. Bir cevap, oyuncuyu sorunun
+# karşısında bir "maç" gibi günceller (O(1)): doğru cevap oyuncunun puanını
+# artırıp sorununkini düşürür. K katsayısı, varlık ne kadar çok oynandıysa o kadar
+# küçülür (Glicko'daki belirsizlik azalmasının basit hali); böylece yeni oyuncular ve
+# yeni sorular hızlı, oturmuş puanlar yavaş değişir.
+#
+# Sıradaki soru, oyuncunun yaklaşık TARGET_SUCCESS olasılıkla bileceği puandaki
+# sorular arasından seçilir. Sorular puan kovalarına (BUCKET_WIDTH genişliğinde)
+# dağıtılır ve dolu kovaların anahtarları sıralı tutulur; hedefe en yakın kova
+# ikili aramayla bulunur, yani seçim banka büyüdükçe O(log n) kalır.
+
+VERSION = 1
+LEVEL_RATINGS = {"kolay": 1200.0, "orta": 1500.0, "zor": 1800.0}
+PLAYER_START = 1350.0
+TARGET_SUCCESS = 0.7
+BUCKET_WIDTH = 50
+K_MAX, K_MIN, K_HALF = 64.0, 12.0, 20.0
+
+
+def expected_score(player, question):
+    """Oyuncunun soruyu doğru cevaplama olasılığı (Elo beklentisi)."""
+    return 1.0 / (1.0 + 10.0 ** ((question - player) / 400.0))
+
+
+def k_factor(games):
+    """Oynanan maç sayısıyla K_MAX'tan K_MIN'e doğru azalan güncelleme katsayısı."""
+    return K_MIN + (K_MAX - K_MIN) / (1.0 + games / K_HALF)
+
+
+def target_rating(player, success=TARGET_SUCCESS):
+    """Oyuncunun `success` olasılıkla bileceği soru puanı."""
+    return player + 400.0 * math.log10(1.0 / success - 1.0)
+
+
+class Ratings:
+    """Oyuncu adı -> [puan, maç], soru kimliği -> [puan, maç]; JSON dosyasında saklanır."""
+
+    def __init__(self, path):
+        self.path = path
+        self.players = {}
+        self.questions = {}
+        self.dirty = False
+
+    def player(self, name):
+        entry = self.players.get(name)
+        return entry[0] if entry else PLAYER_START
+
+    def question(self, qid, level):
+        entry = self.questions.get(qid)
+        return entry[0] if entry else LEVEL_RATINGS.get(level, PLAYER_START)
+
+    def update(self, name, qid, level, correct):
+        """Bir cevabın sonucunu işler; (yeni oyuncu puanı, yeni soru puanı) döndürür."""
+        p = self.players.get(name) or [PLAYER_START, 0]
+        q = self.questions.get(qid) or [LEVEL_RATINGS.get(level, PLAYER_START), 0]
+        delta = (1.0 if correct else 0.0) - expected_score(p[0], q[0])
+        p[0] += k_factor(p[1]) * delta
+        q[0] -= k_factor(q[1]) * delta
+        p[1] += 1
+        q[1] += 1
+        self.players[name] = p
+        self.questions[qid] = q
+        self.dirty = True
+        return p[0], q[0]
+
+    # ---------------- KALICILIK ----------------
+
+    @classmethod
+    def load(cls, path):
+        ratings = cls(path)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            ratings.players = {name: list(v) for name, v in data.get("players", {}).items()}
+            ratings.questions = {int(qid, 16): list(v) for qid, v in data.get("questions", {}).items()}
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError) as e:
+            print(f"⚠️ Puan dosyası okunamadı, varsayılan puanlarla devam ediliyor: {e}")
+        return ratings
+
+    def save(self):
+        """Değişiklik varsa puanları atomik olarak yazar."""
+        if not self.dirty:
+            return
+        data = {
+            "v": VERSION,
+            "players": {name: [round(r, 1), n] for name, (r, n) in self.players.items()},
+            "questions": {f"{qid:x}": [round(r, 1), n] for qid, (r, n) in self.questions.items()},
+        }
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError as e:
+            print(f"❌ Puanlar kaydedilemedi: {e}")
+
+
+class RatingIndex:
+    """Soruları (seviye, sıra) konumuyla puan kovalarında tutan indeks.
+
+    Ekleme, çıkarma ve puan değişikliği kova içinde O(1) (sondakiyle yer değiştirerek
+    silme); kova ilk kez dolduğunda / boşaldığında sıralı anahtar listesi güncellenir.
+    """
+
+    def __init__(self, bucket_width=BUCKET_WIDTH):
+        self.bucket_width = bucket_width
+        self.buckets = {}   # kova -> [konum, ...]
+        self.keys = []      # dolu kovaların sıralı anahtarları
+        self.where = {}     # konum -> (kova, kova içindeki sıra)
+
+    def __len__(self):
+        return len(self.where)
+
+    def _bucket(self, rating):
+        return int(rating // self.bucket_width)
+
+    def add(self, item, rating):
+        if item in self.where:
+            self.remove(item)
+        key = self._bucket(rating)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = []
+            bisect.insort(self.keys, key)
+        self.where[item] = (key, len(bucket))
+        bucket.append(item)
+
+    def remove(self, item):
+        place = self.where.pop(item, None)
+        if place is None:
+            return
+        key, i = place
+        bucket = self.buckets[key]
+        last = bucket.pop()
+        if last != item:
+            bucket[i] = last
+            self.where[last] = (key, i)
+        if not bucket:
+            del self.buckets[key]
+            del self.keys[bisect.bisect_left(self.keys, key)]
+
+    def move(self, item, rating):
+        """Puanı değişen soruyu yalnızca kovası değiştiyse taşır."""
+        place = self.where.get(item)
+        if place is None or place[0] != self._bucket(rating):
+            self.add(item, rating)
+
+    def pick(self, rating, rng=random, exclude=()):
+        """Puanı `rating`'e en yakın kovalardan, `exclude` içinde olmayan rastgele bir soru seçer."""
+        if not self.keys:
+            return None
+        target = self._bucket(rating)
+        right = bisect.bisect_left(self.keys, target)
+        left = right - 1
+        # Hedef kovadan başlayıp dışa doğru (yakın olan taraf önce) kovaları dolaş
+        while left >= 0 or right < len(self.keys):
+            if right < len(self.keys) and (left < 0 or self.keys[right] - target <= target - self.keys[left]):
+                key = self.keys[right]
+                right += 1
+            else:
+                key = self.keys[left]
+                left -= 1
+            bucket = self.buckets[key]
+            for _ in range(4):
+                item = bucket[rng.randrange(len(bucket))]
+                if item not in exclude:
+                    return item
+            fresh = [item for item in bucket if item not in exclude]
+            if fresh:
+                return rng.choice(fresh)
+        return None
+
+
+# ------------------------------------------------
+# BENCHMARK
+# ------------------------------------------------
+def benchmark(sizes=(10_000, 100_000, 1_000_000), picks=5_000):
+    """Banka büyüdükçe soru seçme + puan güncelleme süresinin sabit kaldığını gösterir."""
+    rng = random.Random(1)
+    for n in sizes:
+        index = RatingIndex()
+        ratings = Ratings(os.devnull)
+        for i in range(n):
+            index.add(("orta", i), rng.gauss(1500, 300))
+        t = time.perf_counter()
+        seen = set()
+        for _ in range(picks):
+            item = index.pick(target_rating(ratings.player("bench")), rng, seen)
+            seen.add(item)
+            _, q = ratings.update("bench", item[1], "orta", rng.random() < 0.7)
+            index.move(item, q)
+        us = (time.perf_counter() - t) / picks * 1e6
+        print(f"{n:>9} soru: seçim + güncelleme {us:.1f} µs | oyuncu puanı {ratings.player('bench'):.0f}")
+
+
+if __name__ == "__main__":
+    # Kullanım: python ratings.py [data/ratings.json]  -> oyuncu puanlarını listeler
+    #           python ratings.py --bench
+    if "--bench" in sys.argv:
+        benchmark()
+        sys.exit()
+    store = Ratings.load(sys.argv[1] if len(sys.argv) > 1 else "data/ratings.json")
+    for name, (rating, games) in sorted(store.players.items(), key=lambda kv: -kv[1][0]):
+        print(f"{rating:7.1f}  {games:>5} cevap  {name}")
+    print(f"{len(store.questions)} sorunun puanı var")
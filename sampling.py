@@ -0,0 +1,149 @@
+import heapq
+import random
+import sys
+import time
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import accumulate
+
+# ------------------------------------------------
+# SORU ÖRNEKLEME
+# ------------------------------------------------
+# Tüm seviyeyi karıştırıp dilimlemek yerine k soru tekrarsız olarak O(k) zamanda
+# çekilir (kısmi Fisher–Yates). Yer değiştirmeler seyrek bir sözlükte tutulduğu
+# için seviye listesinin kopyası da çıkarılmaz.
+
+
+def make_rng(seed=None):
+    """Tekrarlanabilirlik için tohumlu (seed=None ise rastgele) bir üreteç döndürür."""
+    return random.Random(seed)
+
+
+def sample_indices(n, k, rng=None):
+    """range(n) içinden tekrarsız k indeks çeker (kısmi Fisher–Yates, O(k))."""
+    rng = rng or random
+    k = min(k, n)
+    swaps = {}
+    picked = []
+    for i in range(k):
+        j = rng.randrange(i, n)
+        picked.append(swaps.get(j, j))
+        swaps[j] = swaps.get(i, i)
+    return picked
+
+
+class LazyPermutation(Sequence):
+    """range(n)'nin rastgele bir permütasyonu; elemanlar istendikçe üretilir.
+
+    İlk m elemana erişmek O(m) zaman ve bellek harcar, n'den bağımsızdır.
+    """
+
+    def __init__(self, n, rng=None):
+        self.n = n
+        self.rng = rng or random
+        self.swaps = {}
+        self.drawn = []
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.n
+        if not 0 <= index < self.n:
+            raise IndexError("permutation index out of range")
+        while len(self.drawn) <= index:
+            i = len(self.drawn)
+            j = self.rng.randrange(i, self.n)
+            self.drawn.append(self.swaps.get(j, j))
+            self.swaps[j] = self.swaps.get(i, i)
+            # i konumuna bir daha bakılmaz; sözlük yalnızca ileriki konumları tutar
+            self.swaps.pop(i, None)
+        return self.drawn[index]
+
+
+class WeightedSampler:
+    """Ağırlıklı, tekrarsız örnekleme.
+
+    Kümülatif ağırlıklar bir kez O(n) hesaplanır; her çekiliş ikili arama ile
+    O(log n) sürer. Daha önce seçilmiş bir eleman gelirse çekiliş tekrarlanır;
+    bu, kalan elemanlar arasından ağırlıkla orantılı seçimle aynı dağılımı verir.
+    """
+
+    def __init__(self, weights):
+        # Üreteç de verilebilir: ağırlıklar iki kez dolaşıldığı için önce listeye alınır
+        weights = [max(0.0, float(w)) for w in weights]
+        self.cumulative = list(accumulate(weights))
+        self.total = self.cumulative[-1] if self.cumulative else 0.0
+        self.positive = sum(1 for w in weights if w > 0)
+
+    def __len__(self):
+        return len(self.cumulative)
+
+    def sample(self, k, rng=None):
+        rng = rng or random
+        k = min(k, self.positive)
+        picked, seen = [], set()
+        attempts = 0
+        while len(picked) < k:
+            attempts += 1
+            if attempts > 8 * k + 32:
+                # Ağırlıkların çoğu seçilmiş elemanlarda toplanmış: kalanları tam yöntemle tamamla
+                return picked + self._exact(k - len(picked), seen, rng)
+            i = bisect_right(self.cumulative, rng.random() * self.total)
+            if i < len(self.cumulative) and i not in seen:
+                seen.add(i)
+                picked.append(i)
+        return picked
+
+    def _exact(self, k, exclude, rng):
+        """Efraimidis–Spirakis anahtarlarıyla (u^(1/w)) O(n log k) örnekleme."""
+        keys = []
+        previous = 0.0
+        for i, c in enumerate(self.cumulative):
+            w = c - previous
+            previous = c
+            if w > 0 and i not in exclude:
+                keys.append((rng.random() ** (1.0 / w), i))
+        return [i for _, i in heapq.nlargest(k, keys)]
+
+
+def weighted_sample(weights, k, rng=None):
+    """Tek seferlik ağırlıklı tekrarsız örnekleme kısayolu."""
+    return WeightedSampler(weights).sample(k, rng)
+
+
+# ------------------------------------------------
+# BENCHMARK
+# ------------------------------------------------
+def benchmark(k=10, sizes=(10**3, 10**4, 10**5, 10**6), repeat=20):
+    """Seviye büyüdükçe örnekleme maliyetinin sabit kaldığını gösterir."""
+    rng = make_rng(42)
+    print(f"{'n':>9} | {'shuffle+slice':>14} | {'sample_indices':>14} | {'LazyPermutation':>15}")
+    for n in sizes:
+        pool = list(range(n))
+
+        t = time.perf_counter()
+        for _ in range(max(1, repeat // 10)):
+            rng.shuffle(pool)
+            pool[:k]
+        shuffle_ms = (time.perf_counter() - t) / max(1, repeat // 10) * 1000
+
+        t = time.perf_counter()
+        for _ in range(repeat):
+            sample_indices(n, k, rng)
+        sample_ms = (time.perf_counter() - t) / repeat * 1000
+
+        t = time.perf_counter()
+        for _ in range(repeat):
+            perm = LazyPermutation(n, rng)
+            for i in range(k):
+                perm[i]
+        lazy_ms = (time.perf_counter() - t) / repeat * 1000
+
+        print(f"{n:>9} | {shuffle_ms:>11.3f} ms | {sample_ms:>11.3f} ms | {lazy_ms:>12.3f} ms")
+
+
+if __name__ == "__main__":
+    # Kullanım: python sampling.py [k]
+    benchmark(k=int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -2,6 +2,16 @@ import pygame
 import sys
 import math
 import os
+import glob
+import shutil
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+
+from sprite_atlas import SpriteAtlas
+from sprite_cache import SpriteCache, clear_hash_memo
 
 # ------------------------------------------------
 # SETUP
@@ -14,8 +24,31 @@ FPS = 60
 font = None
 title_font = None
 
-def init_soccer_pygame():
-    """Initialize pygame for soccer game"""
+# Ball physics runs at a fixed PHYSICS_HZ, independent of the frame rate; draw() interpolates
+# between the last two physics states. Velocities stay in the original units (pixels per
+# 60 Hz frame at 1000x600), so each step moves the ball by STEP_SCALE of a velocity and the
+# goal slowdown (x0.95 per 60 Hz frame) is spread over the steps.
+PHYSICS_HZ = 240
+PHYSICS_DT = 1.0 / PHYSICS_HZ
+STEP_SCALE = 60 / PHYSICS_HZ
+GOAL_DAMPING = 0.95 ** STEP_SCALE
+MAX_FRAME_TIME = 0.25   # a longer stall (window drag, loading) is not caught up
+SHOT_SPEED = 12         # pixels per 60 Hz frame at 1000x600
+
+# Background removal for sprites without their own alpha channel: a pixel whose darkest
+# channel is above 255 - BG_TOLERANCE counts as (near-)white background. BG_FEATHER > 0
+# fades alpha over that many levels below the threshold instead of a hard cut, which
+# softens the anti-aliased light fringe around the sprite.
+BG_TOLERANCE = 55
+BG_FEATHER = 0
+
+def init_soccer_pygame(share_display=False):
+    """Initialize pygame for soccer game
+
+    Args:
+        share_display: If True and a display already exists (the quiz's window), draw on it
+            as-is instead of switching it to fullscreen.
+    """
     global screen, clock, font, title_font
     
     # Initialize pygame if not already initialized
@@ -34,15 +67,16 @@ def init_soccer_pygame():
             if existing_surface is not None:
                 print("Using existing pygame display surface")
                 screen = existing_surface
-                # Still try to switch to fullscreen for penalty game
-                try:
-                    fullscreen_info = pygame.display.get_desktop_sizes()[0]
-                    new_screen = pygame.display.set_mode(fullscreen_info, pygame.FULLSCREEN)
-                    if new_screen is not None:
-                        screen = new_screen
-                        print(f"Switched to fullscreen: {screen.get_size()}")
-                except Exception as e:
-                    print(f"Could not switch to fullscreen, using existing: {e}")
+                # Still try to switch to fullscreen for penalty game (unless sharing the quiz's display)
+                if not share_display:
+                    try:
+                        fullscreen_info = pygame.display.get_desktop_sizes()[0]
+                        new_screen = pygame.display.set_mode(fullscreen_info, pygame.FULLSCREEN)
+                        if new_screen is not None:
+                            screen = new_screen
+                            print(f"Switched to fullscreen: {screen.get_size()}")
+                    except Exception as e:
+                        print(f"Could not switch to fullscreen, using existing: {e}")
         except:
             pass
         
@@ -118,25 +152,38 @@ def load_image(path, scale=None, colorkey=None):
         print(f"Error loading {path}: {e}")
         return None
 
-def load_image_with_background_removal(path, scale=None):
+def remove_background(surface, tolerance=BG_TOLERANCE, feather=BG_FEATHER):
+    """Return an SRCALPHA copy of `surface` with near-white pixels made transparent.
+    
+    One vectorized pass over the pixel arrays: alpha = 255 where the darkest channel is at
+    or below 255 - tolerance - feather, 0 above 255 - tolerance, a linear ramp in between.
+    """
+    result = surface.convert_alpha()
+    # Alpha for every possible darkest-channel value, then one table lookup per pixel
+    levels = np.arange(256, dtype=np.int32)
+    table = np.clip((256 - tolerance - levels) * 255 // (feather + 1), 0, 255).astype(np.uint8)
+    rgb = pygame.surfarray.pixels3d(result)
+    darkest = np.minimum(np.minimum(rgb[..., 0], rgb[..., 1]), rgb[..., 2])
+    del rgb
+    alpha = pygame.surfarray.pixels_alpha(result)
+    alpha[...] = table[darkest]
+    del alpha  # release the surface lock
+    return result
+
+def load_image_with_background_removal(path, scale=None, tolerance=BG_TOLERANCE, feather=BG_FEATHER):
     try:
         if not os.path.exists(path):
             print(f"File not found: {path}")
             return None
             
         img = pygame.image.load(path)
-        img = img.convert_alpha()
-        
-        if img.get_alpha() is None:
-            img_with_alpha = pygame.Surface(img.get_size(), pygame.SRCALPHA)
-            for x in range(img.get_width()):
-                for y in range(img.get_height()):
-                    color = img.get_at((x, y))
-                    if color[0] > 200 and color[1] > 200 and color[2] > 200:
-                        img_with_alpha.set_at((x, y), (255, 255, 255, 0))
-                    else:
-                        img_with_alpha.set_at((x, y), (*color[:3], 255))
-            img = img_with_alpha
+        
+        # Only images without an alpha channel (or colorkey) of their own get one generated.
+        # (This has to be checked before convert_alpha(), which always adds an alpha channel.)
+        if img.get_flags() & pygame.SRCALPHA or img.get_colorkey() is not None:
+            img = img.convert_alpha()
+        else:
+            img = remove_background(img, tolerance, feather)
         
         if scale:
             img = pygame.transform.scale(img, scale)
@@ -267,6 +314,108 @@ keeper_cry_img_orig = None
 # Joysticks list (module-level)
 joysticks = []
 
+# Processed sprites are cached on disk (see sprite_cache.py). sprite_keys remembers the
+# cache key of each *_orig sprite loaded from a file so its screen-scaled versions can be
+# cached too; sprites drawn by the create_fallback_* functions are never cached.
+sprite_cache = SpriteCache()
+sprite_keys = {}
+
+def load_cached(name, path, size, params, loader):
+    """Load a processed sprite through the disk cache; `loader` only runs on a cache miss"""
+    key = sprite_cache.source_key(path, params)
+    img = sprite_cache.get(name, key, size, loader)
+    if img is not None and key is not None:
+        sprite_keys[name] = key
+    else:
+        sprite_keys.pop(name, None)
+    return img
+
+def load_image_cached(name, path, scale, colorkey=None):
+    return load_cached(name, path, scale, ("load", colorkey), lambda: load_image(path, scale, colorkey))
+
+def load_sprite_cached(name, path, scale):
+    """load_image_with_background_removal through the disk cache"""
+    return load_cached(name, path, scale, ("background", BG_TOLERANCE, BG_FEATHER),
+                       lambda: load_image_with_background_removal(path, scale))
+
+# Screen-scaled sprites. SCALE_QUALITY picks pygame.transform.smoothscale ("smooth", filtered,
+# holds up at 4K) or pygame.transform.scale ("fast", nearest neighbour). The sprites of each
+# resolution are packed into a SpriteAtlas (see sprite_atlas.py) and every atlas built in this
+# process stays in scene_atlases, so going back to a resolution already seen (F toggle,
+# resized quiz window) reuses it instead of scaling or redrawing the sprites.
+SCALE_QUALITY = "smooth"
+scene_atlases = {}
+
+# GameState image states -> atlas sprite names
+KEEPER_SPRITES = {"stand": "keeper_stand", "holding": "keeper_holding_ball", "cry": "keeper_cry"}
+SHOOTER_SPRITES = {"stand": "shooter_stand", "shoot": "shooter_shoot", "sui": "shooter_sui"}
+# Screen-wide backgrounds: drawn without alpha blending, from the atlas' opaque page
+BACKGROUND_SPRITES = ("fans", "grass")
+
+def scale_surface(image, size, quality=None):
+    quality = quality or SCALE_QUALITY
+    # smoothscale only handles 24/32-bit surfaces
+    if quality == "smooth" and image.get_bitsize() in (24, 32):
+        return pygame.transform.smoothscale(image, size)
+    return pygame.transform.scale(image, size)
+
+def scale_sprite(name, image, size, fallback=None):
+    """
+    Sprite `name` scaled to `size`: from the disk cache (keyed by the source sprite's key),
+    else scaled now. If `image` is None it is drawn by fallback(size).
+    """
+    size = (int(size[0]), int(size[1]))
+    if image is None:
+        return fallback(size)
+    key = sprite_keys.get(name)
+    if key is not None:
+        key = sprite_cache.key(key, ("scale", SCALE_QUALITY))
+    # One cache name per quality, so "smooth" and "fast" copies don't evict each other
+    return sprite_cache.get(f"{name}.{SCALE_QUALITY}", key, size, lambda: scale_surface(image, size))
+
+def create_fallback_fill(size, color):
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    return surface
+
+def scene_sprites(screen_w, screen_h):
+    """All scene sprites scaled for a screen_w x screen_h display, as {name: surface}"""
+    scale_x = screen_w / SCREEN_W
+    scale_y = screen_h / SCREEN_H
+    goal_size = (int(500 * scale_x), int(250 * scale_y))
+    ball_size = (int(BALL_SIZE[0] * scale_x), int(BALL_SIZE[1] * scale_y))
+    keeper_size = (int(100 * scale_x), int(130 * scale_y))
+    shooter_size = (int(140 * scale_x), int(180 * scale_y))
+    band_size = (screen_w, int(300 * scale_y))
+    return {
+        "goal": scale_sprite("goal", goal_img_orig, goal_size, create_fallback_goal),
+        "ball": scale_sprite("ball", ball_img_orig, ball_size, create_soccer_ball),
+        "keeper_stand": scale_sprite("keeper_stand", keeper_stand_img_orig, keeper_size,
+                                     create_fallback_keeper),
+        "keeper_holding_ball": scale_sprite("keeper_holding_ball", keeper_holding_ball_img_orig, keeper_size,
+                                            lambda size: create_fallback_keeper(size, holding_ball=True)),
+        "keeper_cry": scale_sprite("keeper_cry", keeper_cry_img_orig, keeper_size,
+                                   lambda size: create_fallback_keeper(size, crying=True)),
+        "shooter_stand": scale_sprite("shooter_stand", shooter_stand_img_orig, shooter_size,
+                                      create_fallback_shooter),
+        "shooter_shoot": scale_sprite("shooter_shoot", shooter_shoot_img_orig, shooter_size,
+                                      lambda size: create_fallback_shooter(size, shooting=True)),
+        "shooter_sui": scale_sprite("shooter_sui", shooter_sui_img_orig, shooter_size,
+                                    lambda size: create_fallback_shooter(size, celebrating=True)),
+        "fans": scale_sprite("fans", fans_img_orig, band_size,
+                             lambda size: create_fallback_fill(size, (50, 50, 50))),
+        "grass": scale_sprite("grass", grass_img_orig, band_size,
+                              lambda size: create_fallback_fill(size, (0, 120, 0))),
+    }
+
+def scene_atlas(screen_w, screen_h):
+    """The scene sprites for a screen_w x screen_h display, packed into one SpriteAtlas"""
+    memo = (int(screen_w), int(screen_h), SCALE_QUALITY)
+    atlas = scene_atlases.get(memo)
+    if atlas is None:
+        atlas = scene_atlases[memo] = SpriteAtlas(scene_sprites(screen_w, screen_h), opaque=BACKGROUND_SPRITES)
+    return atlas
+
 def load_all_images():
     """Load all images after pygame is initialized"""
     global BASE_PATH, GOAL_PATH, GRASS_PATH, FANS_PATH, BALL_PATH
@@ -276,6 +425,9 @@ def load_all_images():
     global shooter_stand_img_orig, shooter_shoot_img_orig, shooter_sui_img_orig
     global keeper_stand_img_orig, keeper_holding_ball_img_orig, keeper_cry_img_orig
     
+    # Sprites scaled from the previous originals are stale now
+    scene_atlases.clear()
+    
     # Get absolute path to images directory
     script_dir = os.path.dirname(os.path.abspath(__file__))
     BASE_PATH = os.path.join(script_dir, "images")
@@ -304,20 +456,20 @@ def load_all_images():
     print(f"Loading images from: {BASE_PATH}")
     
     # Load fans and grass
-    fans_img_orig = load_image(FANS_PATH, (SCREEN_W, 300))
+    fans_img_orig = load_image_cached("fans", FANS_PATH, (SCREEN_W, 300))
     if fans_img_orig is None:
         fans_img_orig = pygame.Surface((SCREEN_W, 300))
         fans_img_orig.fill((50, 50, 50))
         print("Created fallback fans image")
     
-    grass_img_orig = load_image(GRASS_PATH, (SCREEN_W, 300))
+    grass_img_orig = load_image_cached("grass", GRASS_PATH, (SCREEN_W, 300))
     if grass_img_orig is None:
         grass_img_orig = pygame.Surface((SCREEN_W, 300))
         grass_img_orig.fill((0, 120, 0))
         print("Created fallback grass image")
     
     # Load goal
-    goal_img_orig = load_image_with_background_removal(GOAL_PATH, (500, 250))
+    goal_img_orig = load_sprite_cached("goal", GOAL_PATH, (500, 250))
     if goal_img_orig is None:
         goal_img_orig = load_image(GOAL_PATH, (500, 250), colorkey=(255, 255, 255))
         if goal_img_orig is None:
@@ -325,7 +477,7 @@ def load_all_images():
             print("Created fallback goal image")
     
     # Load ball
-    ball_img_orig = load_image_with_background_removal(BALL_PATH, BALL_SIZE)
+    ball_img_orig = load_sprite_cached("ball", BALL_PATH, BALL_SIZE)
     if ball_img_orig is None:
         ball_img_orig = load_image(BALL_PATH, BALL_SIZE, colorkey=(255, 255, 255))
         if ball_img_orig is None:
@@ -333,35 +485,35 @@ def load_all_images():
             print("Created fallback ball image")
     
     # Load shooter images
-    shooter_stand_img_orig = load_image_with_background_removal(SHOOTER_STAND_PATH, (140, 180))
+    shooter_stand_img_orig = load_sprite_cached("shooter_stand", SHOOTER_STAND_PATH, (140, 180))
     if shooter_stand_img_orig is None:
         shooter_stand_img_orig = create_fallback_shooter((140, 180))
         print("Created fallback shooter_stand image")
     
-    shooter_shoot_img_orig = load_image_with_background_removal(SHOOTER_SHOOT_PATH, (140, 180))
+    shooter_shoot_img_orig = load_sprite_cached("shooter_shoot", SHOOTER_SHOOT_PATH, (140, 180))
     if shooter_shoot_img_orig is None:
         shooter_shoot_img_orig = create_fallback_shooter((140, 180), shooting=True)
         print("Created fallback shooter_shoot image")
     
-    shooter_sui_img_orig = load_image_with_background_removal(SHOOTER_SUI_PATH, (140, 180))
+    shooter_sui_img_orig = load_sprite_cached("shooter_sui", SHOOTER_SUI_PATH, (140, 180))
     if shooter_sui_img_orig is None:
         shooter_sui_img_orig = create_fallback_shooter((140, 180), celebrating=True)
         print("Created fallback shooter_sui image")
     
     # Load keeper images
-    keeper_stand_img_orig = load_image_with_background_removal(KEEPER_STAND_PATH, (100, 130))
+    keeper_stand_img_orig = load_sprite_cached("keeper_stand", KEEPER_STAND_PATH, (100, 130))
     if keeper_stand_img_orig is None:
         keeper_stand_img_orig = create_fallback_keeper((100, 130))
         print("Created fallback keeper_stand image")
     
-    keeper_holding_ball_img_orig = load_image_with_background_removal(KEEPER_HOLDING_BALL_PATH, (100, 130))
+    keeper_holding_ball_img_orig = load_sprite_cached("keeper_holding_ball", KEEPER_HOLDING_BALL_PATH, (100, 130))
     if keeper_holding_ball_img_orig is None:
         keeper_holding_ball_img_orig = create_fallback_keeper((100, 130), holding_ball=True)
         print("Created fallback keeper_holding_ball image")
     
     # Load keeper cry image
     try:
-        keeper_cry_img_orig = load_image(KEEPER_CRY_PATH, (100, 130))
+        keeper_cry_img_orig = load_image_cached("keeper_cry", KEEPER_CRY_PATH, (100, 130))
     except Exception as e:
         print(f"Warning: Could not load keeper_cry image: {e}")
         keeper_cry_img_orig = None
@@ -411,9 +563,10 @@ def init_joysticks():
 # GAME STATE - SHOOTER FIRST
 # ------------------------------------------------
 class GameState:
-    def __init__(self):
-        self.fullscreen = True
-        self.screen_w, self.screen_h = pygame.display.get_desktop_sizes()[0]
+    def __init__(self, size=None):
+        # size: draw at this resolution (shared display); None = fullscreen desktop size
+        self.fullscreen = size is None
+        self.screen_w, self.screen_h = size or pygame.display.get_desktop_sizes()[0]
         
         # Store original positions
         self.original_goal_pos = (SCREEN_W//2 - 250, 150)
@@ -454,6 +607,12 @@ class GameState:
         self.ball_in_air = False
         self.keeper_target_x = self.keeper_pos[0]
         
+        # Fixed-timestep physics: unsimulated time (s) and the ball position one step back
+        self.physics_accumulator = 0.0
+        self.prev_ball_pos = None
+        self.shot_steps = 0
+        self.ball_hit = None    # (volume, seconds into the shot, ball position) of the last hit
+        
         self.score = 0
         self.total_shots = 0
         self.goal_scored = None
@@ -484,6 +643,11 @@ class GameState:
         # Track when result phase started (for delay before closing)
         self.result_start_time = None
         
+        # Decision timings (pygame ticks) reported by summary()
+        self.turn_started_at = None
+        self.shooter_decided_at = None
+        self.keeper_decided_at = None
+        
         # Joystick state tracking
         self.shooter_selected_direction = None  # Currently selected direction for shooter
         self.keeper_selected_zone = None  # Currently selected zone for keeper
@@ -492,8 +656,10 @@ class GameState:
         self.shooter_joystick_id = 0  # Default: joystick 0 is shooter
         self.keeper_joystick_id = 1   # Default: joystick 1 is keeper
         
-        # Scaled images
+        # Scaled images (plus the other F-toggle resolution when not sharing the quiz's display)
         self.scale_images()
+        if size is None:
+            self.prebuild_sprites()
         self.update_keeper_zone()
     
     def update_keeper_zone(self):
@@ -515,75 +681,23 @@ class GameState:
         self.scale_x = self.screen_w / SCREEN_W
         self.scale_y = self.screen_h / SCREEN_H
         
-        # Scale goal image (with fallback check)
-        if goal_img_orig is not None:
-            self.goal_img = pygame.transform.scale(goal_img_orig, 
-                                                  (int(500 * self.scale_x), 
-                                                   int(250 * self.scale_y)))
-        else:
-            self.goal_img = create_fallback_goal((int(500 * self.scale_x), int(250 * self.scale_y)))
-        
-        # Scale ball image (with fallback check)
-        if ball_img_orig is not None:
-            self.ball_img = pygame.transform.scale(ball_img_orig,
-                                                  (int(BALL_SIZE[0] * self.scale_x),
-                                                   int(BALL_SIZE[1] * self.scale_y)))
-        else:
-            self.ball_img = create_soccer_ball((int(BALL_SIZE[0] * self.scale_x), int(BALL_SIZE[1] * self.scale_y)))
-        
-        # Scale keeper images (with fallback checks)
-        if keeper_stand_img_orig is not None:
-            self.keeper_stand_img = pygame.transform.scale(keeper_stand_img_orig,
-                                                          (int(100 * self.scale_x),
-                                                           int(130 * self.scale_y)))
-        else:
-            self.keeper_stand_img = create_fallback_keeper((int(100 * self.scale_x), int(130 * self.scale_y)))
-        
-        if keeper_holding_ball_img_orig is not None:
-            self.keeper_holding_ball_img = pygame.transform.scale(keeper_holding_ball_img_orig,
-                                                                (int(100 * self.scale_x),
-                                                                 int(130 * self.scale_y)))
-        else:
-            self.keeper_holding_ball_img = create_fallback_keeper((int(100 * self.scale_x), int(130 * self.scale_y)), holding_ball=True)
-        
-        if keeper_cry_img_orig is not None:
-            self.keeper_cry_img = pygame.transform.scale(keeper_cry_img_orig,
-                                                        (int(100 * self.scale_x),
-                                                         int(130 * self.scale_y)))
-        else:
-            self.keeper_cry_img = create_fallback_keeper((int(100 * self.scale_x), int(130 * self.scale_y)), crying=True)
-        
-        # Scale shooter images (with fallback checks)
-        if shooter_stand_img_orig is not None:
-            self.shooter_stand_img = pygame.transform.scale(shooter_stand_img_orig,
-                                                           (int(140 * self.scale_x),
-                                                            int(180 * self.scale_y)))
-        else:
-            self.shooter_stand_img = create_fallback_shooter((int(140 * self.scale_x), int(180 * self.scale_y)))
-        
-        if shooter_shoot_img_orig is not None:
-            self.shooter_shoot_img = pygame.transform.scale(shooter_shoot_img_orig,
-                                                           (int(140 * self.scale_x),
-                                                            int(180 * self.scale_y)))
-        else:
-            self.shooter_shoot_img = create_fallback_shooter((int(140 * self.scale_x), int(180 * self.scale_y)), shooting=True)
-        
-        if shooter_sui_img_orig is not None:
-            self.shooter_sui_img = pygame.transform.scale(shooter_sui_img_orig,
-                                                         (int(140 * self.scale_x),
-                                                          int(180 * self.scale_y)))
-        else:
-            self.shooter_sui_img = create_fallback_shooter((int(140 * self.scale_x), int(180 * self.scale_y)), celebrating=True)
+        # goal_img, ball_img, keeper_stand_img, ..., fans_img, grass_img: views into the atlas
+        self.atlas = scene_atlas(self.screen_w, self.screen_h)
+        for name, img in self.atlas.views.items():
+            setattr(self, f"{name}_img", img)
         
         self.update_images()
-        
-        self.fans_img = pygame.transform.scale(fans_img_orig,
-                                              (self.screen_w, int(300 * self.scale_y)))
-        self.grass_img = pygame.transform.scale(grass_img_orig,
-                                               (self.screen_w, int(300 * self.scale_y)))
-        
         self.update_positions()
     
+    def display_sizes(self):
+        """Resolutions the F key switches between: windowed and fullscreen"""
+        return [(SCREEN_W, SCREEN_H), tuple(pygame.display.get_desktop_sizes()[0])]
+    
+    def prebuild_sprites(self):
+        """Scale the sprites for every display size up front so toggling F is instant"""
+        for size in self.display_sizes():
+            scene_atlas(*size)
+    
     def update_images(self):
         """Update which images to display based on game state"""
         # Shooter images logic
@@ -614,26 +728,12 @@ class GameState:
             self.current_keeper_image = "stand"
     
     def get_keeper_image(self):
-        """Return the correct keeper image based on current state"""
-        if self.current_keeper_image == "stand":
-            return self.keeper_stand_img
-        elif self.current_keeper_image == "holding":
-            return self.keeper_holding_ball_img
-        elif self.current_keeper_image == "cry":
-            return self.keeper_cry_img
-        else:
-            return self.keeper_stand_img
+        """Return the correct keeper image (an atlas view) based on current state"""
+        return self.atlas[KEEPER_SPRITES.get(self.current_keeper_image, "keeper_stand")]
     
     def get_shooter_image(self):
-        """Return the correct shooter image based on current state"""
-        if self.current_shooter_image == "stand":
-            return self.shooter_stand_img
-        elif self.current_shooter_image == "shoot":
-            return self.shooter_shoot_img
-        elif self.current_shooter_image == "sui":
-            return self.shooter_sui_img
-        else:
-            return self.shooter_stand_img
+        """Return the correct shooter image (an atlas view) based on current state"""
+        return self.atlas[SHOOTER_SPRITES.get(self.current_shooter_image, "shooter_stand")]
     
     def update_positions(self):
         self.goal_pos = [self.original_positions['goal'][0] * self.scale_x,
@@ -647,12 +747,70 @@ class GameState:
         
         self.ball_pos = [self.original_positions['ball'][0] * self.scale_x,
                          self.original_positions['ball'][1] * self.scale_y]
+        self.prev_ball_pos = None
         
         if hasattr(self, 'keeper_target_x'):
             self.keeper_target_x = self.original_positions['keeper'][0] * self.scale_x
         
         self.update_keeper_zone()
+        self.build_hit_volumes()
+    
+    def build_hit_volumes(self):
+        """
+        Collision boxes (left, top, right, bottom) for this resolution; nothing in them moves
+        during a shot, so check_collisions never rebuilds them:
+        goal  - the goal mouth the ball must reach (inner 80% of the goal image)
+        posts - left post, right post and crossbar along the mouth's edges
+        keeper - the keeper's box at each zone the keeper can dive to
+        bounds - goal and posts together; a path missing it needs no further tests
+        """
+        goal_w, goal_h = self.goal_img.get_size()
+        left = self.goal_pos[0] + goal_w * 0.1
+        top = self.goal_pos[1] + goal_h * 0.1
+        right = left + goal_w * 0.8
+        bottom = top + goal_h * 0.8
+        post = goal_w * 0.015
+        bar = goal_h * 0.015
+        keeper_w, keeper_h = self.keeper_stand_img.get_size()
+        keeper_y = self.original_positions['keeper'][1] * self.scale_y
+        keeper_right = right - keeper_w
+        keeper_x = {"left": left, "middle": left + (keeper_right - left) / 2, "right": keeper_right}
+        self.hit_volumes = {
+            "goal": (left, top, right, bottom),
+            "posts": [(left - post, top - bar, left + post, bottom),
+                      (right - post, top - bar, right + post, bottom),
+                      (left - post, top - bar, right + post, top + bar)],
+            "keeper": {zone: (x, keeper_y, x + keeper_w, keeper_y + keeper_h) for zone, x in keeper_x.items()},
+            "bounds": (left - post, top - bar, right + post, bottom),
+        }
     
+    def ball_draw_pos(self):
+        """Ball position to draw: interpolated between the last two physics steps while in flight"""
+        if not self.ball_in_air or self.prev_ball_pos is None:
+            return self.ball_pos
+        t = self.physics_accumulator / PHYSICS_DT
+        return (self.prev_ball_pos[0] + (self.ball_pos[0] - self.prev_ball_pos[0]) * t,
+                self.prev_ball_pos[1] + (self.ball_pos[1] - self.prev_ball_pos[1]) * t)
+    
+    def summary(self):
+        """Structured result of the last penalty (saved/goal, directions, decision times in ms)"""
+        def span(start, end):
+            return None if start is None or end is None else end - start
+        return {
+            "saved": bool(self.keeper_saved),
+            "shot_direction": self.shooter_decision,
+            "ball_zone": self.ball_target_zone,
+            "keeper_zone": self.keeper_decision,
+            "shooter_ms": span(self.turn_started_at, self.shooter_decided_at),
+            "keeper_ms": span(self.shooter_decided_at, self.keeper_decided_at),
+        }
+
+    def match_display(self, surface):
+        """Rescale the scene if the (shared) display changed size since the last penalty"""
+        if surface.get_size() != (self.screen_w, self.screen_h):
+            self.screen_w, self.screen_h = surface.get_size()
+            self.scale_images()
+
     def toggle_fullscreen(self):
         self.fullscreen = not self.fullscreen
         if self.fullscreen:
@@ -666,10 +824,18 @@ class GameState:
         return screen
     
     def reset_for_next_shot(self):
+        self.result_start_time = None
+        self.turn_started_at = None
+        self.shooter_decided_at = None
+        self.keeper_decided_at = None
         self.ball_in_air = False
         self.ball_stopped = False
         self.ready_for_next_shot = False
         self.ball_velocity = [0, 0]
+        self.physics_accumulator = 0.0
+        self.prev_ball_pos = None
+        self.shot_steps = 0
+        self.ball_hit = None
         self.shot_processed = False
         self.goal_scored = None
         self.ball_saved = False
@@ -724,6 +890,7 @@ class GameState:
         
         actual_direction = direction_map.get(direction, "top")
         self.shooter_decision = actual_direction
+        self.shooter_decided_at = pygame.time.get_ticks()
         
         # Update display
         self.shooter_choice_display = direction.capitalize()
@@ -739,6 +906,7 @@ class GameState:
             return False
         
         self.keeper_decision = zone
+        self.keeper_decided_at = pygame.time.get_ticks()
         
         # Update display
         self.keeper_choice_display = zone.capitalize()
@@ -802,7 +970,7 @@ def shoot_ball(direction):
     else:
         game.ball_target_zone = "middle"
 
-    speed = 12
+    speed = SHOT_SPEED
     dx, dy = 0, 0
     
     goal_area = {
@@ -846,6 +1014,9 @@ def shoot_ball(direction):
     dx /= length
     dy /= length
     game.ball_velocity = [dx * speed, dy * speed]
+    game.prev_ball_pos = None
+    game.shot_steps = 0
+    game.ball_hit = None
     game.ball_in_air = True
     game.ball_stopped = False
     game.ready_for_next_shot = False
@@ -853,23 +1024,122 @@ def shoot_ball(direction):
     game.keeper_saved = False
 
 # ------------------------------------------------
-# SIMPLE COLLISION DETECTION - FIXED
+# FIXED-TIMESTEP BALL PHYSICS
+# ------------------------------------------------
+def step_physics():
+    """Advance the ball by one PHYSICS_DT step (movement, collisions, goal slowdown); False if it is not moving"""
+    if not game.ball_in_air or game.ball_stopped:
+        return False
+    game.prev_ball_pos = list(game.ball_pos)
+    game.shot_steps += 1
+    game.ball_pos[0] += game.ball_velocity[0] * game.scale_x * STEP_SCALE
+    game.ball_pos[1] += game.ball_velocity[1] * game.scale_y * STEP_SCALE
+    
+    check_collisions()
+    
+    if game.goal_scored == True and game.ball_in_air:
+        game.ball_velocity[0] *= GOAL_DAMPING
+        game.ball_velocity[1] *= GOAL_DAMPING
+        
+        if abs(game.ball_velocity[0]) < 0.5 and abs(game.ball_velocity[1]) < 0.5:
+            game.ball_in_air = False
+            game.ball_stopped = True
+            game.ready_for_next_shot = True
+            game.ball_velocity = [0, 0]
+    return True
+
+def advance_physics(frame_time):
+    """
+    Run as many fixed steps as `frame_time` seconds of real time allow; the remainder is
+    carried over and used by GameState.ball_draw_pos for interpolation. Needs no display,
+    so a shot can be played headlessly by calling this with any sequence of frame times.
+    Returns the number of steps in which the ball moved.
+    """
+    game.physics_accumulator += min(frame_time, MAX_FRAME_TIME)
+    steps = 0
+    while game.physics_accumulator >= PHYSICS_DT:
+        steps += step_physics()
+        game.physics_accumulator -= PHYSICS_DT
+    return steps
+
+# ------------------------------------------------
+# SWEPT COLLISION DETECTION
 # ------------------------------------------------
+def sweep_box(start, end, size, box):
+    """
+    First moment (0..1) at which a size[0] x size[1] ball moving its top-left corner from
+    `start` to `end` overlaps `box` (left, top, right, bottom); None if it never does in
+    this step. The box is grown by the ball's size, so the ball is a point on a segment
+    (slab test).
+    """
+    t_enter, t_exit = 0.0, 1.0
+    for axis in (0, 1):
+        low = box[axis] - size[axis]
+        high = box[axis + 2]
+        move = end[axis] - start[axis]
+        if move == 0:
+            if not low < start[axis] < high:
+                return None
+            continue
+        t0 = (low - start[axis]) / move
+        t1 = (high - start[axis]) / move
+        if t0 > t1:
+            t0, t1 = t1, t0
+        t_enter = max(t_enter, t0)
+        t_exit = min(t_exit, t1)
+        if t_enter >= t_exit:
+            return None
+    return t_enter
+
+def end_shot_missed():
+    game.goal_scored = False
+    game.shot_processed = True
+    game.ball_in_air = False
+    game.ball_stopped = True
+    game.ready_for_next_shot = True
+    game.game_phase = "result"
+    game.keeper_saved = False
+    game.show_keeper_reaction = True
+    game.result_start_time = pygame.time.get_ticks()  # Track when result phase started
+    
+    # Set the correct image states
+    game.current_keeper_image = "cry"  # Keeper is sad even though ball missed
+    game.current_shooter_image = "stand"  # Shooter stands
+
 def check_collisions():
+    """
+    Test the ball's path over the last physics step (not just where it ended up) against
+    the precomputed hit volumes, so a fast ball cannot jump over the goal between steps.
+    The earliest volume crossed decides; who wins at the goal mouth is still decided by
+    the zones the shooter and keeper picked.
+    """
     if not game.ball_in_air or game.ball_stopped or game.shot_processed:
         return
     
-    ball_rect = pygame.Rect(game.ball_pos[0], game.ball_pos[1],
-                           game.ball_img.get_width(), game.ball_img.get_height())
-    
-    goal_rect = pygame.Rect(
-        game.goal_pos[0] + game.goal_img.get_width() * 0.1,
-        game.goal_pos[1] + game.goal_img.get_height() * 0.1,
-        game.goal_img.get_width() * 0.8,
-        game.goal_img.get_height() * 0.8
-    )
-    
-    if ball_rect.colliderect(goal_rect):
+    start = game.prev_ball_pos or game.ball_pos
+    end = game.ball_pos
+    size = game.ball_img.get_size()
+    hit = None      # (t, volume); on a tie the post wins, the ball strikes it on the way in
+    if sweep_box(start, end, size, game.hit_volumes["bounds"]) is not None:
+        for box in game.hit_volumes["posts"]:
+            t = sweep_box(start, end, size, box)
+            if t is not None and (hit is None or t < hit[0]):
+                hit = (t, "post")
+        t = sweep_box(start, end, size, game.hit_volumes["goal"])
+        if t is not None and (hit is None or t < hit[0]):
+            hit = (t, "goal")
+    
+    if hit:
+        t, volume = hit
+        point = (start[0] + (end[0] - start[0]) * t, start[1] + (end[1] - start[1]) * t)
+        game.ball_hit = (volume, (game.shot_steps - 1 + t) * PHYSICS_DT, point)
+        
+        if volume == "post":
+            # BALL HIT THE WOODWORK - no goal; it drops where it struck
+            end_shot_missed()
+            game.ball_pos = list(point)
+            return
+        
         if game.ball_target_zone == game.keeper_zone:
             # KEEPER SAVES THE BALL
             game.goal_scored = False
@@ -889,10 +1159,9 @@ def check_collisions():
             game.current_shooter_image = "stand"  # Shooter should be standing when keeper saves
             
             # Position ball in keeper's hands
-            keeper_center_x = game.keeper_pos[0] + game.keeper_stand_img.get_width() // 2
-            keeper_center_y = game.keeper_pos[1] + game.keeper_stand_img.get_height() // 2
-            game.ball_pos[0] = keeper_center_x - game.ball_img.get_width() // 2
-            game.ball_pos[1] = keeper_center_y - game.ball_img.get_height() // 2
+            left, top, right, bottom = game.hit_volumes["keeper"][game.keeper_zone]
+            game.ball_pos[0] = (left + right) / 2 - size[0] // 2
+            game.ball_pos[1] = (top + bottom) / 2 - size[1] // 2
             return
         else:
             # GOAL SCORED
@@ -916,20 +1185,7 @@ def check_collisions():
         game.ball_pos[0] > game.screen_w or 
         game.ball_pos[1] > game.screen_h):
         # BALL MISSED THE GOAL
-        game.goal_scored = False
-        game.shot_processed = True
-        game.ball_in_air = False
-        game.ball_stopped = True
-        game.ready_for_next_shot = True
-        game.game_phase = "result"
-        game.keeper_saved = False
-        game.show_keeper_reaction = True
-        game.result_start_time = pygame.time.get_ticks()  # Track when result phase started
-        
-        # Set the correct image states
-        game.current_keeper_image = "cry"  # Keeper is sad even though ball missed
-        game.current_shooter_image = "stand"  # Shooter stands
-        
+        end_shot_missed()
         game.ball_pos = [game.original_positions['ball'][0] * game.scale_x,
                         game.original_positions['ball'][1] * game.scale_y]
 
@@ -967,7 +1223,7 @@ def draw():
     
     # Draw ball (unless it's being held by the keeper)
     if not (game.keeper_saved and game.current_keeper_image == "holding"):
-        screen.blit(game.ball_img, game.ball_pos)
+        screen.blit(game.ball_img, game.ball_draw_pos())
 
     # Score
     score_text = font.render(f"Score: {game.score}/{game.total_shots}", True, (255, 255, 255))
@@ -1078,12 +1334,14 @@ def draw():
 # ------------------------------------------------
 # GAME LOOP
 # ------------------------------------------------
-def run_game(quit_pygame=True):
+def run_game(quit_pygame=True, embedded=False):
     """
     Run the game and return True if saved, False otherwise
     
     Args:
         quit_pygame: If True, quit pygame at the end. If False, keep pygame running.
+        embedded: Running inside the quiz process. Closing the window is handed back to the
+            quiz (which saves its data before exiting) and the display mode is never changed.
     """
     global screen, clock
     # Ensure screen and clock are initialized
@@ -1102,9 +1360,13 @@ def run_game(quit_pygame=True):
         if joy:
             print(f"   - Joystick {i}: {joy.get_name()}")
     
+    last_time = time.perf_counter()
     while True:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                if embedded:
+                    pygame.event.post(pygame.event.Event(pygame.QUIT))
+                    return False
                 pygame.quit()
                 sys.exit()
             
@@ -1175,7 +1437,7 @@ def run_game(quit_pygame=True):
                             print(f"📍 Keeper selected zone (axis): middle")
 
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_f:
+                if event.key == pygame.K_f and not embedded:
                     game.toggle_fullscreen()
                 
                 # Start the game from instructions
@@ -1309,22 +1571,14 @@ def run_game(quit_pygame=True):
                         else:
                             print(f"⚠️ Keeper must select a zone first before confirming!")
 
-        # Ball movement (after shot is executed)
-        if game.ball_in_air and not game.ball_stopped:
-            game.ball_pos[0] += game.ball_velocity[0] * game.scale_x
-            game.ball_pos[1] += game.ball_velocity[1] * game.scale_y
-
-            check_collisions()
+        # Shooter's clock starts when the instructions screen is left
+        if game.turn_started_at is None and game.game_phase != "instructions":
+            game.turn_started_at = pygame.time.get_ticks()
 
-            if game.goal_scored == True and game.ball_in_air:
-                game.ball_velocity[0] *= 0.95
-                game.ball_velocity[1] *= 0.95
-                
-                if abs(game.ball_velocity[0]) < 0.5 and abs(game.ball_velocity[1]) < 0.5:
-                    game.ball_in_air = False
-                    game.ball_stopped = True
-                    game.ready_for_next_shot = True
-                    game.ball_velocity = [0, 0]
+        # Ball movement (after shot is executed), in fixed steps for the real time elapsed
+        now = time.perf_counter()
+        advance_physics(now - last_time)
+        last_time = now
 
         # Check if shot is complete and ball has stopped
         if game.shot_processed and (game.ball_stopped or not game.ball_in_air):
@@ -1347,98 +1601,445 @@ def run_game(quit_pygame=True):
         draw()
         clock.tick(FPS)
 
-def run_penalty_shootout(goalkeeper, attacker):
+def prepare_penalty(goalkeeper, attacker, embedded=False):
+    """
+    Set up pygame, sprites and GameState for a penalty without running the loop.
+    
+    Images are loaded only on the first call; later calls in the same process just reset
+    the GameState, which is what makes the in-process penalty start quickly.
+    """
+    global game
+    init_soccer_pygame(share_display=embedded)
+    
+    # Verify screen was initialized
+    if screen is None:
+        print("ERROR: screen is None after init_soccer_pygame()")
+        raise RuntimeError("Failed to initialize screen in penalty shootout")
+    
+    # Initialize game state if needed (kept alive between penalties in the same process)
+    if game is None:
+        print("Creating new GameState")
+        game = GameState(screen.get_size() if embedded else None)
+    else:
+        # Reset game state for new penalty
+        print("Resetting GameState for new penalty")
+        if embedded:
+            game.match_display(screen)
+        game.reset_for_next_shot()
+        game.game_phase = "instructions"
+        
+    # Map joysticks to roles based on who is attacker and goalkeeper
+    # In math quiz: p1 = joystick 0, p2 = joystick 1
+    # This ensures each player only controls their assigned role
+    if attacker == "p1":
+        game.shooter_joystick_id = 0  # Player 1 (joystick 0) is shooter
+    elif attacker == "p2":
+        game.shooter_joystick_id = 1  # Player 2 (joystick 1) is shooter
+    else:
+        # Default fallback
+        game.shooter_joystick_id = 0
+        print(f"⚠️ Warning: Unknown attacker '{attacker}', defaulting to joystick 0")
+    
+    if goalkeeper == "p1":
+        game.keeper_joystick_id = 0  # Player 1 (joystick 0) is keeper
+    elif goalkeeper == "p2":
+        game.keeper_joystick_id = 1  # Player 2 (joystick 1) is keeper
+    else:
+        # Default fallback
+        game.keeper_joystick_id = 1
+        print(f"⚠️ Warning: Unknown goalkeeper '{goalkeeper}', defaulting to joystick 1")
+    
+    # Safety check: Ensure attacker and goalkeeper are different players
+    if attacker == goalkeeper:
+        print(f"⚠️ ERROR: Attacker and goalkeeper are the same player ({attacker})! This should not happen.")
+        # Force different joysticks to prevent one player controlling both roles
+        if attacker == "p1":
+            game.keeper_joystick_id = 1  # Force p2 to be keeper
+        else:
+            game.keeper_joystick_id = 0  # Force p1 to be keeper
+    
+    # Final safety check: Ensure joysticks are different
+    if game.shooter_joystick_id == game.keeper_joystick_id:
+        print(f"⚠️ ERROR: Shooter and keeper are using the same joystick ({game.shooter_joystick_id})! Preventing conflict.")
+        # Swap keeper to different joystick
+        game.keeper_joystick_id = 1 if game.shooter_joystick_id == 0 else 0
+    
+    print(f"🎮 Joystick mapping: Shooter = Joystick {game.shooter_joystick_id} ({attacker}), Keeper = Joystick {game.keeper_joystick_id} ({goalkeeper})")
+    print(f"✅ Role separation: Each player controls only their assigned role")
+    return game
+
+
+def run_penalty_shootout(goalkeeper, attacker, embedded=False):
     """
     Wrapper function for penalty shootout game.
     
     Args:
         goalkeeper: Name/identifier of the goalkeeper player ("p1" or "p2")
         attacker: Name/identifier of the attacker/penalty taker ("p1" or "p2")
+        embedded: Run as a scene inside the quiz process, drawing on its display.
+            Errors are raised instead of swallowed so the caller can fall back to a subprocess.
     
     Returns:
         True if goalkeeper saved (no goal), False if goal was scored
     """
-    global game, screen, clock, font, title_font
-    
     try:
-        # Initialize pygame and game state if not already done
         print(f"Initializing penalty shootout for {goalkeeper} (GK) vs {attacker} (Attacker)")
-        init_soccer_pygame()
-        
-        # Verify screen was initialized
-        if screen is None:
-            print("ERROR: screen is None after init_soccer_pygame()")
-            raise RuntimeError("Failed to initialize screen in penalty shootout")
-        
-        print(f"Screen initialized: {screen}, size: {screen.get_size() if screen else 'N/A'}")
-        
-        # Initialize game state if needed
-        if game is None:
-            print("Creating new GameState")
-            game = GameState()
-        else:
-            # Reset game state for new penalty
-            print("Resetting GameState for new penalty")
-            game.reset_for_next_shot()
-            game.game_phase = "instructions"
-        
-        # Map joysticks to roles based on who is attacker and goalkeeper
-        # In math quiz: p1 = joystick 0, p2 = joystick 1
-        # This ensures each player only controls their assigned role
-        if attacker == "p1":
-            game.shooter_joystick_id = 0  # Player 1 (joystick 0) is shooter
-        elif attacker == "p2":
-            game.shooter_joystick_id = 1  # Player 2 (joystick 1) is shooter
-        else:
-            # Default fallback
-            game.shooter_joystick_id = 0
-            print(f"⚠️ Warning: Unknown attacker '{attacker}', defaulting to joystick 0")
-        
-        if goalkeeper == "p1":
-            game.keeper_joystick_id = 0  # Player 1 (joystick 0) is keeper
-        elif goalkeeper == "p2":
-            game.keeper_joystick_id = 1  # Player 2 (joystick 1) is keeper
-        else:
-            # Default fallback
-            game.keeper_joystick_id = 1
-            print(f"⚠️ Warning: Unknown goalkeeper '{goalkeeper}', defaulting to joystick 1")
-        
-        # Safety check: Ensure attacker and goalkeeper are different players
-        if attacker == goalkeeper:
-            print(f"⚠️ ERROR: Attacker and goalkeeper are the same player ({attacker})! This should not happen.")
-            # Force different joysticks to prevent one player controlling both roles
-            if attacker == "p1":
-                game.keeper_joystick_id = 1  # Force p2 to be keeper
-            else:
-                game.keeper_joystick_id = 0  # Force p1 to be keeper
-        
-        # Final safety check: Ensure joysticks are different
-        if game.shooter_joystick_id == game.keeper_joystick_id:
-            print(f"⚠️ ERROR: Shooter and keeper are using the same joystick ({game.shooter_joystick_id})! Preventing conflict.")
-            # Swap keeper to different joystick
-            game.keeper_joystick_id = 1 if game.shooter_joystick_id == 0 else 0
-        
-        print(f"🎮 Joystick mapping: Shooter = Joystick {game.shooter_joystick_id} ({attacker}), Keeper = Joystick {game.keeper_joystick_id} ({goalkeeper})")
-        print(f"✅ Role separation: Each player controls only their assigned role")
+        prepare_penalty(goalkeeper, attacker, embedded)
         
         # Run the game and get result (don't quit pygame so main game continues)
         print("Starting penalty shootout game loop")
-        result = run_game(quit_pygame=False)
+        result = run_game(quit_pygame=False, embedded=embedded)
         print(f"Penalty shootout result: {result} (True=saved, False=goal)")
         
         # Return True if saved (keeper won), False if goal scored (attacker won)
         return result
     except Exception as e:
+        if embedded:
+            raise
         print(f"Error in run_penalty_shootout: {e}")
         import traceback
         traceback.print_exc()
         # Return False (goal scored) as default to not break the game flow
         return False
 
+
+# ------------------------------------------------
+# BENCHMARK
+# ------------------------------------------------
+def _remove_background_loop(img):
+    """The previous per-pixel implementation, kept only as the benchmark reference"""
+    img_with_alpha = pygame.Surface(img.get_size(), pygame.SRCALPHA)
+    for x in range(img.get_width()):
+        for y in range(img.get_height()):
+            color = img.get_at((x, y))
+            if color[0] > 200 and color[1] > 200 and color[2] > 200:
+                img_with_alpha.set_at((x, y), (255, 255, 255, 0))
+            else:
+                img_with_alpha.set_at((x, y), (*color[:3], 255))
+    return img_with_alpha
+
+def benchmark_background(feather=8):
+    """
+    Background removal on the shipped images/*.png files: per-pixel loop vs. vectorized.
+    
+    The PNGs already carry alpha, so opaque copies (as a JPG or flattened PNG would load)
+    are processed. Also checks that the vectorized mask matches the loop's exactly.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    here = os.path.dirname(os.path.abspath(__file__))
+    total_loop = total_fast = 0.0
+    for path in sorted(glob.glob(os.path.join(here, "images", "*.png"))):
+        opaque = pygame.image.load(path).convert()
+        t = time.perf_counter()
+        slow = _remove_background_loop(opaque)
+        loop_s = time.perf_counter() - t
+        t = time.perf_counter()
+        fast = remove_background(opaque)
+        fast_s = time.perf_counter() - t
+        t = time.perf_counter()
+        remove_background(opaque, feather=feather)
+        feather_s = time.perf_counter() - t
+        same = np.array_equal(pygame.surfarray.array_alpha(slow), pygame.surfarray.array_alpha(fast))
+        total_loop += loop_s
+        total_fast += fast_s
+        w, h = opaque.get_size()
+        print(f"{os.path.basename(path):<24} {w:>4}x{h:<4} loop {loop_s * 1000:8.1f} ms | "
+              f"vectorized {fast_s * 1000:6.2f} ms (feather={feather}: {feather_s * 1000:5.2f} ms) | "
+              f"same mask: {same}")
+    print(f"total: loop {total_loop:.2f} s, vectorized {total_fast * 1000:.1f} ms "
+          f"({total_loop / total_fast:.0f}x)")
+    pygame.quit()
+
+def benchmark_cache(size=(1920, 1080)):
+    """
+    Sprite loading for the penalty scene: load_all_images + GameState.scale_images at
+    `size`, without the disk cache, with an empty cache (cold) and with a filled one (warm).
+    """
+    global sprite_cache
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode(size)
+    stdout = sys.stdout
+    directory = tempfile.mkdtemp(prefix="sprite-cache-")
+    try:
+        for label, cache in (("no cache", SpriteCache(directory, enabled=False)),
+                             ("cold cache", SpriteCache(directory)),
+                             ("warm cache", SpriteCache(directory))):
+            sprite_cache = cache
+            clear_hash_memo()     # as in a freshly started process
+            sys.stdout = open(os.devnull, "w")
+            started = time.perf_counter()
+            load_all_images()
+            GameState(size)
+            elapsed = time.perf_counter() - started
+            sys.stdout.close()
+            sys.stdout = stdout
+            print(f"{label:<10}: {elapsed * 1000:7.1f} ms  (hits {cache.hits}, misses {cache.misses})")
+    finally:
+        sys.stdout = stdout
+        sprite_cache = SpriteCache()
+        shutil.rmtree(directory, ignore_errors=True)
+    pygame.quit()
+
+def benchmark_toggle(rounds=5, size=(3840, 2160)):
+    """
+    Cost of pressing F (GameState.scale_images for the other resolution, windowed <-> `size`):
+    rescaling every time with transform.scale (the old behaviour) vs. the pre-built
+    (sprite, size) cache.
+    """
+    global SCALE_QUALITY, sprite_cache
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((SCREEN_W, SCREEN_H))
+    sizes = [(SCREEN_W, SCREEN_H), size]
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    sprite_cache = SpriteCache(enabled=False)     # measure scaling, not disk reads
+    try:
+        load_all_images()
+        game_state = GameState(sizes[0])
+        results = {}
+        for label, quality, cached in (("rescale (scale)", "fast", False),
+                                       ("rescale (smoothscale)", "smooth", False),
+                                       ("cached", "smooth", True)):
+            SCALE_QUALITY = quality
+            scene_atlases.clear()
+            for width, height in sizes:
+                scene_atlas(width, height)
+            times = []
+            for i in range(rounds * 2):
+                if not cached:
+                    scene_atlases.clear()
+                game_state.screen_w, game_state.screen_h = sizes[i % 2]
+                started = time.perf_counter()
+                game_state.scale_images()
+                times.append(time.perf_counter() - started)
+            results[label] = sum(times) / len(times)     # both directions
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+        SCALE_QUALITY = "smooth"
+        sprite_cache = SpriteCache()
+    for label, seconds in results.items():
+        print(f"{label:<22}: {seconds * 1000:7.2f} ms / toggle")
+    pygame.quit()
+
+def benchmark_atlas(frames=1000, size=(1920, 1080)):
+    """
+    Sprite part of draw() (background, goal, keeper, shooter, ball) from ten separate
+    surfaces vs. views into the resolution's atlas, plus the pixel memory each holds.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    display = pygame.display.set_mode(size)
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        load_all_images()
+        game_state = GameState(size)
+        sprites = scene_sprites(*size)
+        atlas = scene_atlas(*size)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    print(f"atlas pages: {', '.join(f'{p.get_width()}x{p.get_height()}' for p in atlas.pages)}, "
+          f"views identical to the sprites: {atlas.same_pixels(sprites)}")
+    separate_bytes = sum(s.get_width() * s.get_height() * s.get_bytesize() for s in sprites.values())
+    print(f"surfaces: {len(sprites)} separate ({separate_bytes / 1e6:.1f} MB) vs "
+          f"{len(atlas.pages)} atlas pages ({atlas.memory_bytes() / 1e6:.1f} MB)")
+    positions = [("fans", (0, 0)),
+                 ("grass", (0, game_state.screen_h - sprites["grass"].get_height())),
+                 ("goal", game_state.goal_pos), ("keeper_stand", game_state.keeper_pos),
+                 ("shooter_stand", game_state.player_pos), ("ball", game_state.ball_pos)]
+    for label, images in (("separate", sprites), ("atlas", atlas.views)):
+        started = time.perf_counter()
+        for _ in range(frames):
+            for name, pos in positions:
+                display.blit(images[name], pos)
+        elapsed = time.perf_counter() - started
+        print(f"{label:<9}: {elapsed / frames * 1000:6.3f} ms / frame")
+    pygame.quit()
+
+def benchmark_physics(size=(1920, 1080)):
+    """
+    Plays the same shots headlessly (advance_physics only, nothing drawn) at several frame
+    rates, including an irregular one, and prints how many physics steps the shot took and
+    where the ball ended up. With fixed-timestep physics every row should match.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode(size)
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        prepare_penalty("p1", "p2", embedded=True)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    jitter = [1 / 144, 1 / 30, 1 / 90, 1 / 20, 1 / 240, 1 / 60]
+    for shot, dive in (("right", "left"), ("left", "left"), ("middle", "right")):
+        print(f"shot {shot}, keeper dives {dive}:")
+        for label, frames in (("30 Hz", [1 / 30]), ("60 Hz", [1 / 60]), ("144 Hz", [1 / 144]),
+                              ("jittery", jitter)):
+            game.reset_for_next_shot()
+            game.shooter_makes_decision(shot)
+            game.keeper_makes_decision(dive)
+            steps = i = 0
+            while game.ball_in_air and not game.ball_stopped and i < 1000:
+                steps += advance_physics(frames[i % len(frames)])
+                i += 1
+            result = "saved" if game.keeper_saved else "goal" if game.goal_scored else "miss"
+            print(f"  {label:<8} {i:4d} frames | {result} after {steps} physics steps "
+                  f"({steps * PHYSICS_DT:.3f} s), ball at ({game.ball_pos[0]:.2f}, {game.ball_pos[1]:.2f})")
+    pygame.quit()
+
+def _overlaps_goal_discrete(pos):
+    """The previous per-frame test (fresh Rects, overlap at the end position only), as a reference"""
+    ball_rect = pygame.Rect(pos[0], pos[1], game.ball_img.get_width(), game.ball_img.get_height())
+    goal_rect = pygame.Rect(
+        game.goal_pos[0] + game.goal_img.get_width() * 0.1,
+        game.goal_pos[1] + game.goal_img.get_height() * 0.1,
+        game.goal_img.get_width() * 0.8,
+        game.goal_img.get_height() * 0.8
+    )
+    return ball_rect.colliderect(goal_rect)
+
+def benchmark_collision(size=(1920, 1080), calls=100000):
+    """
+    Shots at rising SHOT_SPEED: the swept test against the precomputed volumes vs. the old
+    overlap test at each step's end position (which lets a fast ball jump over the goal),
+    plus the cost of one collision test.
+    """
+    global SHOT_SPEED
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode(size)
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        prepare_penalty("p1", "p2", embedded=True)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    try:
+        for speed in (12, 120, 600, 1200, 2400):
+            SHOT_SPEED = speed
+            game.reset_for_next_shot()
+            start = list(game.ball_pos)
+            game.shooter_makes_decision("middle")
+            game.keeper_makes_decision("right")
+            # Old test along the same path: step ends only, until the ball leaves the screen
+            velocity = [v * STEP_SCALE for v in game.ball_velocity]
+            pos, discrete = list(start), "miss (jumped over the goal)"
+            while -1000 < pos[1] < game.screen_h and -1000 < pos[0] < game.screen_w:
+                pos = [pos[0] + velocity[0] * game.scale_x, pos[1] + velocity[1] * game.scale_y]
+                if _overlaps_goal_discrete(pos):
+                    discrete = "goal"
+                    break
+            while game.ball_in_air and not game.shot_processed:
+                step_physics()
+            if game.ball_hit:
+                volume, seconds, point = game.ball_hit
+                swept = f"{volume} at {seconds * 1000:6.2f} ms, ({point[0]:.1f}, {point[1]:.1f})"
+            else:
+                swept = "miss"
+            print(f"speed {speed:5d}: swept -> {swept:<36} | discrete -> {discrete}")
+    finally:
+        SHOT_SPEED = 12
+    
+    game.reset_for_next_shot()
+    pos, end, ball_size = list(game.ball_pos), [game.ball_pos[0] + 3, game.ball_pos[1] - 5], game.ball_img.get_size()
+    volumes = [game.hit_volumes["goal"]] + game.hit_volumes["posts"]
+    started = time.perf_counter()
+    for _ in range(calls):
+        _overlaps_goal_discrete(end)
+    old = time.perf_counter() - started
+    started = time.perf_counter()
+    for _ in range(calls):
+        sweep_box(pos, end, ball_size, game.hit_volumes["bounds"])
+    far = time.perf_counter() - started
+    started = time.perf_counter()
+    for _ in range(calls):
+        for box in volumes:
+            sweep_box(pos, end, ball_size, box)
+    near = time.perf_counter() - started
+    print(f"one test: rects + colliderect {old / calls * 1e6:.2f} us | swept: away from the goal "
+          f"{far / calls * 1e6:.2f} us (bounds only), at the goal {(far + near) / calls * 1e6:.2f} us")
+    pygame.quit()
+
+def benchmark(rounds=3, size=(1920, 1080)):
+    """
+    Penalty start latency: time until the first frame of the penalty scene is drawn.
+    
+    "subprocess" starts a new interpreter per penalty (the old way), "in-process" runs the
+    scene on an already open display; its first call pays for image loading once.
+    Runs headless with SDL's dummy drivers unless a video driver is already chosen.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    here = os.path.dirname(os.path.abspath(__file__))
+    child = "import soccer; soccer.prepare_penalty('p1', 'p2'); soccer.draw(); soccer.pygame.display.flip()"
+    times = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", child], cwd=here, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - started)
+    print(f"subprocess : {min(times) * 1000:7.1f} ms / penalty (best of {rounds})")
+    
+    pygame.init()
+    pygame.display.set_mode(size)   # the quiz's window
+    stdout = sys.stdout
+    times = []
+    for _ in range(rounds + 1):
+        sys.stdout = open(os.devnull, "w")
+        started = time.perf_counter()
+        prepare_penalty("p1", "p2", embedded=True)
+        draw()
+        pygame.display.flip()
+        times.append(time.perf_counter() - started)
+        sys.stdout.close()
+        sys.stdout = stdout
+    print(f"in-process : {times[0] * 1000:7.1f} ms first penalty (loads images), "
+          f"{min(times[1:]) * 1000:.1f} ms after")
+    pygame.quit()
+
 # Run the game and exit with return value
 if __name__ == "__main__":
     import sys
     
+    # python soccer.py --bench      penalty start latency (subprocess vs. in-process)
+    # python soccer.py --bench-bg   background removal (per-pixel loop vs. vectorized)
+    # python soccer.py --bench-cache  sprite loading without / with the disk cache
+    # python soccer.py --bench-toggle fullscreen toggle: rescaling vs. cached resolutions
+    # python soccer.py --bench-atlas  scene sprite blits: separate surfaces vs. atlas views
+    # python soccer.py --bench-physics same shots at 30/60/144 Hz and irregular frame times
+    # python soccer.py --bench-collision swept vs. discrete goal test at rising shot speeds
+    
+    if "--bench" in sys.argv:
+        benchmark()
+        sys.exit()
+    if "--bench-bg" in sys.argv:
+        benchmark_background()
+        sys.exit()
+    if "--bench-cache" in sys.argv:
+        benchmark_cache()
+        sys.exit()
+    if "--bench-toggle" in sys.argv:
+        benchmark_toggle()
+        sys.exit()
+    if "--bench-atlas" in sys.argv:
+        benchmark_atlas()
+        sys.exit()
+    if "--bench-physics" in sys.argv:
+        benchmark_physics()
+        sys.exit()
+    if "--bench-collision" in sys.argv:
+        benchmark_collision()
+        sys.exit()
+    
     # Get player roles from command line arguments if provided
     goalkeeper = sys.argv[1] if len(sys.argv) > 1 else "p1"
     attacker = sys.argv[2] if len(sys.argv) > 2 else "p2"
@@ -0,0 +1,105 @@
+import numpy as np
+import pygame
+
+# ------------------------------------------------
+# SPRITE ATLASI
+# ------------------------------------------------
+# Penaltı sahnesinin bir çözünürlükteki tüm sprite'ları tek tek yüzeyler yerine birkaç
+# büyük "sayfa" yüzeyine yerleştirilir; her sprite, sayfanın kendi dikdörtgenine bakan bir
+# subsurface (kopya değil, görünüm) olarak kullanılır. Böylece bir çözünürlük için bellekte
+# 10 ayrı yüzey yerine iki sayfa tutulur ve bir karedeki blit'ler aynı bellek bloğundan okur.
+#
+# Arka plan gibi opak çizilecek sprite'lar (`opaque`) ayrı, alfa kanalı olmayan bir sayfaya
+# konur: ekran genişliğindeki tribün / çim saydam sayfada olsaydı her karede piksel piksel
+# alfa karıştırmasıyla çizilirdi. Geri kalan her şey tek bir saydam sayfadadır.
+#
+# Yerleşim "raf" (shelf) yöntemiyle yapılır: sprite'lar yüksekliğe göre azalan sırada
+# soldan sağa dizilir, satır dolunca en yüksek sprite'ın altında yeni bir raf açılır.
+
+
+def pack_shelves(sizes, width):
+    """(genişlik, yükseklik) listesini `width` genişliğindeki raflara yerleştirir.
+
+    Girdi sırasıyla konumları (x, y) ve toplam yüksekliği döndürür.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    positions = [None] * len(sizes)
+    x = y = shelf_height = 0
+    for i in order:
+        w, h = sizes[i]
+        if w > width:
+            raise ValueError(f"{w} piksel genişliğindeki sprite {width} piksellik sayfaya sığmaz")
+        if x + w > width:
+            y += shelf_height
+            x = shelf_height = 0
+        positions[i] = (x, y)
+        x += w
+        shelf_height = max(shelf_height, h)
+    return positions, y + shelf_height
+
+
+class SpriteAtlas:
+    """{isim: yüzey} sözlüğünü sayfalara yerleştirir; atlas[isim] sprite'ın görünümüdür.
+
+    `opaque` içindeki isimler alfa kanalı atılarak opak sayfaya konur.
+    """
+
+    def __init__(self, sprites, opaque=()):
+        self.pages = []
+        self.rects = {}     # isim -> (sayfa no, pygame.Rect)
+        self.views = {}
+        for alpha in (True, False):
+            names = [name for name in sprites if (name not in opaque) == alpha]
+            if names:
+                self._add_page([sprites[name] for name in names], names, alpha)
+
+    def _add_page(self, surfaces, names, alpha):
+        sizes = [surface.get_size() for surface in surfaces]
+        area = sum(w * h for w, h in sizes)
+        # Kabaca kare bir sayfa; en geniş sprite her durumda sığmalı
+        width = max(max(w for w, _ in sizes), int(area ** 0.5))
+        positions, height = pack_shelves(sizes, width)
+        if alpha:
+            page = pygame.Surface((width, max(height, 1)), pygame.SRCALPHA).convert_alpha()
+            page.fill((0, 0, 0, 0))
+        else:
+            page = pygame.Surface((width, max(height, 1))).convert()
+        index = len(self.pages)
+        self.pages.append(page)
+        for name, surface, (x, y) in zip(names, surfaces, positions):
+            w, h = surface.get_size()
+            if surface.get_colorkey() is not None:
+                # Renk anahtarını (ör. beyaz arka planlı yedek kale / top) blit MAX yok sayar:
+                # önce anahtarlı pikselleri saydam alfaya çevir
+                surface = surface.convert_alpha()
+            if alpha:
+                # Normal blit saydam sayfaya karıştırarak yazar (yarı saydam kenarların rengi
+                # koyulaşır); boş (0, 0, 0, 0) sayfada kanal bazında MAX ise birebir kopyadır
+                page.blit(surface, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            else:
+                page.blit(surface, (x, y))
+            rect = pygame.Rect(x, y, w, h)
+            self.rects[name] = (index, rect)
+            self.views[name] = page.subsurface(rect)
+
+    def __getitem__(self, name):
+        return self.views[name]
+
+    def __contains__(self, name):
+        return name in self.views
+
+    def memory_bytes(self):
+        """Sayfaların piksel belleği (bayt)."""
+        return sum(page.get_width() * page.get_height() * page.get_bytesize() for page in self.pages)
+
+    def same_pixels(self, sprites):
+        """Her görünüm, yerleştirildiği sprite ile piksel piksel aynı mı (doğrulama için)."""
+        for name, surface in sprites.items():
+            view = self.views[name]
+            if not np.array_equal(pygame.surfarray.array3d(view), pygame.surfarray.array3d(surface)):
+                return False
+            both_alpha = view.get_flags() & surface.get_flags() & pygame.SRCALPHA
+            if both_alpha and not np.array_equal(pygame.surfarray.array_alpha(view),
+                                                 pygame.surfarray.array_alpha(surface)):
+                return False
+        return True
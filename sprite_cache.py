@@ -0,0 +1,169 @@
+import hashlib
+import os
+
+import pygame
+
+# ------------------------------------------------
+# İŞLENMİŞ SPRITE ÖNBELLEĞİ (DİSK)
+# ------------------------------------------------
+# Penaltı sahnesinin görselleri her açılışta çözülüyor (PNG/JPG), arka planı siliniyor
+# ve iki kez ölçekleniyor. Bu önbellek her adımın son halini ham piksel olarak
+# (pygame.image.tobytes) saklar; sıcak açılışta dosya okunup frombuffer ile doğrudan
+# yüzeye çevrilir, çözme / arka plan silme / ölçekleme yapılmaz.
+#
+# Anahtar = özet(kaynak, işlem parametreleri); kaynak ya görsel dosyasının içerik özeti
+# ya da önbellekteki başka bir sprite'ın anahtarıdır (ör. ekrana ölçeklenmiş kaleci,
+# arka planı silinmiş kalecinin anahtarından türetilir). Görsel dosyası veya
+# parametreler değişince anahtar da değişir; aynı isim ve boyuttaki eski dosya yenisi
+# yazılınca silinir. Farklı işlem türleri (ör. "smooth" / "fast" ölçekleme) ayrı isim
+# kullanır, böylece birbirini silmez.
+#
+# Dizin MAX_BYTES ile sınırlıdır: aşılınca en uzun süredir kullanılmayan dosyalar
+# (değişiklik zamanı, her okumada güncellenir) silinir. Böylece bir kez görülmüş
+# çözünürlüklerin sprite'ları diskte sonsuza kadar birikmez.
+#
+# Dosya adı: <isim>-<genişlik>x<yükseklik>-<anahtar>.rgba | .rgb
+
+VERSION = 1
+MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "sprite_cache")
+
+_hashes = {}    # yol -> ((mtime, boyut), özet); aynı süreçte dosyayı tekrar okumamak için
+
+
+def file_hash(path):
+    """Dosya içeriğinin özeti (değişmediyse süreç içinde yeniden okunmaz)."""
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _hashes.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    _hashes[path] = (stamp, digest.hexdigest())
+    return _hashes[path][1]
+
+
+def clear_hash_memo():
+    """Dosya özetlerini unutur (ör. ölçümlerde yeni açılmış bir süreci taklit etmek için)."""
+    _hashes.clear()
+
+
+class SpriteCache:
+    """Sprite'ları (isim, boyut, anahtar) ile diskte ham RGBA / RGB olarak saklar."""
+
+    def __init__(self, directory=DEFAULT_DIR, enabled=True, max_bytes=MAX_BYTES):
+        self.directory = directory
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(source, params=()):
+        """Kaynak (dosya özeti ya da başka bir anahtar) ve işlem parametrelerinden anahtar."""
+        return hashlib.blake2b(repr((VERSION, source, params)).encode(), digest_size=12).hexdigest()
+
+    def source_key(self, path, params=()):
+        """Görsel dosyasından üretilen sprite'ın anahtarı; dosya yoksa None."""
+        try:
+            return self.key(file_hash(path), params)
+        except OSError:
+            return None
+
+    def _path(self, name, size, key, mode):
+        return os.path.join(self.directory, f"{name}-{size[0]}x{size[1]}-{key}.{mode.lower()}")
+
+    def load(self, name, size, key):
+        """Önbellekteki sprite'ı ekran biçimine çevrilmiş olarak döndürür; yoksa None."""
+        for mode in ("RGBA", "RGB"):
+            path = self._path(name, size, key, mode)
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+            except OSError:
+                continue
+            if len(data) != size[0] * size[1] * len(mode):
+                return None     # yarım yazılmış / bozuk dosya: yeniden üretilir
+            try:
+                os.utime(path)  # son kullanım: sınır aşılınca en eski kullanılan silinir
+            except OSError:
+                pass
+            surface = pygame.image.frombuffer(data, size, mode)
+            return surface.convert_alpha() if mode == "RGBA" else surface.convert()
+        return None
+
+    def store(self, name, key, surface):
+        if surface.get_colorkey() is not None:
+            # Ham RGB baytları renk anahtarını taşımaz; anahtar alfa kanalına çevrilip saklanır
+            surface = surface.convert_alpha()
+        mode = "RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGB"
+        size = surface.get_size()
+        path = self._path(name, size, key, mode)
+        tmp_path = path + ".tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(pygame.image.tobytes(surface, mode))
+            os.replace(tmp_path, path)
+            # Aynı sprite'ın aynı boyuttaki eski (kaynağı değişmiş) sürümleri
+            prefix = f"{name}-{size[0]}x{size[1]}-"
+            current = os.path.basename(path)
+            for entry in os.listdir(self.directory):
+                if entry.startswith(prefix) and entry != current:
+                    os.remove(os.path.join(self.directory, entry))
+            self.prune(keep=current)
+        except OSError as e:
+            print(f"⚠️ Sprite önbelleğe yazılamadı ({name}): {e}")
+
+    def prune(self, keep=None):
+        """Dizin max_bytes'ı aşıyorsa en uzun süredir kullanılmayan dosyaları siler."""
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith((".rgba", ".rgb")):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path, entry.name))
+                total += stat.st_size
+        removed = 0
+        for _, size, path, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            os.remove(path)
+            total -= size
+            removed += 1
+        return removed
+
+    def get(self, name, key, size, build):
+        """Sprite önbellekte varsa onu, yoksa build() sonucunu (kaydederek) döndürür.
+
+        key None ise (ör. dosyası olmayan, kodla çizilen yedek sprite) önbellek kullanılmaz.
+        """
+        size = (int(size[0]), int(size[1]))
+        if self.enabled and key is not None:
+            surface = self.load(name, size, key)
+            if surface is not None:
+                self.hits += 1
+                return surface
+        surface = build()
+        self.misses += 1
+        if self.enabled and key is not None and surface is not None:
+            self.store(name, key, surface)
+        return surface
+
+    def clear(self):
+        """Önbellek dizinindeki tüm sprite dosyalarını siler."""
+        try:
+            entries = os.listdir(self.directory)
+        except FileNotFoundError:
+            return 0
+        removed = 0
+        for entry in entries:
+            if entry.endswith((".rgba", ".rgb", ".tmp")):
+                os.remove(os.path.join(self.directory, entry))
+                removed += 1
+        return removed
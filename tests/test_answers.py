@@ -0,0 +1,34 @@
+from fractions import Fraction
+
+import pytest
+
+from answers import answers_equal, canonical_answer
+
+
+@pytest.mark.parametrize("raw", ["0.5", "1/2", ",5", "%50", "0,5", "50%"])
+def test_one_half_spellings(raw):
+    assert canonical_answer(raw) == Fraction(1, 2)
+
+
+def test_mixed_number():
+    assert canonical_answer("-1 1/2") == Fraction(-3, 2)
+    assert canonical_answer("2 1/4") == Fraction(9, 4)
+
+
+def test_comma_is_decimal_separator():
+    # Türkçe yazımda virgül ondalık ayracıdır: "1,000" bin değil, birdir
+    assert canonical_answer("1,000") == 1
+    assert not answers_equal("1,000", "1000")
+
+
+def test_power_equivalence():
+    assert answers_equal("2^4", "16")
+    assert answers_equal("2^4", "4^2")
+    assert answers_equal("2⁴", "16")
+    assert not answers_equal("2^4", "2^5")
+
+
+def test_non_numeric_answers_compare_as_text():
+    assert canonical_answer("x^3") == "x^3"
+    assert answers_equal(" X^3 ", "x^3")
+    assert not answers_equal("x^3", "x^2")
@@ -0,0 +1,38 @@
+import pytest
+
+from answers import answers_equal
+from distractors import OPTION_COUNT, _expression_candidates, _simplify, generate_options
+
+
+@pytest.mark.parametrize("answer", ["2^4", "4^2", "3^3", "2^2", "10^3"])
+def test_power_options_have_one_correct_answer(answer):
+    for seed in range(20):
+        options = generate_options([answer], seed=seed)[0]
+        assert len(options) == OPTION_COUNT
+        assert answer in options
+        assert sum(answers_equal(option, answer) for option in options) == 1
+
+
+def test_numeric_options_have_one_correct_answer():
+    answers = ["12", "0,5", "3/4", "x^2+1"]
+    for options, answer in zip(generate_options(answers, seed=3), answers):
+        assert len(options) == OPTION_COUNT
+        assert sum(answers_equal(option, answer) for option in options) == 1
+
+
+EXPRESSIONS = ["πr^2", "x^2+3x", "x^2/2", "x^3/3+x^2", "20x^3", "sec^2 x", "2x+3x^2",
+               "a*b", "a*b*c", "i", "-i", "e^x", "√2/2", "3+5i", "nx^(n-1)", "1/x", "(a*h)/2"]
+
+
+@pytest.mark.parametrize("answer", EXPRESSIONS)
+def test_expression_options_are_distinct_and_unpadded(answer):
+    options = generate_options([answer], seed=0)[0]
+    assert len({_simplify(option) for option in options}) == OPTION_COUNT
+    assert not any(option.startswith(f"{answer} (") for option in options)
+
+
+def test_exponent_digits_are_not_coefficients():
+    assert "πr^1" not in _expression_candidates("πr^2")
+    assert "x^1+3x" not in _expression_candidates("x^2+3x")
+    assert "3+x^2/x^3" not in _expression_candidates("x^3/3+x^2")
+    assert _simplify("πr^1") == _simplify("πr")
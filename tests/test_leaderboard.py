@@ -0,0 +1,42 @@
+from leaderboard import Leaderboard, Leaderboards
+
+
+def test_keeps_only_top_n():
+    board = Leaderboard(3)
+    for i, score in enumerate([5, 1, 9, 3, 7]):
+        board.push(score, float(i), f"p{i}", "MCQ")
+    assert [e.score for e in board.ranked()] == [9, 7, 5]
+    assert board.min_score() == 5
+    assert not board.push(5, 10.0, "geç", "MCQ")
+
+
+def test_ties_rank_earlier_time_first():
+    board = Leaderboard(5)
+    board.push(10, 200.0, "sonra", "MCQ")
+    board.push(10, 100.0, "önce", "MCQ")
+    board.push(20, 300.0, "lider", "MCQ")
+    assert [e.name for e in board.ranked()] == ["lider", "önce", "sonra"]
+
+
+def test_full_board_drops_newest_of_equal_entries():
+    board = Leaderboard(2)
+    board.push(10, 1.0, "a", "MCQ")
+    board.push(10, 1.0, "b", "MCQ")
+    # Aynı skor ve zaman: eşitlik tabloya girmeye yetmez
+    assert not board.push(10, 1.0, "c", "MCQ")
+    assert [e.name for e in board.ranked()] == ["a", "b"]
+    # Daha eski bir kayıt, aynı skordaki en yeni kaydın yerini alır
+    assert board.push(10, 0.0, "d", "MCQ")
+    assert [e.name for e in board.ranked()] == ["d", "a"]
+
+
+def test_submit_save_load(tmp_path):
+    path = str(tmp_path / "leaderboard.json")
+    boards = Leaderboards(path, ["kolay", "zor"], size=2)
+    assert boards.submit("kolay", 50, "  Ayşe  ", "MCQ", when=1) == 1
+    assert boards.submit("kolay", 70, "Mehmet", "MCQ", when=2) == 1
+    assert boards.submit("kolay", 10, "Can", "MCQ", when=3) is None
+
+    loaded = Leaderboards.load(path, ["kolay", "zor"], size=2)
+    assert [(e.score, e.name) for e in loaded.board("kolay").ranked()] == [(70, "Mehmet"), (50, "Ayşe")]
+    assert loaded.best_scores() == {"kolay": 70, "zor": 0}
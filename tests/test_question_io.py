@@ -0,0 +1,67 @@
+import csv
+import json
+
+from question_io import export_bank, import_file, process_batch
+
+
+def _rows(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_csv_json_csv_round_trip_with_duplicates(tmp_path):
+    source = tmp_path / "sorular.csv"
+    with open(source, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(("Seviye", "Soru", "Cevap", "kategori"))
+        writer.writerow(("easy", "2 + 2 = ?", "4", "toplama"))
+        writer.writerow(("orta", "3 x 4 = ?", "12", ""))
+        writer.writerow(("kolay", "2  +  2 = ?", "4", ""))      # boşluk farkıyla tekrar
+        writer.writerow(("zor", "Çarpanlar, virgül = ?", "0,5", ""))
+        writer.writerow(("orta", "3 x 4 = ?", "12", ""))        # birebir tekrar
+        writer.writerow(("bilinmiyor", "1 + 1 = ?", "2", ""))
+
+    bank = tmp_path / "questions.json"
+    stats = import_file(str(source), bank_path=str(bank), workers=1, show_errors=0)
+    assert stats["rows"] == 6
+    assert stats["added"] == 3
+    assert stats["duplicates"] == 2
+    assert stats["errors"] == 1
+
+    data = json.loads(bank.read_text(encoding="utf-8"))
+    assert [q["q"] for q in data["kolay"]] == ["2 + 2 = ?"]
+    assert data["kolay"][0]["kategori"] == "toplama"
+    assert [q["q"] for q in data["orta"]] == ["3 x 4 = ?"]
+    assert [q["a"] for q in data["zor"]] == ["0,5"]
+
+    exported = tmp_path / "cikti.csv"
+    assert export_bank(str(exported), bank_path=str(bank)) == 3
+
+    # Dışa aktarılan dosya aynı bankaya geri aktarılınca her satır tekrar sayılır
+    again = import_file(str(exported), bank_path=str(bank), workers=1, show_errors=0)
+    assert again["added"] == 0
+    assert again["duplicates"] == 3
+    assert json.loads(bank.read_text(encoding="utf-8")) == data
+
+    # Boş bir bankaya geri aktarım aynı CSV'yi üretir
+    copy = tmp_path / "kopya.json"
+    import_file(str(exported), bank_path=str(copy), workers=1, show_errors=0)
+    exported_again = tmp_path / "cikti2.csv"
+    export_bank(str(exported_again), bank_path=str(copy))
+    assert _rows(exported_again) == _rows(exported)
+
+
+def test_jsonl_row_with_bad_extra_fails_only_that_row():
+    rows = ['{"level": 1, "q": "1+1 = ?", "a": 2, "extra": "x", "src": "y"}',
+            '{"level": 1, "q": "2+2 = ?", "a": 4, "extra": [1], "src": "y"}',
+            '{"level": 1, "q": "3+3 = ?", "a": 6, "extra": "{\\"ipucu\\": \\"çift\\"}", "src": "y"}']
+    valid, errors = process_batch("jsonl", None, rows, 1, None)
+    assert [line for line, _ in errors] == [1, 2]
+    assert [(line, q) for line, _, q, _ in valid] == [
+        (3, {"q": "3+3 = ?", "a": "6", "type": "classic", "src": "y", "ipucu": "çift"})]
+
+
+def test_jsonl_zero_answer_is_not_empty():
+    valid, errors = process_batch("jsonl", None, ['{"level": 1, "q": "1-1 = ?", "a": 0}'], 1, None)
+    assert errors == []
+    assert valid[0][2]["a"] == "0"
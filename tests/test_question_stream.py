@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from question_stream import StreamingQuestionBank, scan_offsets
+
+BANK = {
+    "kolay": [{"q": "2 + 2 = ?", "a": "4"}, {"q": "Köşeli [parantez] ve {süslü} = ?", "a": "1"}],
+    "orta": [],
+    "zor": [{"q": "Kaçış \\\" ve \\\\ = ?", "a": "x^2", "extra": {"iç": [1, {"a": 2}]}},
+            {"q": "ç ğ ı ö ş ü = ?", "a": "%50"}],
+}
+
+
+@pytest.fixture
+def bank_path(tmp_path):
+    path = tmp_path / "questions.json"
+    path.write_text(json.dumps(BANK, ensure_ascii=False, indent=4), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_offsets_match_json_load(bank_path, chunk_size):
+    offsets = scan_offsets(bank_path, chunk_size=chunk_size)
+    assert list(offsets) == list(BANK)
+    raw = open(bank_path, "rb").read()
+    for level, (starts, ends) in offsets.items():
+        assert [json.loads(raw[s:e]) for s, e in zip(starts, ends)] == BANK[level]
+
+
+def test_stream_levels_and_index_reuse(bank_path):
+    bank = StreamingQuestionBank(bank_path)
+    try:
+        for level, questions in BANK.items():
+            assert list(bank.level(level)) == questions
+        assert bank.level("zor")[-1] == BANK["zor"][-1]
+        assert bank.level("yok") == []
+    finally:
+        bank.close()
+
+    reopened = StreamingQuestionBank(bank_path)
+    try:
+        assert reopened._load_index() is not None
+        assert list(reopened.level("zor")) == BANK["zor"]
+    finally:
+        reopened.close()
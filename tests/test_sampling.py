@@ -0,0 +1,24 @@
+from sampling import LazyPermutation, WeightedSampler, make_rng, sample_indices
+
+
+def test_weights_may_be_a_generator():
+    sampler = WeightedSampler(w for w in [1, 2, 3])
+    assert sampler.positive == 3
+    assert sorted(sampler.sample(3, make_rng(1))) == [0, 1, 2]
+
+
+def test_zero_and_negative_weights_are_never_picked():
+    sampler = WeightedSampler([0, -2, 5, 0, 1])
+    for seed in range(20):
+        assert sorted(sampler.sample(5, make_rng(seed))) == [2, 4]
+
+
+def test_lazy_permutation_is_a_permutation():
+    order = LazyPermutation(50, make_rng(7))
+    assert sorted(order[i] for i in range(50)) == list(range(50))
+
+
+def test_sample_indices_are_distinct():
+    picked = sample_indices(1000, 10, make_rng(3))
+    assert len(set(picked)) == 10
+    assert all(0 <= i < 1000 for i in picked)
@@ -0,0 +1,56 @@
+import os
+import time
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+pygame = pytest.importorskip("pygame")
+
+from sprite_cache import SpriteCache
+
+
+@pytest.fixture(autouse=True)
+def display():
+    pygame.init()
+    pygame.display.set_mode((64, 64))
+    yield
+    pygame.quit()
+
+
+def _surface(color, size=(16, 16)):
+    surface = pygame.Surface(size).convert()
+    surface.fill(color)
+    return surface
+
+
+def _files(directory):
+    return sorted(os.listdir(directory))
+
+
+def test_variants_of_one_sprite_coexist(tmp_path):
+    cache = SpriteCache(str(tmp_path))
+    cache.get("keeper.smooth", "k1", (16, 16), lambda: _surface((255, 0, 0)))
+    cache.get("keeper.fast", "k2", (16, 16), lambda: _surface((0, 255, 0)))
+    cache.get("keeper.smooth", "k1", (32, 32), lambda: _surface((255, 0, 0), (32, 32)))
+    assert len(_files(tmp_path)) == 3
+    assert cache.get("keeper.fast", "k2", (16, 16), lambda: None).get_at((0, 0))[:3] == (0, 255, 0)
+    assert cache.hits == 1
+
+
+def test_changed_source_replaces_old_file(tmp_path):
+    cache = SpriteCache(str(tmp_path))
+    cache.get("grass", "old", (16, 16), lambda: _surface((0, 128, 0)))
+    cache.get("grass", "new", (16, 16), lambda: _surface((0, 160, 0)))
+    assert _files(tmp_path) == ["grass-16x16-new.rgb"]
+
+
+def test_directory_is_bounded_least_recently_used_first(tmp_path):
+    cache = SpriteCache(str(tmp_path), max_bytes=2 * 16 * 16 * 3)
+    cache.get("a", "k", (16, 16), lambda: _surface((1, 1, 1)))
+    time.sleep(0.01)
+    cache.get("b", "k", (16, 16), lambda: _surface((2, 2, 2)))
+    time.sleep(0.01)
+    cache.get("a", "k", (16, 16), lambda: None)      # "a" kullanıldı; en eski artık "b"
+    time.sleep(0.01)
+    cache.get("c", "k", (16, 16), lambda: _surface((3, 3, 3)))
+    assert _files(tmp_path) == ["a-16x16-k.rgb", "c-16x16-k.rgb"]
@@ -0,0 +1,20 @@
+import pytest
+
+from validator import ERROR, OK, check_batch, check_question
+
+
+def test_oversized_power_is_rejected_not_computed():
+    status, _, message = check_question("((10^64)^64)^64 = ?", "1")
+    assert status == ERROR
+    assert message == "sonuç çok büyük"
+
+
+@pytest.mark.parametrize("question", ["i mod 2 = ?", "2 mod i = ?", "ln(i) = ?"])
+def test_complex_operands_fail_one_question(question):
+    status, _, _ = check_question(question, "1")
+    assert status == ERROR
+
+
+def test_bad_question_does_not_stop_batch():
+    results = check_batch([("i mod 2 = ?", "1"), ("7 mod 3 = ?", "1")])
+    assert [status for status, _, _ in results] == [ERROR, OK]
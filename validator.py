@@ -0,0 +1,476 @@
+import argparse
+import ast
+import cmath
+import hashlib
+import json
+import math
+import os
+import re
+import statistics
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+
+from answers import canonical_answer, expand_superscripts
+
+# ------------------------------------------------
+# CEVAP ANAHTARI DOĞRULAYICI
+# ------------------------------------------------
+# Hesapla kontrol edilebilen sorular (aritmetik, denklemler, yüzde, faktöriyel,
+# logaritma, trigonometri, P/C, istatistik, karmaşık sayılar, limitler) önce
+# Python ifadesine çevrilir, ast ile ayrıştırılır ve yalnızca izin verilen düğüm
+# ve fonksiyonlarla değerlendirilir (eval kullanılmaz). Sonuç, kayıtlı cevapla
+# oyundaki check_answer ile aynı kanonik biçimde (answers.canonical_answer)
+# karşılaştırılır. Türev, integral, formül ve sözel olasılık soruları atlanır.
+#
+# Sonuçlar soru+cevap metninin özetiyle önbelleğe yazılır; sonraki çalıştırmalarda
+# yalnızca yeni veya değişmiş sorular yeniden hesaplanır.
+#
+# Kullanım: python validator.py [data/questions.json] [--workers N] [--no-cache]
+
+# Kurallar değişince artırılır; eski önbellek kayıtları geçersiz olur
+VERSION = 1
+CACHE_PATH = "data/validation_cache.json"
+
+OK, MISMATCH, ERROR, SKIPPED = "ok", "mismatch", "error", "skipped"
+
+MAX_EXPONENT = 64
+MAX_RESULT_BITS = 4096  # ~1233 basamak; str() sınırının (4300 basamak) altında kalır
+MAX_FACTORIAL = 170
+LIMIT_TOLERANCE = 1e-3
+FLOAT_TOLERANCE = 1e-9
+
+
+class Unsupported(Exception):
+    """Soru otomatik olarak doğrulanabilecek bir biçimde değil."""
+
+
+class EvalError(Exception):
+    """İfade ayrıştırıldı ama değeri hesaplanamadı (sıfıra bölme, tanımsız mod, ...)."""
+
+
+# ---------------- GÜVENLİ DEĞERLENDİRİCİ ----------------
+
+def _exact_sqrt(v):
+    if isinstance(v, Fraction) and v >= 0:
+        n, d = math.isqrt(v.numerator), math.isqrt(v.denominator)
+        if n * n == v.numerator and d * d == v.denominator:
+            return Fraction(n, d)
+    if isinstance(v, complex) or v < 0:
+        return cmath.sqrt(v)
+    return math.sqrt(v)
+
+
+def _integer(v, name):
+    if isinstance(v, Fraction) and v.denominator == 1:
+        return int(v)
+    if isinstance(v, float) and v.is_integer():
+        return int(v)
+    raise EvalError(f"{name} için tam sayı gerekli")
+
+
+def _factorial(v):
+    n = _integer(v, "faktöriyel")
+    if not 0 <= n <= MAX_FACTORIAL:
+        raise EvalError("faktöriyel aralık dışında")
+    return Fraction(math.factorial(n))
+
+
+def _log(base, v):
+    if isinstance(base, Fraction) and isinstance(v, Fraction) and base > 1 and v > 0:
+        # Tam kuvvetse kesin sonuç: log₂(8) = 3, log₁₀(0.1) = -1
+        for sign in (1, -1):
+            power, k = Fraction(1), 0
+            while k <= MAX_EXPONENT:
+                if power == v:
+                    return Fraction(sign * k)
+                power *= base if sign == 1 else 1 / base
+                k += 1
+    if float(v) <= 0 or float(base) <= 0 or float(base) == 1:
+        raise EvalError("logaritma tanımsız")
+    return math.log(float(v)) / math.log(float(base))
+
+
+def _ln(v):
+    if float(v) <= 0:
+        raise EvalError("ln tanımsız")
+    return math.log(float(v))
+
+
+def _mode(*values):
+    counts = Counter(values).most_common()
+    if len(counts) > 1 and counts[0][1] == counts[1][1]:
+        raise EvalError("mod tanımsız: en sık tekrar eden tek bir değer yok")
+    return counts[0][0]
+
+
+def _perm(n, k):
+    n, k = _integer(n, "P"), _integer(k, "P")
+    if not 0 <= k <= n:
+        raise EvalError("P(n,k) için 0 ≤ k ≤ n olmalı")
+    return Fraction(math.perm(n, k))
+
+
+def _comb(n, k):
+    n, k = _integer(n, "C"), _integer(k, "C")
+    if not 0 <= k <= n:
+        raise EvalError("C(n,k) için 0 ≤ k ≤ n olmalı")
+    return Fraction(math.comb(n, k))
+
+
+FUNCTIONS = {
+    "sqrt": _exact_sqrt,
+    "fact": _factorial,
+    "log": _log,
+    "ln": _ln,
+    "sin": lambda v: math.sin(float(v)),
+    "cos": lambda v: math.cos(float(v)),
+    "tan": lambda v: math.tan(float(v)),
+    "rad": lambda v: float(v) * math.pi / 180,
+    "var": lambda *v: statistics.pvariance(v),
+    "mean": lambda *v: statistics.mean(v),
+    "median": lambda *v: statistics.median(v),
+    "mode": _mode,
+    "P": _perm,
+    "C": _comb,
+}
+CONSTANTS = {"i": 1j, "e": math.e, "pi": math.pi}
+
+
+def _bits(v):
+    return max(v.numerator.bit_length(), v.denominator.bit_length()) if isinstance(v, Fraction) else 0
+
+
+def _bounded(v):
+    """Pay ya da paydası MAX_RESULT_BITS'i aşan kesirli sonuçları reddeder."""
+    if _bits(v) > MAX_RESULT_BITS:
+        raise EvalError("sonuç çok büyük")
+    return v
+
+
+def _binop(op, a, b):
+    if isinstance(op, ast.Add):
+        return a + b
+    if isinstance(op, ast.Sub):
+        return a - b
+    if isinstance(op, ast.Mult):
+        return _bounded(a * b)
+    if isinstance(op, ast.Div):
+        if b == 0:
+            raise EvalError("sıfıra bölme")
+        return _bounded(a / b)
+    if isinstance(op, ast.Mod):
+        if isinstance(a, complex) or isinstance(b, complex):
+            raise EvalError("karmaşık sayılarda mod tanımsız")
+        if b == 0:
+            raise EvalError("sıfıra göre mod")
+        return a % b
+    if isinstance(op, ast.Pow):
+        if isinstance(b, Fraction) and b.denominator == 1:
+            if abs(b) > MAX_EXPONENT:
+                raise EvalError("üs çok büyük")
+            b = int(b)
+            if b < 0 and a == 0:
+                raise EvalError("sıfırın negatif kuvveti")
+            # Sonucu hesaplamadan önce boyutunu kestir ((10^64)^64)^64 gibi zincirler için)
+            if _bits(a) * abs(b) > MAX_RESULT_BITS + abs(b):
+                raise EvalError("sonuç çok büyük")
+        return _bounded(a ** b)
+    raise Unsupported(f"desteklenmeyen işlem: {type(op).__name__}")
+
+
+def safe_eval(expr, variables=None):
+    """Çevrilmiş ifadeyi yalnızca izin verilen AST düğümleriyle değerlendirir."""
+    try:
+        tree = ast.parse(expr, mode="eval")
+    except SyntaxError:
+        raise Unsupported(f"ifade ayrıştırılamadı: {expr}")
+    names = {**CONSTANTS, **(variables or {})}
+
+    def walk(node):
+        if isinstance(node, ast.Expression):
+            return walk(node.body)
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return Fraction(repr(node.value)) if isinstance(node.value, float) else Fraction(node.value)
+        if isinstance(node, ast.Name):
+            if node.id not in names:
+                raise Unsupported(f"bilinmeyen sembol: {node.id}")
+            return names[node.id]
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            value = walk(node.operand)
+            return -value if isinstance(node.op, ast.USub) else value
+        if isinstance(node, ast.BinOp):
+            return _binop(node.op, walk(node.left), walk(node.right))
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+            func = FUNCTIONS.get(node.func.id)
+            if func is None:
+                raise Unsupported(f"bilinmeyen fonksiyon: {node.func.id}")
+            try:
+                return func(*[walk(arg) for arg in node.args])
+            except (ValueError, TypeError, OverflowError, statistics.StatisticsError) as e:
+                raise EvalError(f"{node.func.id}: {e}")
+        raise Unsupported(f"desteklenmeyen ifade: {type(node).__name__}")
+
+    try:
+        return walk(tree)
+    except (OverflowError, ZeroDivisionError) as e:
+        raise EvalError(str(e))
+
+
+# ---------------- METİN -> İFADE ----------------
+
+_SUBSCRIPTS = str.maketrans("₀₁₂₃₄₅₆₇₈₉", "0123456789")
+_DESCRIPTOR = re.compile(r"\s*\((?:\d+\s+)?[A-ZÇĞİÖŞÜ][^()]*\)\s*$")
+_SYMBOLIC = ("d/dx", "∫", "f(x)", "formül", "olasılı", "türev")
+_POLYGONS = {"üçgen": 3, "dörtgen": 4, "beşgen": 5, "altıgen": 6, "yedigen": 7, "sekizgen": 8}
+
+_REWRITES = (
+    (re.compile(r"Varyans\("), "var("),
+    (re.compile(r"Ortalama\("), "mean("),
+    (re.compile(r"Medyan\("), "median("),
+    (re.compile(r"Mod\("), "mode("),
+    (re.compile(r"log([₀-₉]+)\("), lambda m: f"log({m.group(1).translate(_SUBSCRIPTS)}, "),
+    (re.compile(r"\bmod\b"), "%"),
+    (re.compile(r"(\d+)!"), r"fact(\1)"),
+    (re.compile(r"(\d+(?:\.\d+)?)°"), r"rad(\1)"),
+    (re.compile(r"π"), "pi"),
+    (re.compile(r"√(\d+(?:\.\d+)?|[a-z]\w*|\([^()]*\))"), r"sqrt(\1)"),
+    (re.compile(r"(?<=[\d)])\s+x\s+(?=[\d(])"), " * "),
+    (re.compile(r"[×·]"), "*"),
+    (re.compile(r"÷"), "/"),
+    (re.compile(r"\b(sin|cos|tan|ln)\s+([a-z0-9.]+)"), r"\1(\2)"),
+    (re.compile(r"(\d)\s*(?=[a-zπ(√])"), r"\1*"),
+    (re.compile(r"\)\s*(?=[\w(])"), ")*"),
+    (re.compile(r"\b([xie])\s*(?=\()"), r"\1*"),
+    (re.compile(r"\^"), "**"),
+)
+
+
+def to_expression(text):
+    """Matematik gösterimini Python ifadesine çevirir: "2x² + √9" -> "2*x**2 + sqrt(9)"."""
+    expr = expand_superscripts(text.strip())
+    for pattern, replacement in _REWRITES:
+        expr = pattern.sub(replacement, expr)
+    return expr
+
+
+def _strip_prompt(text):
+    text = re.sub(r"\s*=\s*\?\s*$|\s*\?\s*$", "", text.strip())
+    return _DESCRIPTOR.sub("", text).strip()
+
+
+def _solve_linear(equation):
+    """"lhs = rhs" (veya "a:b = c:d" orantısı) denkleminde x'i çözer."""
+    lhs, sep, rhs = equation.partition("=")
+    if not sep:
+        raise Unsupported("denklemde '=' yok")
+    if ":" in lhs and ":" in rhs:
+        a, b = lhs.split(":", 1)
+        c, d = rhs.split(":", 1)
+        expr = f"({to_expression(a)})*({to_expression(d)}) - ({to_expression(b)})*({to_expression(c)})"
+    else:
+        expr = f"({to_expression(lhs)}) - ({to_expression(rhs)})"
+    f0, f1, f2 = (safe_eval(expr, {"x": Fraction(v)}) for v in (0, 1, 2))
+    if f2 - f1 != f1 - f0:
+        raise Unsupported("denklem x'e göre doğrusal değil")
+    if f1 == f0:
+        raise EvalError("denklemin tek bir çözümü yok")
+    return -f0 / (f1 - f0)
+
+
+def _limit(point, body):
+    expr = to_expression(body)
+    if point in ("∞", "+∞"):
+        near, far = (safe_eval(expr, {"x": float(x)}) for x in (1e6, 1e8))
+        if abs(near - far) > LIMIT_TOLERANCE * (1 + abs(far)):
+            raise EvalError("limit yakınsamıyor")
+        return far
+    a = float(canonical_answer(point)) if isinstance(canonical_answer(point), Fraction) else None
+    if a is None:
+        raise Unsupported(f"limit noktası anlaşılamadı: {point}")
+    left, right = (safe_eval(expr, {"x": a + h}) for h in (-1e-6, 1e-6))
+    if abs(left - right) > LIMIT_TOLERANCE * (1 + abs(right)):
+        raise EvalError("sağ ve sol limit farklı")
+    return (left + right) / 2
+
+
+def compute_question(text):
+    """Sorunun doğru cevabını hesaplar; doğrulanamayan biçimlerde Unsupported fırlatır."""
+    text = text.strip()
+    lowered = text.lower()
+    if any(marker in lowered for marker in _SYMBOLIC):
+        raise Unsupported("sembolik soru")
+
+    m = re.match(r"^lim\s*x\s*→\s*(\S+)\s+(.+)$", text)
+    if m:
+        return _limit(m.group(1), m.group(2)), True
+
+    m = re.match(r"^(.+?)\s+ise\s+x\s+kaçtır\??$", text)
+    if m:
+        return _solve_linear(m.group(1)), False
+
+    m = re.match(r"^(\d+(?:[.,]\d+)?)'\w+\s+%(\d+(?:[.,]\d+)?)'\w+\s+kaçtır", text)
+    if m:
+        whole, percent = (canonical_answer(g) for g in m.groups())
+        return whole * percent / 100, False
+
+    m = re.search(r"karenin alanı (\d+(?:[.,]\d+)?) ise bir kenarı", text)
+    if m:
+        return _exact_sqrt(canonical_answer(m.group(1))), False
+
+    m = re.search(r"(\w+) iç açılarının toplamı", text)
+    if m:
+        name = m.group(1).lower()
+        sides = next((n for poly, n in _POLYGONS.items() if poly in name), None)
+        if sides is None:
+            raise Unsupported(f"bilinmeyen çokgen: {name}")
+        return Fraction((sides - 2) * 180), False
+
+    m = re.search(r"\b([PC]\(\s*\d+\s*,\s*\d+\s*\))", text)
+    if m:
+        return safe_eval(to_expression(m.group(1))), False
+
+    expr = _strip_prompt(text)
+    if not expr or re.search(r"[a-zçğıöşü]{3,}", expr.replace("mod", "")) and "(" not in expr:
+        raise Unsupported("sözel soru")
+    return safe_eval(to_expression(expr)), False
+
+
+def expected_value(answer):
+    """Kayıtlı cevabın sayısal değeri (check_answer ile aynı kanonik biçim, gerekirse ifade olarak)."""
+    value = canonical_answer(str(answer))
+    if isinstance(value, Fraction):
+        return value
+    return safe_eval(to_expression(str(answer)))
+
+
+def _close(computed, expected, tolerance):
+    if isinstance(computed, Fraction) and isinstance(expected, Fraction):
+        return computed == expected
+    return abs(complex(computed) - complex(expected)) <= tolerance * (1 + abs(complex(expected)))
+
+
+def _format(value):
+    if isinstance(value, Fraction):
+        return str(value)
+    if isinstance(value, complex):
+        real, imag = value.real + 0.0, value.imag + 0.0  # -0.0 -> 0.0
+        if abs(imag) < FLOAT_TOLERANCE:
+            return f"{real:.6g}"
+        unit = {1.0: "i", -1.0: "-i"}.get(round(imag, 9), f"{imag:.6g}i")
+        if abs(real) < FLOAT_TOLERANCE:
+            return unit
+        return f"{real:.6g}{'' if unit.startswith('-') else '+'}{unit}"
+    return f"{value:.6g}"
+
+
+def check_question(q, a):
+    """(durum, hesaplanan değer metni, açıklama) döndürür."""
+    try:
+        return _check_question(q, a)
+    except (ValueError, OverflowError) as e:
+        # Ör. biçimlendirilemeyecek kadar büyük bir sayı: yalnızca bu soru hatalı sayılır
+        return ERROR, "", f"sonuç biçimlendirilemedi: {e}"
+    except TypeError as e:
+        # Ör. karmaşık sayıyla sin / ln / median: tek soru tüm doğrulamayı durdurmamalı
+        return ERROR, "", f"desteklenmeyen değer türü: {e}"
+
+
+def _check_question(q, a):
+    try:
+        computed, approximate = compute_question(str(q))
+    except Unsupported as e:
+        return SKIPPED, "", str(e)
+    except EvalError as e:
+        return ERROR, "", str(e)
+    try:
+        expected = expected_value(a)
+    except Unsupported:
+        return SKIPPED, _format(computed), "cevap sayısal değil"
+    except EvalError as e:
+        return ERROR, _format(computed), f"cevap hesaplanamadı: {e}"
+    tolerance = LIMIT_TOLERANCE if approximate else FLOAT_TOLERANCE
+    if _close(computed, expected, tolerance):
+        return OK, _format(computed), ""
+    return MISMATCH, _format(computed), f"hesaplanan {_format(computed)}, kayıtlı {a}"
+
+
+def check_batch(pairs):
+    """İşçi süreçte çalışır: [(soru, cevap), ...] -> [(durum, değer, açıklama), ...]."""
+    return [check_question(q, a) for q, a in pairs]
+
+
+# ---------------- ÖNBELLEK VE ÇALIŞTIRICI ----------------
+
+def content_hash(q, a):
+    return hashlib.sha256(f"{VERSION}\0{q}\0{a}".encode("utf-8")).hexdigest()
+
+
+def load_cache(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(path, cache):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def validate_bank(data, workers=None, cache_path=CACHE_PATH, chunk_size=256):
+    """Bankadaki tüm soruları doğrular; [(seviye, sıra, soru, cevap, durum, değer, açıklama)] ve
+    yeniden hesaplanan soru sayısını döndürür."""
+    items = [(level, i, str(q["q"]), str(q["a"])) for level, qs in data.items() for i, q in enumerate(qs)]
+    cache = load_cache(cache_path) if cache_path else {}
+    keys = [content_hash(q, a) for _, _, q, a in items]
+
+    todo = sorted({k: (q, a) for k, (_, _, q, a) in zip(keys, items) if k not in cache}.items())
+    if todo:
+        pairs = [pair for _, pair in todo]
+        chunks = [pairs[i:i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+        if (workers or os.cpu_count() or 1) > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = [r for chunk in pool.map(check_batch, chunks) for r in chunk]
+        else:
+            results = [r for chunk in map(check_batch, chunks) for r in chunk]
+        for (key, _), result in zip(todo, results):
+            cache[key] = list(result)
+
+    if cache_path:
+        # Artık bankada olmayan soruların kayıtları atılır
+        save_cache(cache_path, {k: cache[k] for k in set(keys)})
+    report = [(level, i, q, a, *cache[k]) for (level, i, q, a), k in zip(items, keys)]
+    return report, len(todo)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Soru bankasındaki cevap anahtarlarını hesaplayarak doğrular")
+    parser.add_argument("bank", nargs="?", default="data/questions.json")
+    parser.add_argument("--workers", type=int, default=None, help="İşçi süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--no-cache", action="store_true", help="Önbelleği kullanma, her soruyu yeniden hesapla")
+    parser.add_argument("--verbose", action="store_true", help="Atlanan soruları da listele")
+    args = parser.parse_args(argv)
+
+    with open(args.bank, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    started = time.perf_counter()
+    report, computed = validate_bank(data, args.workers, None if args.no_cache else CACHE_PATH)
+    elapsed = time.perf_counter() - started
+
+    counts = Counter(row[4] for row in report)
+    for level, i, q, a, status, value, message in report:
+        if status in (MISMATCH, ERROR) or (args.verbose and status == SKIPPED):
+            print(f"[{status.upper()}] {level} #{i + 1}: {q}  ->  {message}")
+    print(f"{len(report)} soru: {counts[OK]} doğru, {counts[MISMATCH]} hatalı cevap, {counts[ERROR]} hesaplanamadı, "
+          f"{counts[SKIPPED]} atlandı | {computed} soru yeniden hesaplandı, {elapsed:.2f} s")
+    return 1 if counts[MISMATCH] or counts[ERROR] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())